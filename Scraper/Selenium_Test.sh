@@ -40,7 +40,7 @@ source "$VENV_DIR/bin/activate"
 
 # Install required packages based on test type
 if [ "$1" = "0" ]; then
-    pip install selenium webdriver-manager colorama
+    pip install selenium webdriver-manager colorama requests selectolax
 elif [ "$1" = "1" ]; then
     pip install requests
 else
@@ -57,16 +57,30 @@ touch "$PROJECT_ROOT/Scraper/pages/tests/__init__.py"
 touch "$PROJECT_ROOT/Scraper/pages/tests/jemix/__init__.py"
 touch "$PROJECT_ROOT/Scraper/pages/tests/potter_api/__init__.py"
 
-# Run tests based on parameter
 cd "$PROJECT_ROOT"
+
+# Borrow warm browsers from a browser daemon when JEMIX_BROWSER_DAEMON is set
+# (e.g. 127.0.0.1:9600), starting one in the background if none is running
+if [ "$1" = "0" ] && [ -n "$JEMIX_BROWSER_DAEMON" ]; then
+    if ! python3 -m Scraper.pages.base.BrowserDaemon status > /dev/null 2>&1; then
+        echo "Starting browser daemon on $JEMIX_BROWSER_DAEMON..."
+        nohup python3 -m Scraper.pages.base.BrowserDaemon serve > "${TMPDIR:-/tmp}/jemix_browser_daemon.log" 2>&1 &
+        for _ in $(seq 1 50); do
+            python3 -m Scraper.pages.base.BrowserDaemon status > /dev/null 2>&1 && break
+            sleep 0.1
+        done
+    fi
+fi
+
+# Run tests based on parameter
 echo "Running tests..."
 
 if [ "$1" = "0" ]; then
     # Run Selenium tests
-    python3 "$SELENIUM_TEST_DIR/execute_tests.py"
+    python3 "$SELENIUM_TEST_DIR/execute_tests.py" "${@:2}"
 elif [ "$1" = "1" ]; then
     # Run API tests
-    python3 "$API_TEST_DIR/execute_tests.py"
+    python3 "$API_TEST_DIR/execute_tests.py" "${@:2}"
 fi
 
 # Store the test result
@@ -0,0 +1,23 @@
+"""
+Output file paths shared by the reporting modules (command traces,
+performance reports).
+"""
+
+import multiprocessing
+import os
+
+
+def process_output_path(path):
+    """
+    Give worker processes their own output file next to the parent's.
+
+    Args:
+        path (str): Output file configured in settings
+
+    Returns:
+        str: `path` in the parent process, "<root>.<pid><ext>" in a worker
+    """
+    if multiprocessing.parent_process() is None:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{os.getpid()}{ext}"
@@ -1,25 +1,38 @@
 # Shared configuration (URLs, credentials)
 
+import json
+import os
+
+# Root of the site under test. Point JEMIX_SITE_URL at the local fixture
+# site (Scraper/pages/tests/fixtures/jemix_site.py) to run without network.
+SITE_URL = os.environ.get("JEMIX_SITE_URL", "https://www.jemix.co.il").rstrip("/")
+
 # Base URL
-BASE_URL = "https://www.jemix.com"
+BASE_URL = os.environ.get(
+    "JEMIX_BASE_URL",
+    SITE_URL if "JEMIX_SITE_URL" in os.environ else "https://www.jemix.com"
+)
 
 # Login credentials
 
 PAGES = [
-    {"name": "Home", "url": "https://www.jemix.co.il/"},
-    {"name": "login", "url": "https://www.jemix.co.il/login/"},
-    {"name": "account", "url": "https://www.jemix.co.il/account/"},
-    {"name": "Fashion", "url": "https://www.jemix.co.il/tag/fashion/"},
-    {"name": "Shopping", "url": "https://www.jemix.co.il/tag/shopping/"},
-    {"name": "Travel", "url": "https://www.jemix.co.il/tag/travel/"},
-    {"name": "Food", "url": "https://www.jemix.co.il/tag/food/"},
-    {"name": "Pet", "url": "https://www.jemix.co.il/tag/pet/"},
-    {"name": "Beauty", "url": "https://www.jemix.co.il/tag/beauty/"},
-    {"name": "Entertainment", "url": "https://www.jemix.co.il/tag/entertainment/"},
-    {"name": "Sport", "url": "https://www.jemix.co.il/tag/sport/"},
-    {"name": "Electronics and technology", "url": "https://www.jemix.co.il/tag/electronics-and-technology/"},
+    {"name": "Home", "url": f"{SITE_URL}/"},
+    {"name": "login", "url": f"{SITE_URL}/login/"},
+    {"name": "account", "url": f"{SITE_URL}/account/"},
+    {"name": "Fashion", "url": f"{SITE_URL}/tag/fashion/"},
+    {"name": "Shopping", "url": f"{SITE_URL}/tag/shopping/"},
+    {"name": "Travel", "url": f"{SITE_URL}/tag/travel/"},
+    {"name": "Food", "url": f"{SITE_URL}/tag/food/"},
+    {"name": "Pet", "url": f"{SITE_URL}/tag/pet/"},
+    {"name": "Beauty", "url": f"{SITE_URL}/tag/beauty/"},
+    {"name": "Entertainment", "url": f"{SITE_URL}/tag/entertainment/"},
+    {"name": "Sport", "url": f"{SITE_URL}/tag/sport/"},
+    {"name": "Electronics and technology", "url": f"{SITE_URL}/tag/electronics-and-technology/"},
 ]
 
+# Category (tag) pages only
+CATEGORY_PAGES = [page for page in PAGES if "/tag/" in page["url"]]
+
 # Test Users Configuration
 TEST_USERS = {
     "valid_user": {
@@ -28,5 +41,120 @@ TEST_USERS = {
     }
 }
 
+# Home and login page URLs
+HOME_URL = f"{SITE_URL}/"
+LOGIN_URL = f"{SITE_URL}/login/"
+
 # Account dashboard URL
-ACCOUNT_DASHBOARD_URL = "https://www.jemix.co.il/account/"
+ACCOUNT_DASHBOARD_URL = f"{SITE_URL}/account/"
+
+# Total seconds allowed for a UI login, from typing the username to the dashboard
+LOGIN_TIMEOUT = float(os.environ.get("JEMIX_LOGIN_TIMEOUT", "30"))
+
+# Maximum number of Chrome processes kept alive by the shared driver pool
+DRIVER_POOL_SIZE = int(os.environ.get("JEMIX_DRIVER_POOL_SIZE", "4"))
+
+# Address ("host:port") of a running browser daemon to borrow warm Chrome
+# sessions from instead of launching them (python -m
+# Scraper.pages.base.BrowserDaemon serve); unset launches browsers locally
+BROWSER_DAEMON = os.environ.get("JEMIX_BROWSER_DAEMON") or None
+
+# Shared secret every daemon request must carry. When unset, the daemon makes
+# one up and writes it to the token file (readable only by its user), where
+# clients on the same machine pick it up
+BROWSER_DAEMON_TOKEN = os.environ.get("JEMIX_BROWSER_DAEMON_TOKEN") or None
+BROWSER_DAEMON_TOKEN_FILE = os.environ.get(
+    "JEMIX_BROWSER_DAEMON_TOKEN_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "jemix", "browser_daemon.token")
+)
+
+# The daemon replaces a browser after this many page loads, or when its
+# process tree uses more than this much memory
+DAEMON_MAX_NAVIGATIONS = int(os.environ.get("JEMIX_DAEMON_MAX_NAVIGATIONS", "200"))
+DAEMON_MAX_RSS_MB = int(os.environ.get("JEMIX_DAEMON_MAX_RSS_MB", "1536"))
+
+# Number of category pages crawled concurrently
+CRAWL_WORKERS = int(os.environ.get("JEMIX_CRAWL_WORKERS", "3"))
+
+# Seconds a crawler worker waits for a free pooled browser before reporting an error
+CRAWL_LEASE_TIMEOUT = float(os.environ.get("JEMIX_CRAWL_LEASE_TIMEOUT", "120"))
+
+# On-disk cache mapping the installed Chrome version to its chromedriver path
+CHROMEDRIVER_CACHE_FILE = os.environ.get(
+    "JEMIX_CHROMEDRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "jemix", "chromedriver.json")
+)
+
+# Browser profile of pooled drivers: "standard", or "fast" to block images,
+# media, fonts and tracker domains and return from navigations at
+# DOMContentLoaded (pageLoadStrategy "eager")
+BROWSER_PROFILE = os.environ.get("JEMIX_BROWSER_PROFILE", "standard")
+
+# Extra URL patterns blocked by the fast profile (comma separated, * wildcards)
+EXTRA_BLOCKED_URLS = [
+    pattern.strip() for pattern in os.environ.get("JEMIX_BLOCKED_URLS", "").split(",") if pattern.strip()
+]
+
+# Pre-warmed Chrome profile cloned for every pooled browser. Off by default so
+# tests see a cold browser; set JEMIX_PROFILE_TEMPLATE=1 to opt in
+USE_PROFILE_TEMPLATE = os.environ.get("JEMIX_PROFILE_TEMPLATE", "0") == "1"
+PROFILE_TEMPLATE_DIR = os.environ.get(
+    "JEMIX_PROFILE_TEMPLATE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "jemix", "chrome_profile_template")
+)
+PROFILE_TEMPLATE_TTL = float(os.environ.get("JEMIX_PROFILE_TEMPLATE_TTL", str(24 * 60 * 60)))
+
+# Cached authenticated browser state reused by AccountPage.ensure_logged_in
+SESSION_STATE_FILE = os.environ.get(
+    "JEMIX_SESSION_STATE_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "jemix", "session_state.json")
+)
+SESSION_STATE_TTL = float(os.environ.get("JEMIX_SESSION_STATE_TTL", str(6 * 60 * 60)))
+
+# Page-object backend for pages that do not need JavaScript: "selenium" or "http"
+PAGE_BACKEND = os.environ.get("JEMIX_PAGE_BACKEND", "selenium")
+
+# Browserless (http backend) connection settings
+HTTP_POOL_SIZE = int(os.environ.get("JEMIX_HTTP_POOL_SIZE", "16"))
+HTTP_TIMEOUT = float(os.environ.get("JEMIX_HTTP_TIMEOUT", "20"))
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+)
+
+# Default wait policy of every page object (see base/WaitPolicy.py):
+# explicit wait timeout, poll interval, implicit wait pinned on the driver
+# and how long an optional-element probe may wait (0 = check once)
+WAIT_TIMEOUT = float(os.environ.get("JEMIX_WAIT_TIMEOUT", "10"))
+WAIT_POLL_FREQUENCY = float(os.environ.get("JEMIX_WAIT_POLL_FREQUENCY", "0.25"))
+IMPLICIT_WAIT = float(os.environ.get("JEMIX_IMPLICIT_WAIT", "0"))
+OPTIONAL_ELEMENT_TIMEOUT = float(os.environ.get("JEMIX_OPTIONAL_ELEMENT_TIMEOUT", "0"))
+
+# How page objects wait: "polling" (WebDriverWait) or "observer" (in-page
+# MutationObserver / URL watcher, one async script per wait)
+WAIT_STRATEGY = os.environ.get("JEMIX_WAIT_STRATEGY", "polling")
+
+# WebDriver command tracing: per-test JSON summary and optional Chrome
+# trace-event timeline, written at exit (unset = tracing off)
+COMMAND_TRACE_FILE = os.environ.get("JEMIX_COMMAND_TRACE")
+COMMAND_TIMELINE_FILE = os.environ.get("JEMIX_COMMAND_TIMELINE")
+
+# Collect Navigation Timing, resource timing, LCP and CLS on every page
+# object navigation, and optionally write the samples per PAGES name at exit
+CAPTURE_PERFORMANCE = os.environ.get("JEMIX_CAPTURE_PERFORMANCE", "0") == "1"
+PERFORMANCE_REPORT_FILE = os.environ.get("JEMIX_PERFORMANCE_REPORT")
+
+# Page-speed budgets per PAGES name ({page name: {metric: limit}}), asserted
+# by test_page_performance. Times are milliseconds from navigation start,
+# cls is unitless. They are derived from measured production loads with
+# `python -m Scraper.pages.base.PagePerformance budgets REPORT...` and kept
+# in performance_budgets.json next to this file; set JEMIX_PERFORMANCE_BUDGETS
+# to use another file. Pages without a budget fail the test.
+PERFORMANCE_BUDGETS_FILE = os.environ.get(
+    "JEMIX_PERFORMANCE_BUDGETS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance_budgets.json")
+)
+PERFORMANCE_BUDGETS = {}
+if os.path.exists(PERFORMANCE_BUDGETS_FILE):
+    with open(PERFORMANCE_BUDGETS_FILE, encoding="utf-8") as budget_file:
+        PERFORMANCE_BUDGETS = json.load(budget_file)
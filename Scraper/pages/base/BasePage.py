@@ -1,20 +1,310 @@
 # BasePage.py
 
+import time
+import weakref
+from contextlib import contextmanager
+
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from Scraper.config.settings import CAPTURE_PERFORMANCE
+from Scraper.pages.base.CommandTracer import get_command_tracer
+from Scraper.pages.base.PagePerformance import (
+    PERFORMANCE_SCRIPT, SETTLE_MS, get_performance_recorder, page_name_for_url, summarize
+)
+from Scraper.pages.base.WaitEngine import LOCATOR_FUNCTIONS_JS
+from Scraper.pages.base.WaitPolicy import WaitPolicy
+
+# Evaluates a set of Selenium locators in one round trip.
+# arguments[0]: {key: [by, value]}, returns {key: visible}
+VISIBILITY_SCRIPT = LOCATOR_FUNCTIONS_JS + """
+var locators = arguments[0], result = {};
+for (var key in locators) {
+    try {
+        result[key] = visible(find(locators[key][0], locators[key][1]));
+    } catch (e) {
+        result[key] = false;
+    }
+}
+return result;
+"""
+
+# Identifies the document a snapshot was read from. Any navigation, reload
+# or redirect starts a new document with a new timeOrigin; same-document
+# URL changes (pushState, #fragment) change the href.
+DOCUMENT_IDENTITY_JS = "performance.timeOrigin + ' ' + location.href"
+DOCUMENT_IDENTITY_SCRIPT = "return " + DOCUMENT_IDENTITY_JS + ";"
+
+# Wraps a snapshot script so its result comes back with the document identity
+SNAPSHOT_SCRIPT_HEAD = "return [" + DOCUMENT_IDENTITY_JS + ", (function() {\n"
+SNAPSHOT_SCRIPT_TAIL = "\n}).apply(null, arguments)];"
 
 class BasePage:
+    # In-memory DOM snapshots per driver, shared by every page object on that
+    # driver so a navigation through one of them invalidates all of them
+    _snapshots = weakref.WeakKeyDictionary()
+
+    # Wait policy for this page class, None uses the settings defaults
+    WAIT_POLICY = None
+
+    # Wait strategy for this page class ("polling" or "observer"),
+    # None follows the policy / settings.WAIT_STRATEGY
+    WAIT_STRATEGY = None
+
+    # Collect page-speed metrics on every navigation (True / False),
+    # None follows settings.CAPTURE_PERFORMANCE
+    CAPTURE_PERFORMANCE = None
+
     def __init__(self, driver):
         self.driver = driver
+        self.capture_performance = (
+            CAPTURE_PERFORMANCE if self.CAPTURE_PERFORMANCE is None else self.CAPTURE_PERFORMANCE
+        )
+        # Metrics of the last captured navigation
+        self.performance = None
+        policy = self.WAIT_POLICY or WaitPolicy()
+        if policy.strategy is None and self.WAIT_STRATEGY:
+            policy = policy.replace(strategy=self.WAIT_STRATEGY)
+        self.wait_policy = policy
+        if driver is not None:
+            policy.apply(driver)
+        # Count and time this driver's commands when tracing is enabled
+        tracer = get_command_tracer()
+        if tracer and driver is not None:
+            tracer.attach(driver)
+
+    def navigate(self, url):
+        """Load a URL and drop snapshots taken on the previous page."""
+        self.driver.get(url)
+        self.invalidate_snapshot()
+        if self.capture_performance:
+            self.collect_performance(url)
+
+    def collect_performance(self, url=None):
+        """
+        Read Navigation Timing, resource timing, LCP and CLS of the current
+        page in one round trip. Pages listed in settings.PAGES are recorded
+        under their name in the shared PerformanceRecorder.
+
+        Args:
+            url (str): URL that was requested (defaults to the current URL)
+
+        Returns:
+            dict: The metrics, also kept in `self.performance`
+        """
+        self.performance = summarize(self.driver.execute_async_script(PERFORMANCE_SCRIPT, SETTLE_MS))
+        name = page_name_for_url(url or self.driver.current_url)
+        if name:
+            self.performance["page"] = name
+            get_performance_recorder().record(name, self.performance)
+        return self.performance
+
+    def snapshot(self, key, script, *args, parse=None):
+        """
+        Read part of the DOM once and serve later reads from memory.
+
+        A snapshot is only reused while the browser is still on the document
+        it was read from, so navigations that bypass the page object (a
+        direct driver.get, a form submit, a redirect) are detected. Checking
+        that costs one small script call instead of re-reading the DOM.
+
+        Args:
+            key (str): Name of the snapshot, unique per page
+            script (str): JavaScript returning the data to capture
+            *args: Arguments passed to the script
+            parse (callable): Optional post-processing applied once to the result
+
+        Returns:
+            The captured (and parsed) data, until the document changes or a
+            page-object action invalidates it
+        """
+        cache = self._snapshots.setdefault(self.driver, {})
+        entry = cache.get(key)
+        if entry is not None and self.driver.execute_script(DOCUMENT_IDENTITY_SCRIPT) == entry[0]:
+            return entry[1]
+        identity, data = self.driver.execute_script(
+            SNAPSHOT_SCRIPT_HEAD + script + SNAPSHOT_SCRIPT_TAIL, *args
+        )
+        cache[key] = (identity, parse(data) if parse else data)
+        return cache[key][1]
+
+    def invalidate_snapshot(self, key=None):
+        """Forget one snapshot, or every snapshot of this driver when no key is given."""
+        if key is None:
+            self._snapshots.pop(self.driver, None)
+        else:
+            self._snapshots.get(self.driver, {}).pop(key, None)
+
+    @classmethod
+    def clear_snapshots(cls, driver):
+        """Forget every snapshot of a driver, e.g. when it is recycled."""
+        cls._snapshots.pop(driver, None)
+
+    @property
+    def wait_engine(self):
+        return self.wait_policy.engine
+
+    def use_wait_strategy(self, name):
+        """Switch this page object to another wait strategy ("polling" or "observer")."""
+        self.wait_policy = self.wait_policy.replace(strategy=name)
+
+    @contextmanager
+    def waiting(self, **changes):
+        """
+        Change the wait policy for the operations inside a `with` block.
+
+        Args:
+            **changes: WaitPolicy settings to override (timeout, poll_frequency,
+                implicit_wait, optional_timeout, strategy)
+        """
+        previous = self.wait_policy
+        self.wait_policy = previous.replace(**changes)
+        if self.driver is not None:
+            self.wait_policy.apply(self.driver)
+        try:
+            yield self.wait_policy
+        finally:
+            self.wait_policy = previous
+            if self.driver is not None:
+                previous.apply(self.driver)
+
+    def resolve_timeout(self, timeout):
+        """The given timeout, or the policy's default when it is None."""
+        return self.wait_policy.timeout if timeout is None else timeout
+
+    def wait_until(self, condition, timeout=None, message=""):
+        """
+        Wait for any WebDriverWait condition under the page's wait policy.
+
+        Args:
+            condition (callable): Receives the driver, returns a truthy value when done
+            timeout (float): Seconds to wait (defaults to the policy timeout)
+            message (str): Message of the TimeoutException
+
+        Returns:
+            The condition's truthy result
+        """
+        return WebDriverWait(
+            self.driver,
+            self.resolve_timeout(timeout),
+            poll_frequency=self.wait_policy.poll_frequency
+        ).until(condition, message)
+
+    def wait_for_element(self, locator, timeout=None):
+        return self.wait_engine.until_element(
+            self.driver, locator, self.resolve_timeout(timeout),
+            poll_frequency=self.wait_policy.poll_frequency
+        )
+
+    def wait_for_visible(self, locator, timeout=None):
+        """Wait for an element to be present and displayed, and return it."""
+        return self.wait_engine.until_element(
+            self.driver, locator, self.resolve_timeout(timeout), visible=True,
+            poll_frequency=self.wait_policy.poll_frequency
+        )
+
+    def wait_for_url(self, mode, expected, timeout=None):
+        """
+        Wait for the current URL to satisfy a condition.
+
+        Args:
+            mode (str): "equals", "contains" or "excludes"
+            expected (str): URL or fragment to compare with
+            timeout (float): Seconds to wait (defaults to the policy timeout)
+
+        Raises:
+            TimeoutException: If the condition did not hold in time
+        """
+        return self.wait_engine.until_url(
+            self.driver, mode, expected, self.resolve_timeout(timeout),
+            poll_frequency=self.wait_policy.poll_frequency
+        )
+
+    def probe(self, locator, timeout=None):
+        """
+        Look for an optional element without paying a timeout when it is absent.
+        With the policy's implicit wait pinned to 0, a zero timeout costs a
+        single find_elements round trip.
+
+        Args:
+            locator (tuple): (By, value) locator
+            timeout (float): Seconds the element may take to appear
+                (defaults to the policy's optional_timeout, 0 = check once)
+
+        Returns:
+            WebElement: First displayed match, or None
+        """
+        timeout = self.wait_policy.optional_timeout if timeout is None else timeout
+
+        def find_displayed(driver):
+            try:
+                for element in driver.find_elements(*locator):
+                    if element.is_displayed():
+                        return element
+            except StaleElementReferenceException:
+                pass
+            return None
+
+        if timeout <= 0:
+            return find_displayed(self.driver)
+        try:
+            return self.wait_until(find_displayed, timeout)
+        except TimeoutException:
+            return None
+
+    def wait_for_all(self, locators, timeout=None, timeouts=None, poll_frequency=None):
+        """
+        Wait for several elements to become visible at once.
+        All locators share one polling loop and every poll is a single
+        script evaluation, so the worst case is the longest timeout rather
+        than the sum of them. A poll that returns nothing or fails with a
+        script error (e.g. while the page is navigating) counts as "not
+        visible yet".
+
+        Args:
+            locators (dict): key -> (By, value) locator
+            timeout (float): Seconds to wait for each element (defaults to the policy timeout)
+            timeouts (dict): Optional key -> seconds overrides of `timeout`
+            poll_frequency (float): Seconds between polls (defaults to the policy's)
 
-    def wait_for_element(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+        Returns:
+            dict: key -> True if the element was found and visible in time
+        """
+        timeout = self.resolve_timeout(timeout)
+        timeouts = timeouts or {}
+        poll_frequency = poll_frequency or self.wait_policy.poll_frequency
+        started = time.monotonic()
+        deadlines = {key: started + timeouts.get(key, timeout) for key in locators}
+        visibility = {key: False for key in locators}
+        pending = dict(locators)
+        while pending:
+            try:
+                found = self.driver.execute_script(
+                    VISIBILITY_SCRIPT,
+                    {key: list(locator) for key, locator in pending.items()}
+                ) or {}
+            except JavascriptException:
+                found = {}
+            now = time.monotonic()
+            for key in list(pending):
+                if found.get(key):
+                    visibility[key] = True
+                    del pending[key]
+                elif now >= deadlines[key]:
+                    del pending[key]
+            if pending:
+                next_deadline = min(deadlines[key] for key in pending)
+                time.sleep(max(0, min(poll_frequency, next_deadline - now)))
+        return visibility
 
     def click(self, locator):
         element = self.wait_for_element(locator)
         element.click()
+        # A click may change the DOM or navigate
+        self.invalidate_snapshot()
 
     def enter_text(self, locator, text):
         element = self.wait_for_element(locator)
         element.clear()
         element.send_keys(text)
+        self.invalidate_snapshot()
\ No newline at end of file
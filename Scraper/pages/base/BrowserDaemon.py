@@ -0,0 +1,503 @@
+# BrowserDaemon.py
+# Long-lived process that keeps warm Chrome sessions and lends them to test runs.
+
+# Example usage
+#python -m Scraper.pages.base.BrowserDaemon serve --size 4          # terminal 1, keep running
+#export JEMIX_BROWSER_DAEMON=127.0.0.1:9600                        # test runs borrow from it
+#./Selenium_Test.sh 0
+#python -m Scraper.pages.base.BrowserDaemon status
+#python -m Scraper.pages.base.BrowserDaemon stop
+#
+# Every request carries a token: JEMIX_BROWSER_DAEMON_TOKEN if set, otherwise
+# the one the daemon writes to JEMIX_BROWSER_DAEMON_TOKEN_FILE at startup.
+
+import argparse
+import hmac
+import json
+import logging
+import os
+import queue
+import secrets
+import socket
+import socketserver
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from Scraper.config.settings import (
+    BROWSER_DAEMON, BROWSER_DAEMON_TOKEN, BROWSER_DAEMON_TOKEN_FILE,
+    DRIVER_POOL_SIZE, DAEMON_MAX_NAVIGATIONS, DAEMON_MAX_RSS_MB
+)
+from Scraper.pages.base.DriverPool import DriverPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS = "127.0.0.1:9600"
+
+# Seconds to wait for the daemon to accept a connection
+CONNECT_TIMEOUT = 5
+
+
+def parse_address(address):
+    """Split "host:port" into a (host, port) tuple."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def load_token(path=BROWSER_DAEMON_TOKEN_FILE):
+    """
+    Token a client presents to the daemon.
+
+    Args:
+        path (str): Token file written by a running daemon
+
+    Returns:
+        str: JEMIX_BROWSER_DAEMON_TOKEN, else the token file's content,
+            else None
+    """
+    if BROWSER_DAEMON_TOKEN:
+        return BROWSER_DAEMON_TOKEN
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def write_token(token, path=BROWSER_DAEMON_TOKEN_FILE):
+    """Store the daemon's token in a file only its user can read."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token)
+    # O_CREAT's mode does not apply to a file left behind by an earlier daemon
+    os.chmod(path, 0o600)
+
+
+def token_matches(presented, expected):
+    """Constant-time comparison of a request's token with the daemon's."""
+    if not isinstance(presented, str):
+        return False
+    return hmac.compare_digest(presented.encode("utf-8"), expected.encode("utf-8"))
+
+
+def process_tree_rss_kb(pid):
+    """
+    Resident memory of a process and all its descendants, from /proc.
+
+    Args:
+        pid (int): Root process (chromedriver; Chrome runs below it)
+
+    Returns:
+        int: Total RSS in KiB, or None where /proc is not available
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, fields resume after ')'
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class BrowserDaemon:
+    """
+    Owns a DriverPool and lends its sessions to other processes.
+
+    A lease hands out the chromedriver URL and session id, which the
+    borrower attaches to with AttachedChrome. Sessions are health-checked
+    before every lease. They are reset when they come back, and recycled
+    after `max_navigations` page loads or when the browser's memory
+    passes `max_rss_mb`. Leases held by a connection that goes away are
+    taken back automatically.
+
+    Requests without the daemon's token are refused and their connection
+    is closed, so other local users cannot borrow browsers or stop it.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, size=DRIVER_POOL_SIZE,
+                 max_navigations=DAEMON_MAX_NAVIGATIONS, max_rss_mb=DAEMON_MAX_RSS_MB,
+                 token=None, token_file=BROWSER_DAEMON_TOKEN_FILE):
+        """
+        Initialize the daemon (call serve_forever() to run it).
+
+        Args:
+            address (str): "host:port" to listen on
+            size (int): Maximum number of live browsers
+            max_navigations (int): Page loads before a browser is replaced
+            max_rss_mb (int): Memory ceiling of one browser process tree
+            token (str): Token clients must send (defaults to
+                JEMIX_BROWSER_DAEMON_TOKEN, else a random one)
+            token_file (str): Where the token is written for local clients
+        """
+        # The daemon's own browsers are always launched locally
+        self.pool = DriverPool(size=size, daemon=None)
+        self.token = token or BROWSER_DAEMON_TOKEN or secrets.token_urlsafe(32)
+        self.token_file = token_file
+        self.max_navigations = max_navigations
+        self.max_rss_mb = max_rss_mb
+        self._leases = {}
+        self._navigations = {}
+        self._lock = threading.Lock()
+        self._server = _DaemonServer(parse_address(address), _DaemonHandler)
+        self._server.daemon = self
+
+    @staticmethod
+    def is_healthy(driver):
+        """Check that a browser still answers commands."""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def over_memory_ceiling(self, driver):
+        rss = process_tree_rss_kb(driver.service.process.pid)
+        return rss is not None and rss > self.max_rss_mb * 1024
+
+    def lend(self, timeout=None):
+        """
+        Lease a healthy browser.
+
+        Args:
+            timeout (float): Seconds to wait for a free browser
+
+        Returns:
+            dict: lease id, executor_url, session_id and capabilities
+        """
+        while True:
+            driver = self.pool.acquire(timeout=timeout)
+            if self.is_healthy(driver):
+                break
+            logger.warning("Replacing unresponsive browser session %s", driver.session_id)
+            self.pool.retire(driver)
+
+        lease_id = secrets.token_hex(8)
+        with self._lock:
+            self._leases[lease_id] = driver
+        return {
+            "lease": lease_id,
+            "executor_url": driver.service.service_url,
+            "session_id": driver.session_id,
+            "capabilities": driver.capabilities
+        }
+
+    def take_back(self, lease_id, navigations=0):
+        """
+        End a lease, resetting the browser or recycling it if it is worn out.
+
+        Args:
+            lease_id (str): Lease returned by `lend`
+            navigations (int): Page loads the borrower made
+        """
+        with self._lock:
+            driver = self._leases.pop(lease_id, None)
+            if driver is None:
+                raise KeyError(f"Unknown lease '{lease_id}'")
+            total = self._navigations.get(driver, 0) + navigations
+            self._navigations[driver] = total
+
+        if total >= self.max_navigations or self.over_memory_ceiling(driver):
+            logger.info("Recycling browser session %s after %d navigations", driver.session_id, total)
+            with self._lock:
+                self._navigations.pop(driver, None)
+            self.pool.retire(driver)
+        else:
+            self.pool.release(driver)
+
+    def status(self):
+        with self._lock:
+            leased = len(self._leases)
+            navigations = sum(self._navigations.values())
+        return {"size": self.pool.size, "leased": leased, "navigations": navigations}
+
+    def handle(self, request, leases):
+        """Answer one request from a connection holding `leases`."""
+        op = request.get("op")
+        if op == "acquire":
+            lease = self.lend(request.get("timeout"))
+            leases.add(lease["lease"])
+            return lease
+        if op == "release":
+            leases.discard(request["lease"])
+            self.take_back(request["lease"], request.get("navigations", 0))
+            return {}
+        if op == "status":
+            return self.status()
+        if op == "shutdown":
+            threading.Thread(target=self.stop, daemon=True).start()
+            return {}
+        raise ValueError(f"Unknown operation '{op}'")
+
+    def serve_forever(self):
+        """Serve until stopped or interrupted, then quit every browser."""
+        host, port = self._server.server_address[:2]
+        if self.token_file:
+            write_token(self.token, self.token_file)
+        logger.info("Browser daemon listening on %s:%s", host, port)
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            self.pool.close()
+            if self.token_file and load_token(self.token_file) == self.token:
+                os.remove(self.token_file)
+
+    def stop(self):
+        self._server.shutdown()
+
+
+class _DaemonServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """One client connection: line-delimited JSON requests and responses."""
+
+    def handle(self):
+        daemon = self.server.daemon
+        leases = set()
+        try:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = {}
+                if not token_matches(request.pop("token", None), daemon.token):
+                    logger.warning("Refused a request with a missing or wrong token from %s", self.client_address[0])
+                    self._respond({"ok": False, "error": "PermissionError: missing or wrong daemon token"})
+                    return
+                try:
+                    response = daemon.handle(request, leases)
+                    response["ok"] = True
+                except queue.Empty:
+                    response = {"ok": False, "error": "No browser became free in time", "empty": True}
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                self._respond(response)
+        except OSError:
+            pass
+        finally:
+            # The borrower exited without returning its browsers
+            for lease_id in leases:
+                try:
+                    daemon.take_back(lease_id)
+                except Exception as e:
+                    logger.warning("Could not take back lease %s: %s", lease_id, e)
+
+    def _respond(self, response):
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class AttachedChrome(webdriver.Remote):
+    """
+    Remote WebDriver bound to an existing session lent by the daemon.
+    No new session is created, and quit() returns the browser to the
+    daemon instead of closing it.
+    """
+
+    def __init__(self, client, lease):
+        """
+        Args:
+            client (BrowserDaemonClient): The lease's own connection
+            lease (dict): Lease returned by the daemon
+        """
+        self.client = client
+        self.lease = lease
+        self.navigations = 0
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=lease["executor_url"],
+            vendor_prefix="goog",
+            browser_name="chrome",
+            keep_alive=True
+        )
+        super().__init__(command_executor=executor, options=Options())
+
+    def start_session(self, capabilities, *args, **kwargs):
+        # Attach to the daemon's session instead of creating one
+        self.session_id = self.lease["session_id"]
+        self.caps = self.lease["capabilities"]
+
+    def get(self, url):
+        self.navigations += 1
+        super().get(url)
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        """Same as ChromiumDriver.execute_cdp_cmd, for the attached session."""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        """Hand the browser back to the daemon and close the lease's connection."""
+        try:
+            self.client.release(self)
+        finally:
+            self.client.close()
+
+
+class BrowserDaemonClient:
+    """
+    Connection from a test process to the browser daemon.
+
+    The daemon answers a connection's requests one at a time, so every
+    lease gets a connection of its own: a thread waiting for a free
+    browser never holds up another thread returning one.
+    """
+
+    def __init__(self, address=BROWSER_DAEMON or DEFAULT_ADDRESS, token=None):
+        """
+        Connect to the daemon.
+
+        Args:
+            address (str): "host:port" the daemon listens on
+            token (str): Daemon token (defaults to load_token())
+
+        Raises:
+            OSError: If the daemon is not running
+        """
+        self.address = address
+        self.token = token or load_token()
+        self._socket = socket.create_connection(parse_address(address), timeout=CONNECT_TIMEOUT)
+        # Leases may wait for a free browser, so no read timeout after connecting
+        self._socket.settimeout(None)
+        self._file = self._socket.makefile("rwb")
+        self._lock = threading.Lock()
+
+    def request(self, **message):
+        """
+        Send one request and wait for its response.
+
+        Returns:
+            dict: The response
+
+        Raises:
+            queue.Empty: If the daemon had no free browser in time
+            RuntimeError: If the daemon reports an error
+            ConnectionError: If the daemon went away
+        """
+        message["token"] = self.token
+        with self._lock:
+            self._file.write(json.dumps(message).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        if not line:
+            raise ConnectionError(f"Browser daemon at {self.address} closed the connection")
+        response = json.loads(line)
+        if not response.pop("ok", False):
+            if response.get("empty"):
+                raise queue.Empty
+            raise RuntimeError(f"Browser daemon: {response.get('error')}")
+        return response
+
+    def acquire(self, timeout=None):
+        """
+        Borrow a warm browser over a new connection that lives as long
+        as the lease (the daemon takes the browser back if it drops).
+
+        Args:
+            timeout (float): Seconds to wait for a free browser
+
+        Returns:
+            AttachedChrome: Driver attached to the lent session
+
+        Raises:
+            queue.Empty: If no browser became free within `timeout`
+        """
+        connection = BrowserDaemonClient(self.address, self.token)
+        try:
+            return AttachedChrome(connection, connection.request(op="acquire", timeout=timeout))
+        except BaseException:
+            connection.close()
+            raise
+
+    def release(self, driver):
+        """Return a browser borrowed with `acquire`."""
+        self.request(op="release", lease=driver.lease["lease"], navigations=driver.navigations)
+
+    def status(self):
+        return self.request(op="status")
+
+    def shutdown(self):
+        """Ask the daemon to quit its browsers and exit."""
+        return self.request(op="shutdown")
+
+    def close(self):
+        try:
+            self._file.close()
+        finally:
+            self._socket.close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_daemon_client(address=BROWSER_DAEMON):
+    """
+    Get this process's connection to the browser daemon, connecting on
+    first use.
+
+    Args:
+        address (str): "host:port" of the daemon (defaults to
+            settings.BROWSER_DAEMON)
+
+    Returns:
+        BrowserDaemonClient: The shared client
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.address != address:
+            _shared_client = BrowserDaemonClient(address or DEFAULT_ADDRESS)
+        return _shared_client
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep warm Chrome sessions for jemix test runs")
+    parser.add_argument("command", choices=("serve", "status", "stop"))
+    parser.add_argument("--address", default=BROWSER_DAEMON or DEFAULT_ADDRESS, help="host:port")
+    parser.add_argument("--size", type=int, default=DRIVER_POOL_SIZE, help="Maximum live browsers")
+    parser.add_argument("--max-navigations", type=int, default=DAEMON_MAX_NAVIGATIONS,
+                        help="Page loads before a browser is replaced")
+    parser.add_argument("--max-rss-mb", type=int, default=DAEMON_MAX_RSS_MB,
+                        help="Memory ceiling of one browser process tree")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+        BrowserDaemon(args.address, args.size, args.max_navigations, args.max_rss_mb).serve_forever()
+        return
+
+    client = BrowserDaemonClient(args.address)
+    try:
+        print(json.dumps(client.status() if args.command == "status" else client.shutdown(), indent=2))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
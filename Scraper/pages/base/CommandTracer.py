@@ -0,0 +1,294 @@
+# CommandTracer.py
+# Counts and times every remote WebDriver command, per test and page-object method.
+
+# Example usage
+#export JEMIX_COMMAND_TRACE=command-trace.json          # per-test summary
+#export JEMIX_COMMAND_TIMELINE=command-timeline.json    # optional, open in chrome://tracing or Perfetto
+#python Scraper/pages/tests/jemix/execute_tests.py
+#
+# Or by hand:
+#from Scraper.pages.base.CommandTracer import CommandTracer
+#tracer = CommandTracer(timeline=True)
+#tracer.attach(driver)
+#...
+#tracer.export("trace.json")
+#tracer.export_timeline("timeline.json")
+
+import atexit
+import collections
+import contextvars
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import sys
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+
+from Scraper.config.output_paths import process_output_path
+from Scraper.config.settings import COMMAND_TRACE_FILE, COMMAND_TIMELINE_FILE
+
+# Attribution used for commands sent outside a test or a page object
+NO_TEST = "<no test>"
+NO_PAGE_METHOD = "<direct driver call>"
+
+# Test a thread or worker process is doing work for when no TestCase is on
+# its own stack, e.g. a crawler thread started by the test (see test_scope)
+_current_test = contextvars.ContextVar("jemix_current_test", default=None)
+
+
+def current_test_id():
+    """
+    Id of the test the caller is running for.
+
+    Returns:
+        str: The nearest unittest.TestCase on the call stack, else the
+            test set with test_scope/set_current_test, else None
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, unittest.TestCase):
+            return owner.id()
+        frame = frame.f_back
+    return _current_test.get()
+
+
+def set_current_test(test_id):
+    """
+    Charge commands sent from the current context to a test. Usable as a
+    ProcessPoolExecutor initializer.
+
+    Args:
+        test_id (str): Test id, or None to clear it
+    """
+    _current_test.set(test_id)
+
+
+@contextmanager
+def test_scope(test_id):
+    """
+    Charge commands sent inside the block to a test.
+
+    Args:
+        test_id (str): Test id, usually current_test_id() taken in the test's thread
+    """
+    token = _current_test.set(test_id)
+    try:
+        yield
+    finally:
+        _current_test.reset(token)
+
+
+class CommandTracer:
+    """
+    Wraps a driver's command executor so every remote command (get,
+    findElement, executeScript, getElementAttribute, clickElement, ...)
+    is counted and timed.
+
+    Each command is attributed by walking the call stack to:
+      - the running test: the nearest unittest.TestCase frame, or, in
+        threads and processes without one, the test set with test_scope
+      - the page-object method: the outermost frame whose `self` is a
+        BasePage, so commands issued from helpers such as BasePage.snapshot
+        are charged to the public method the test called
+    """
+
+    def __init__(self, timeline=False):
+        """
+        Initialize an empty tracer.
+
+        Args:
+            timeline (bool): Also keep every command as a trace event for
+                export_timeline (uses memory proportional to the command count)
+        """
+        self.timeline = timeline
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._tests = {}
+        self._events = []
+
+    def attach(self, driver):
+        """
+        Instrument a driver. Attaching the same driver again is a no-op.
+
+        Args:
+            driver (WebDriver): Driver whose commands should be traced
+        """
+        executor = driver.command_executor
+        if getattr(executor, "_command_tracer", None) is self:
+            return
+        original_execute = executor.execute
+
+        def execute(command, params):
+            if not self.enabled:
+                return original_execute(command, params)
+            started = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                self._record(command, started, time.perf_counter())
+
+        executor.execute = execute
+        executor._command_tracer = self
+
+    @staticmethod
+    def attribute(frame):
+        """
+        Find the test and page-object method a command was sent from.
+
+        Args:
+            frame: Innermost Python frame of the command
+
+        Returns:
+            tuple: (test id, "PageClass.method")
+        """
+        # Imported here because BasePage itself attaches the tracer
+        from Scraper.pages.base.BasePage import BasePage
+
+        test_id = NO_TEST
+        method = NO_PAGE_METHOD
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, BasePage):
+                method = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            elif isinstance(owner, unittest.TestCase):
+                return owner.id(), method
+            frame = frame.f_back
+        return _current_test.get() or test_id, method
+
+    def _record(self, command, started, finished):
+        test_id, method = self.attribute(sys._getframe(2))
+        duration = finished - started
+        with self._lock:
+            methods = self._tests.setdefault(test_id, {})
+            stats = methods.setdefault(method, {}).setdefault(
+                command, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += duration * 1000
+            stats["max_ms"] = max(stats["max_ms"], duration * 1000)
+            if self.timeline:
+                self._events.append({
+                    "name": command,
+                    "cat": method,
+                    "ph": "X",
+                    "ts": round((started - self._origin) * 1e6, 1),
+                    "dur": round(duration * 1e6, 1),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"test": test_id, "method": method}
+                })
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._tests = {}
+            self._events = []
+
+    def command_counts(self):
+        """
+        Total number of each command across all tests.
+
+        Returns:
+            collections.Counter: command name -> count
+        """
+        counts = collections.Counter()
+        with self._lock:
+            for methods in self._tests.values():
+                for commands in methods.values():
+                    for command, stats in commands.items():
+                        counts[command] += stats["count"]
+        return counts
+
+    def summary(self):
+        """
+        Per-test aggregate of the recorded commands.
+
+        Returns:
+            dict: test id -> {"commands", "time_ms", "methods": {method -> {command -> stats}}}
+        """
+        summary = {}
+        with self._lock:
+            for test_id, methods in sorted(self._tests.items()):
+                commands = sum(stats["count"] for per_method in methods.values() for stats in per_method.values())
+                time_ms = sum(stats["total_ms"] for per_method in methods.values() for stats in per_method.values())
+                summary[test_id] = {
+                    "commands": commands,
+                    "time_ms": round(time_ms, 3),
+                    "methods": {
+                        method: {
+                            command: {
+                                "count": stats["count"],
+                                "total_ms": round(stats["total_ms"], 3),
+                                "max_ms": round(stats["max_ms"], 3)
+                            }
+                            for command, stats in sorted(per_method.items())
+                        }
+                        for method, per_method in sorted(methods.items())
+                    }
+                }
+        return summary
+
+    def export(self, path):
+        """
+        Write the per-test summary as JSON.
+
+        Args:
+            path (str): Output file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"pid": os.getpid(), "tests": self.summary()}, f, indent=2)
+
+    def export_timeline(self, path):
+        """
+        Write the recorded commands in Chrome trace-event format
+        (load it in chrome://tracing or https://ui.perfetto.dev).
+
+        Args:
+            path (str): Output file
+        """
+        with self._lock:
+            events = list(self._events)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+_shared_tracer = None
+_shared_tracer_exported = False
+_shared_tracer_lock = threading.Lock()
+
+
+def get_command_tracer():
+    """
+    Get the process-wide tracer when tracing is enabled in settings
+    (JEMIX_COMMAND_TRACE or JEMIX_COMMAND_TIMELINE). The trace files are
+    written when the process exits.
+
+    Returns:
+        CommandTracer: The shared tracer, or None when tracing is off
+    """
+    global _shared_tracer
+    if not (COMMAND_TRACE_FILE or COMMAND_TIMELINE_FILE):
+        return None
+    with _shared_tracer_lock:
+        if _shared_tracer is None:
+            _shared_tracer = CommandTracer(timeline=bool(COMMAND_TIMELINE_FILE))
+            atexit.register(_export_shared_tracer)
+            # multiprocessing workers exit without running atexit handlers
+            multiprocessing.util.Finalize(_shared_tracer, _export_shared_tracer, exitpriority=20)
+        return _shared_tracer
+
+
+def _export_shared_tracer():
+    global _shared_tracer_exported
+    if _shared_tracer is None or _shared_tracer_exported:
+        return
+    _shared_tracer_exported = True
+    if COMMAND_TRACE_FILE:
+        _shared_tracer.export(process_output_path(COMMAND_TRACE_FILE))
+    if COMMAND_TIMELINE_FILE:
+        _shared_tracer.export_timeline(process_output_path(COMMAND_TIMELINE_FILE))
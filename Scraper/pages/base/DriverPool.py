@@ -0,0 +1,404 @@
+# DriverPool.py
+# Shared, bounded pool of Chrome sessions used by the jemix suites.
+
+# Example usage inside a unittest.TestCase
+#from Scraper.pages.base.DriverPool import get_driver_pool
+#def setUp(self):
+#    self.driver = get_driver_pool().acquire()
+#    self.driver = get_driver_pool().acquire(allow=("images",))   # test needs images in the fast profile
+#def tearDown(self):
+#    get_driver_pool().release(self.driver)
+#
+#export JEMIX_BROWSER_DAEMON=127.0.0.1:9600   # borrow warm browsers from BrowserDaemon instead
+
+import atexit
+import logging
+import multiprocessing.util
+import os
+import platform
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from itertools import count
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+from Scraper.config.settings import (
+    DRIVER_POOL_SIZE, BROWSER_PROFILE, EXTRA_BLOCKED_URLS, USE_PROFILE_TEMPLATE, BROWSER_DAEMON
+)
+from Scraper.pages.base.BasePage import BasePage
+from Scraper.pages.base.DriverResolver import resolve_chromedriver
+from Scraper.pages.base.ProfileManager import get_profile_manager
+from Scraper.pages.base.WaitPolicy import set_implicit_wait
+
+logger = logging.getLogger(__name__)
+
+# Storage wiped for the current origin when a driver is handed back
+CLEARED_STORAGE_TYPES = "cookies,local_storage,session_storage,indexeddb,cache_storage,service_workers"
+
+BROWSER_PROFILES = ("standard", "fast")
+
+# URL patterns (Network.setBlockedURLs wildcards) the fast profile drops,
+# by group so a test can opt back in to the ones it needs
+RESOURCE_GROUPS = {
+    "images": ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*"),
+    "media": ("*.mp4*", "*.webm*", "*.ogg*", "*.mp3*", "*.m4a*", "*.mov*"),
+    "fonts": ("*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*fonts.googleapis.com*", "*fonts.gstatic.com*"),
+    "trackers": (
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+        "*connect.facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*",
+        "*analytics.tiktok.com*", "*bat.bing.com*", "*taboola.com*", "*outbrain.com*"
+    ),
+}
+
+
+def blocked_url_patterns(profile=BROWSER_PROFILE, allow=()):
+    """URL patterns a browser with the given profile blocks
+
+    Args:
+        profile (str): "standard" (blocks nothing) or "fast"
+        allow (tuple): Resource groups to let through, e.g. ("images",)
+
+    Returns:
+        list: Patterns for Network.setBlockedURLs
+    """
+    unknown = set(allow) - set(RESOURCE_GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown resource group(s) {sorted(unknown)}, expected {tuple(RESOURCE_GROUPS)}")
+    if profile != "fast":
+        return []
+    patterns = [
+        pattern
+        for group, group_patterns in RESOURCE_GROUPS.items() if group not in allow
+        for pattern in group_patterns
+    ]
+    return patterns + list(EXTRA_BLOCKED_URLS)
+
+
+def build_chrome_options(user_data_dir, profile=BROWSER_PROFILE):
+    """Build the Chrome options shared by every jemix test browser
+
+    Args:
+        user_data_dir (str): Profile directory for this browser instance
+        profile (str): "standard" or "fast" (see settings.BROWSER_PROFILE)
+
+    Returns:
+        Options: Configured Chrome options
+    """
+    chrome_options = Options()
+    chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+
+    # Use headless mode in WSL or CI environments
+    if platform.system() == "Linux" and "microsoft" in platform.uname().release.lower():
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--headless=new")
+
+    if profile == "fast":
+        # Page objects wait for the elements they need explicitly, so there
+        # is no need to wait for every subresource before get() returns
+        chrome_options.page_load_strategy = "eager"
+
+    return chrome_options
+
+
+class DriverPool:
+    """
+    Bounded pool of Chrome WebDriver sessions.
+
+    Browsers are launched lazily, at most `size` of them, and live for the
+    whole run. Each test acquires a driver, uses it, and releases it; a
+    released driver is reset (cookies and storage wiped, extra windows
+    closed, about:blank loaded) before the next test gets it.
+
+    With `use_template`, every browser gets its own clone of the warm
+    profile template (see ProfileManager), so it starts with a populated
+    HTTP cache but no cookies or storage.
+
+    With the "fast" profile, images, media, fonts and trackers are blocked
+    for every lease unless the test opts back in with `allow`.
+
+    When a browser daemon is configured, browsers are borrowed from it
+    instead of launched. Releasing one hands it straight back to the
+    daemon (which resets it) rather than keeping it idle here, so
+    processes borrowing from the same daemon never starve each other.
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, profile=BROWSER_PROFILE, daemon=BROWSER_DAEMON,
+                 use_template=USE_PROFILE_TEMPLATE):
+        """
+        Initialize an empty pool.
+
+        Args:
+            size (int): Maximum number of live Chrome processes
+            profile (str): "standard" or "fast" browser profile
+            daemon (str): "host:port" of a BrowserDaemon to borrow browsers
+                from (None launches them locally)
+            use_template (bool): Start browsers from a clone of the warm
+                profile template instead of an empty profile
+        """
+        if size < 1:
+            raise ValueError(f"Driver pool size must be at least 1, got {size}")
+        if profile not in BROWSER_PROFILES:
+            raise ValueError(f"Unknown browser profile '{profile}', expected one of {BROWSER_PROFILES}")
+        self.size = size
+        self.profile = profile
+        self.daemon = daemon
+        self.use_template = use_template
+        # Blocked URL patterns currently active on each driver
+        self._blocked_urls = {}
+        # Reset drivers waiting for a test, most recently used last
+        self._idle = []
+        self._drivers = []
+        self._lock = threading.Lock()
+        # Signalled whenever a driver is returned or a slot is freed
+        self._available = threading.Condition(self._lock)
+        self._launched = 0
+        # Profile directory numbers are never reused, a relaunched slot must
+        # not wipe the directory of a browser that is still running
+        self._profile_numbers = count()
+        self._temp_dir = tempfile.mkdtemp(prefix="jemix_driver_pool_")
+        self._closed = False
+
+    def _launch(self, index, timeout=None):
+        """
+        Start a new Chrome session with its own profile directory.
+
+        Args:
+            index (int): Unique profile directory number
+            timeout (float): Seconds a daemon borrow may wait (None waits forever)
+        """
+        if self.daemon:
+            return self._borrow(timeout)
+        user_data_dir = os.path.join(self._temp_dir, f"chrome_profile_{index}")
+        if self.use_template:
+            try:
+                get_profile_manager().clone(user_data_dir)
+            except Exception as e:
+                logger.warning("Profile template unavailable, starting from an empty profile: %s", e)
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+        driver = webdriver.Chrome(
+            service=Service(resolve_chromedriver()),
+            options=build_chrome_options(user_data_dir, self.profile)
+        )
+        if self.profile == "fast":
+            # URL blocking is part of the Network domain
+            driver.execute_cdp_cmd("Network.enable", {})
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _borrow(self, timeout=None):
+        """Borrow a warm Chrome session from the browser daemon."""
+        # Imported here because the daemon itself is built on DriverPool
+        from Scraper.pages.base.BrowserDaemon import get_daemon_client
+
+        driver = get_daemon_client(self.daemon).acquire(timeout)
+        if self.profile == "fast":
+            driver.execute_cdp_cmd("Network.enable", {})
+        with self._lock:
+            self._drivers.append(driver)
+            # The daemon's blocklist is unknown, always set it on first use
+            self._blocked_urls[driver] = None
+        return driver
+
+    def acquire(self, timeout=None, allow=()):
+        """
+        Get a clean driver, launching a new browser if the pool is not full.
+
+        Args:
+            timeout (float): Seconds to wait for a free driver when the pool
+                is exhausted (None waits forever)
+            allow (tuple): Resource groups ("images", "media", "fonts",
+                "trackers") this test needs loaded in the fast profile
+
+        Returns:
+            WebDriver: A driver sitting on about:blank with no cookies
+
+        Raises:
+            queue.Empty: If no driver became free within `timeout`
+        """
+        patterns = blocked_url_patterns(self.profile, allow)
+        driver = self._checkout(timeout)
+        try:
+            self._block_urls(driver, patterns)
+        except WebDriverException:
+            self._discard(driver)
+            raise
+        return driver
+
+    def _block_urls(self, driver, patterns):
+        """Set the driver's URL blocklist, skipping the call when it is unchanged."""
+        if self._blocked_urls.get(driver, []) != patterns:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            self._blocked_urls[driver] = patterns
+
+    def _checkout(self, timeout):
+        """Take an idle driver or launch a new one (see acquire)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool has been closed")
+                if self._idle:
+                    return self._idle.pop()
+                # A discarded browser frees its slot, so re-check on every wake-up
+                if self._launched < self.size:
+                    self._launched += 1
+                    index = next(self._profile_numbers)
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._available.wait(remaining)
+
+        try:
+            # Borrowing from the daemon may wait for another process to return a browser
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            return self._launch(index, remaining)
+        except Exception:
+            with self._available:
+                self._launched -= 1
+                self._available.notify()
+            raise
+
+    def release(self, driver):
+        """
+        Return a driver to the pool, resetting its state first.
+        Drivers that fail to reset are quit and their slot is freed.
+        Drivers borrowed from the daemon go straight back to it.
+
+        Args:
+            driver (WebDriver): Driver previously obtained from `acquire`
+        """
+        if self._closed or self.daemon:
+            # AttachedChrome.quit() returns the lease, the daemon resets the browser
+            self._discard(driver)
+            return
+        try:
+            self.reset(driver)
+        except Exception as e:
+            # Never fail the test over cleanup, just replace the browser
+            logger.warning("Driver reset failed, discarding it: %s", e)
+            self._discard(driver)
+            return
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+
+    @contextmanager
+    def lease(self, timeout=None, allow=()):
+        """Context manager that acquires a driver and always releases it."""
+        driver = self.acquire(timeout=timeout, allow=allow)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    @staticmethod
+    def reset(driver):
+        """
+        Wipe per-test state from a driver without restarting the browser.
+
+        Args:
+            driver (WebDriver): Driver to reset
+
+        Raises:
+            WebDriverException: If the browser cannot be reset (e.g. the
+                test closed every window)
+        """
+        # Close any windows the test opened, keep the first one
+        handles = driver.window_handles
+        if not handles:
+            raise WebDriverException("No browser window left to reset")
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per-origin, so clear it while still on the test's page
+        origin = driver.execute_script("return window.location.origin;")
+        if origin and origin.startswith("http"):
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": CLEARED_STORAGE_TYPES}
+            )
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        set_implicit_wait(driver, 0, force=True)
+        driver.get("about:blank")
+        BasePage.clear_snapshots(driver)
+
+    def retire(self, driver):
+        """
+        Quit a driver instead of returning it, e.g. when it is unhealthy.
+        Its slot is freed for a new browser.
+
+        Args:
+            driver (WebDriver): Driver previously obtained from `acquire`
+        """
+        self._discard(driver)
+
+    def _discard(self, driver):
+        """Quit a driver and free its slot."""
+        with self._available:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._launched -= 1
+                self._available.notify()
+            self._blocked_urls.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every browser and remove the pool's profile directories."""
+        with self._available:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+            self._idle.clear()
+            self._launched = 0
+            self._blocked_urls.clear()
+            # Waiting acquires fail instead of sleeping forever
+            self._available.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """
+    Get the process-wide driver pool, creating it on first use.
+    The pool is closed automatically when the interpreter (or a
+    multiprocessing worker) exits.
+
+    Returns:
+        DriverPool: The shared pool
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = DriverPool()
+            atexit.register(_shared_pool.close)
+            # multiprocessing workers exit without running atexit handlers
+            multiprocessing.util.Finalize(_shared_pool, _shared_pool.close, exitpriority=10)
+        return _shared_pool
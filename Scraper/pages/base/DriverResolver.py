@@ -0,0 +1,235 @@
+# DriverResolver.py
+# Resolves the chromedriver binary once per installed Chrome version.
+
+# Example usage
+#from Scraper.pages.base.DriverResolver import resolve_chromedriver
+#service = Service(resolve_chromedriver())
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from Scraper.config.settings import CHROMEDRIVER_CACHE_FILE
+
+# Browser executables probed, in order, to find the installed Chrome version
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+# chrome.exe has no usable --version, the version is read from the registry
+# or from the version-named directory installed next to it
+WINDOWS_CHROME_BINARIES = [
+    os.path.join(os.environ.get(variable, ""), "Google", "Chrome", "Application", "chrome.exe")
+    for variable in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")
+    if os.environ.get(variable)
+]
+WINDOWS_VERSION_KEY = r"Software\Google\Chrome\BLBeacon"
+
+VERSION_PATTERN = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+
+def _read_version(executable):
+    """Full version printed by `<executable> --version`, or None."""
+    try:
+        output = subprocess.run(
+            [executable, "--version"],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(1) if match else None
+
+
+def _major(version):
+    return version.split(".", 1)[0] if version else None
+
+
+class ChromeDriverResolver:
+    """
+    Maps the installed Chrome version to a chromedriver path, backed by a
+    JSON file so ChromeDriverManager is consulted at most once per version
+    per machine. Lookups after the first one need no network access.
+
+    When the version cannot be detected, the Chrome binary's path and
+    modification time are used as the key instead, so an unchanged
+    browser still resolves from the cache.
+    """
+
+    def __init__(self, cache_file=CHROMEDRIVER_CACHE_FILE):
+        """
+        Initialize the resolver.
+
+        Args:
+            cache_file (str): Path of the on-disk version -> driver path cache
+        """
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._resolved = None
+
+    @staticmethod
+    def find_chrome_binaries():
+        """
+        Locate the installed Chrome/Chromium executables.
+
+        Returns:
+            list: Absolute paths, in probing order
+        """
+        candidates = WINDOWS_CHROME_BINARIES if sys.platform == "win32" else CHROME_BINARIES
+        found = []
+        for binary in candidates:
+            executable = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+            if executable and executable not in found:
+                found.append(executable)
+        return found
+
+    @staticmethod
+    def _windows_chrome_version(executable):
+        """Chrome version on Windows, from the registry or the install directory."""
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, WINDOWS_VERSION_KEY) as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except (ImportError, OSError):
+            pass
+        # Application\<version>\ sits next to chrome.exe
+        try:
+            versions = [name for name in os.listdir(os.path.dirname(executable)) if VERSION_PATTERN.fullmatch(name)]
+        except OSError:
+            return None
+        return max(versions, key=lambda v: tuple(map(int, v.split("."))), default=None)
+
+    @classmethod
+    def detect_chrome_version(cls):
+        """
+        Detect the installed Chrome/Chromium version.
+
+        Returns:
+            str: Full version string (e.g. "126.0.6478.126") or None if unknown
+        """
+        for executable in cls.find_chrome_binaries():
+            if sys.platform == "win32":
+                version = cls._windows_chrome_version(executable)
+            else:
+                version = _read_version(executable)
+            if version:
+                return version
+        return None
+
+    @classmethod
+    def binary_cache_key(cls):
+        """
+        Fallback cache key for when the version is unknown.
+
+        Returns:
+            str: "<chrome path>@<mtime>" of the first Chrome found, or None
+        """
+        for executable in cls.find_chrome_binaries():
+            try:
+                return f"{os.path.realpath(executable)}@{int(os.path.getmtime(executable))}"
+            except OSError:
+                continue
+        return None
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _store_cache(self, cache):
+        """Write the cache atomically so concurrent runs never see a partial file."""
+        cache_dir = os.path.dirname(self.cache_file) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temp_path, self.cache_file)
+
+    @staticmethod
+    def _usable(path):
+        return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+    def resolve(self):
+        """
+        Get the chromedriver path for the installed Chrome.
+
+        Returns:
+            str: Absolute path of a chromedriver executable
+
+        Raises:
+            Exception: Whatever ChromeDriverManager raised, if the driver was
+                never resolved before and cannot be downloaded now
+        """
+        with self._lock:
+            if self._usable(self._resolved):
+                return self._resolved
+
+            version = self.detect_chrome_version()
+            key = version or self.binary_cache_key()
+            cache = self._load_cache()
+            cached_path = cache.get(key) if key else None
+            if self._usable(cached_path):
+                self._resolved = cached_path
+                return cached_path
+
+            try:
+                path = ChromeDriverManager().install()
+            except Exception:
+                # Offline: fall back to a driver resolved before, but only
+                # one built for the same Chrome major version
+                fallback = self._offline_fallback(cache, version)
+                if fallback is None:
+                    raise
+                self._resolved = fallback
+                return fallback
+
+            if key:
+                cache[key] = path
+                self._store_cache(cache)
+            self._resolved = path
+            return path
+
+    def _offline_fallback(self, cache, version):
+        """
+        Newest cached driver whose major version matches the installed Chrome.
+
+        Args:
+            cache (dict): Cache contents
+            version (str): Installed Chrome version (None if unknown)
+
+        Returns:
+            str: Driver path, or None if no cached driver is known to match
+        """
+        if not version:
+            # Nothing to compare against, a mismatched driver would only fail later
+            return None
+        for path in reversed(list(cache.values())):
+            if self._usable(path) and _major(_read_version(path)) == _major(version):
+                return path
+        return None
+
+
+_shared_resolver = ChromeDriverResolver()
+
+
+def resolve_chromedriver():
+    """
+    Resolve the chromedriver path through the process-wide resolver.
+
+    Returns:
+        str: Absolute path of a chromedriver executable
+    """
+    return _shared_resolver.resolve()
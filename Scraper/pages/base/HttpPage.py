@@ -0,0 +1,175 @@
+# HttpPage.py
+# Browserless page backend: pooled HTTP session + selectolax HTML parsing.
+
+# Example usage
+#from Scraper.pages.base.HttpPage import HttpPage
+#page = HttpPage()
+#document = page.fetch("https://www.jemix.co.il/tag/fashion/")
+#for link in document.select("article.elementor-post a.elementor-post__thumbnail__link"):
+#    print(link.attributes.get("href"))
+
+import re
+import threading
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+
+from Scraper.config.settings import HTTP_POOL_SIZE, HTTP_TIMEOUT, HTTP_USER_AGENT
+
+
+# Elements rendered as blocks: their text starts and ends on its own line
+BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "dd", "details", "dialog", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "summary", "table",
+    "tbody", "tfoot", "thead", "tr", "ul",
+))
+
+# Elements whose content is never rendered
+HIDDEN_TAGS = frozenset(("head", "script", "style", "template", "noscript", "-comment"))
+
+
+def _hidden(element):
+    attributes = element.attributes
+    style = (attributes.get("style") or "").replace(" ", "").lower()
+    return "hidden" in attributes or "display:none" in style
+
+
+def element_text(element):
+    """
+    Visible text of a parsed element, laid out the way Selenium's
+    WebElement.text returns it: whitespace runs collapse to one space,
+    block elements and <br> start new lines, table cells are separated by
+    a space, <pre> keeps its whitespace, every line is trimmed and
+    non-breaking spaces become plain spaces.
+
+    Args:
+        element: selectolax node
+
+    Returns:
+        str: Text of the element and its descendants
+    """
+    lines = [""]
+
+    def add_text(text, preformatted):
+        if not preformatted:
+            text = re.sub(r"[ \t\n\r\f]+", " ", text)
+            if not lines[-1] or lines[-1].endswith(" "):
+                text = text.lstrip(" ")
+            lines[-1] += text
+            return
+        first, *rest = text.split("\n")
+        lines[-1] += first
+        lines.extend(rest)
+
+    def break_line():
+        if lines[-1].strip():
+            lines.append("")
+
+    def walk(node, preformatted):
+        for child in node.iter(include_text=True):
+            tag = child.tag
+            if tag == "-text":
+                add_text(child.text_content or "", preformatted)
+            elif tag == "br":
+                lines.append("")
+            elif tag in HIDDEN_TAGS or _hidden(child):
+                continue
+            elif tag in BLOCK_TAGS:
+                break_line()
+                walk(child, preformatted or tag == "pre")
+                break_line()
+            else:
+                walk(child, preformatted)
+                if tag in ("td", "th") and lines[-1] and not lines[-1].endswith(" "):
+                    lines[-1] += " "
+
+    walk(element, element.tag == "pre")
+    text = "\n".join(line.strip(" \t") for line in lines).strip()
+    return text.replace("\xa0", " ")
+
+
+class HtmlDocument:
+    """A parsed page. Elements are selectolax nodes (`.attributes`, `.css_first`, `.text()`)."""
+
+    def __init__(self, html, url=None):
+        """
+        Parse an HTML string.
+
+        Args:
+            html (str): Page source
+            url (str): URL the page was loaded from, used to resolve links
+        """
+        self.url = url
+        self.tree = LexborHTMLParser(html)
+
+    def select(self, selector):
+        """Every element matching a CSS selector, in document order."""
+        return self.tree.css(selector)
+
+    def select_one(self, selector):
+        """First element matching a CSS selector, or None."""
+        return self.tree.css_first(selector)
+
+    def absolute_url(self, value):
+        """Resolve a possibly relative href/src the way a browser would."""
+        return urljoin(self.url, value) if self.url and value is not None else value
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Get the process-wide HTTP session with a connection pool sized for
+    parallel crawls.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = HTTP_USER_AGENT
+            _shared_session = session
+        return _shared_session
+
+
+class HttpPage:
+    """
+    Fetches and parses server-rendered HTML without a browser, for page
+    objects whose content does not depend on JavaScript.
+    """
+
+    def __init__(self, session=None):
+        self.session = session or get_http_session()
+        self.document = None
+
+    @property
+    def current_url(self):
+        return self.document.url if self.document else None
+
+    def fetch(self, url):
+        """
+        Download and parse a page, following redirects.
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            HtmlDocument: Parsed page, also kept as `self.document`
+
+        Raises:
+            requests.HTTPError: If the server answers with an error status
+        """
+        response = self.session.get(url, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        self.document = HtmlDocument(response.text, response.url)
+        return self.document
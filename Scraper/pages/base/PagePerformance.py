@@ -0,0 +1,345 @@
+# PagePerformance.py
+# Navigation Timing, resource timing and Web Vitals of page loads, with per-page budgets.
+
+# Example usage
+#export JEMIX_CAPTURE_PERFORMANCE=1                 # every navigate_to_* call collects metrics
+#export JEMIX_PERFORMANCE_REPORT=performance.json   # samples per PAGES name, written at exit
+#
+#home_page.navigate_to_home()
+#print(home_page.performance)                       # {"ttfb": 212.4, "lcp": 980.0, "cls": 0.01, ...}
+#violations = get_performance_recorder().check_budget("Home", home_page.performance)
+#
+# Record budgets from production loads (several runs give a steadier worst case)
+#JEMIX_PERFORMANCE_REPORT=perf.json python -m unittest Scraper.pages.tests.jemix.test_page_performance
+#python -m Scraper.pages.base.PagePerformance budgets perf*.json
+
+import argparse
+import atexit
+import json
+import math
+import multiprocessing.util
+import statistics
+import threading
+
+from Scraper.config.output_paths import process_output_path
+from Scraper.config.settings import (
+    PAGES, PERFORMANCE_BUDGETS, PERFORMANCE_BUDGETS_FILE, PERFORMANCE_REPORT_FILE
+)
+
+# How long the collection script waits for buffered LCP / layout-shift
+# entries to be delivered to its observers
+SETTLE_MS = 50
+
+# Layout shifts closer together than this are one CLS session window,
+# and a window never spans more than SESSION_WINDOW_MAX_MS
+SESSION_GAP_MS = 1000
+SESSION_WINDOW_MAX_MS = 5000
+
+# Metrics a page budget limits
+BUDGETED_METRICS = ("ttfb", "fcp", "lcp", "cls", "dom_content_loaded", "load")
+
+# A derived budget is the worst measured sample times this
+BUDGET_HEADROOM = 1.25
+
+# Smallest CLS budget, so a page measured without layout shifts does not
+# fail on the first tiny one
+MIN_CLS_BUDGET = 0.01
+
+# Collects every metric in one round trip.
+# arguments: settleMs, callback. Times are ms since navigation start.
+PERFORMANCE_SCRIPT = """
+var settleMs = arguments[0];
+var done = arguments[arguments.length - 1];
+var result = {navigation: null, paint: {}, lcp: null, shifts: [], resources: []};
+
+var navigation = performance.getEntriesByType('navigation')[0];
+if (navigation) {
+    result.navigation = {
+        ttfb: navigation.responseStart,
+        dom_content_loaded: navigation.domContentLoadedEventEnd,
+        load: navigation.loadEventEnd,
+        transfer_size: navigation.transferSize
+    };
+} else if (performance.timing) {
+    // Legacy Navigation Timing (level 1): absolute epoch milliseconds
+    var t = performance.timing, start = t.navigationStart;
+    var since = function (value) { return value ? value - start : 0; };
+    result.navigation = {
+        ttfb: since(t.responseStart),
+        dom_content_loaded: since(t.domContentLoadedEventEnd),
+        load: since(t.loadEventEnd),
+        transfer_size: 0
+    };
+}
+
+performance.getEntriesByType('paint').forEach(function (entry) {
+    result.paint[entry.name] = entry.startTime;
+});
+performance.getEntriesByType('resource').forEach(function (entry) {
+    result.resources.push({
+        type: entry.initiatorType,
+        duration: entry.duration,
+        transfer_size: entry.transferSize || 0
+    });
+});
+
+var supported = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+var observers = [];
+function observe(type, handle) {
+    if (supported.indexOf(type) === -1) return;
+    var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handle); });
+    observer.observe({type: type, buffered: true});
+    observers.push({observer: observer, handle: handle});
+}
+observe('largest-contentful-paint', function (entry) {
+    result.lcp = entry.renderTime || entry.loadTime || entry.startTime;
+});
+observe('layout-shift', function (entry) {
+    if (!entry.hadRecentInput) result.shifts.push([entry.startTime, entry.value]);
+});
+
+setTimeout(function () {
+    observers.forEach(function (item) {
+        item.observer.takeRecords().forEach(item.handle);
+        item.observer.disconnect();
+    });
+    done(result);
+}, settleMs);
+"""
+
+
+def cumulative_layout_shift(shifts):
+    """
+    CLS as Chrome reports it: the largest session window of layout shifts.
+
+    Args:
+        shifts (list): (start_time_ms, value) pairs without recent input
+
+    Returns:
+        float: Sum of the worst session window
+    """
+    worst = current = 0.0
+    window_start = previous = None
+    for start, value in sorted(shifts):
+        if (previous is None or start - previous > SESSION_GAP_MS
+                or start - window_start > SESSION_WINDOW_MAX_MS):
+            window_start = start
+            current = 0.0
+        current += value
+        previous = start
+        worst = max(worst, current)
+    return round(worst, 4)
+
+
+def summarize(raw):
+    """
+    Flatten the collection script's result into metrics.
+
+    Args:
+        raw (dict): Result of PERFORMANCE_SCRIPT
+
+    Returns:
+        dict: Metrics in ms (cls unitless). Timings the page has not
+            reached yet (e.g. load under the eager profile) are None.
+    """
+    navigation = raw.get("navigation") or {}
+
+    def timing(value):
+        return round(value, 1) if value else None
+
+    resources = raw.get("resources") or []
+    by_type = {}
+    for resource in resources:
+        entry = by_type.setdefault(resource["type"] or "other", {"count": 0, "transfer_kb": 0.0})
+        entry["count"] += 1
+        entry["transfer_kb"] = round(entry["transfer_kb"] + resource["transfer_size"] / 1024, 1)
+
+    return {
+        "ttfb": timing(navigation.get("ttfb")),
+        "dom_content_loaded": timing(navigation.get("dom_content_loaded")),
+        "load": timing(navigation.get("load")),
+        "fcp": timing((raw.get("paint") or {}).get("first-contentful-paint")),
+        "lcp": timing(raw.get("lcp")),
+        "cls": cumulative_layout_shift(raw.get("shifts") or []),
+        "resource_count": len(resources),
+        "transfer_kb": round(
+            (navigation.get("transfer_size") or 0) / 1024
+            + sum(resource["transfer_size"] for resource in resources) / 1024, 1
+        ),
+        "slowest_resource": timing(max((resource["duration"] for resource in resources), default=0)),
+        "resources_by_type": by_type
+    }
+
+
+def derive_budgets(samples, headroom=BUDGET_HEADROOM):
+    """
+    Page budgets from measured loads: the worst sample of each budgeted
+    metric plus headroom.
+
+    Args:
+        samples (dict): Page name -> list of metrics from `summarize`
+            (the "samples" of an exported report)
+        headroom (float): Factor applied to the worst sample
+
+    Returns:
+        dict: Page name -> {metric: limit}; metrics never measured for a
+            page are left out
+    """
+    budgets = {}
+    for name, values in sorted(samples.items()):
+        budget = {}
+        for metric in BUDGETED_METRICS:
+            measured = [sample[metric] for sample in values if sample.get(metric) is not None]
+            if not measured:
+                continue
+            if metric == "cls":
+                budget[metric] = round(max(max(measured) * headroom, MIN_CLS_BUDGET), 3)
+            else:
+                budget[metric] = math.ceil(max(measured) * headroom)
+        if budget:
+            budgets[name] = budget
+    return budgets
+
+
+def page_name_for_url(url):
+    """
+    Name of the settings.PAGES entry for a URL.
+
+    Args:
+        url (str): Requested URL
+
+    Returns:
+        str: The page name, or None for URLs outside PAGES
+    """
+    normalized = url.split("#")[0].split("?")[0].rstrip("/")
+    for page in PAGES:
+        if page["url"].rstrip("/") == normalized:
+            return page["name"]
+    return None
+
+
+class PerformanceRecorder:
+    """Performance samples of page loads, kept per PAGES name."""
+
+    def __init__(self, budgets=PERFORMANCE_BUDGETS):
+        """
+        Args:
+            budgets (dict): Page name -> {metric: maximum}
+        """
+        self.budgets = budgets
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, metrics):
+        with self._lock:
+            self._samples.setdefault(name, []).append(metrics)
+
+    def samples(self, name):
+        with self._lock:
+            return list(self._samples.get(name, []))
+
+    def check_budget(self, name, metrics):
+        """
+        Compare one sample with the page's budget.
+
+        Args:
+            name (str): Page name from settings.PAGES
+            metrics (dict): Metrics from `summarize`
+
+        Returns:
+            list: One message per exceeded or unmeasured budgeted metric,
+                or one message if the page has no budget at all
+        """
+        budget = self.budgets.get(name)
+        if not budget:
+            return [f"{name}: no budget recorded in {PERFORMANCE_BUDGETS_FILE}"]
+        violations = []
+        for metric, limit in budget.items():
+            value = metrics.get(metric)
+            if value is None:
+                violations.append(f"{name}: {metric} was not measured (budget {limit})")
+            elif value > limit:
+                violations.append(f"{name}: {metric} {value} exceeds budget {limit}")
+        return violations
+
+    def summary(self):
+        """
+        Median of every numeric metric per page.
+
+        Returns:
+            dict: name -> {"samples": n, metric: median}
+        """
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        summary = {}
+        for name, values in samples.items():
+            page = {"samples": len(values)}
+            for metric in values[0]:
+                measured = [sample[metric] for sample in values if isinstance(sample.get(metric), (int, float))]
+                if measured:
+                    page[metric] = round(statistics.median(measured), 4)
+            summary[name] = page
+        return summary
+
+    def export(self, path):
+        """Write the summary, raw samples and budgets as JSON."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"summary": self.summary(), "samples": samples, "budgets": self.budgets}, f, indent=2)
+
+
+_shared_recorder = None
+_shared_recorder_exported = False
+_shared_recorder_lock = threading.Lock()
+
+
+def get_performance_recorder():
+    """
+    Get the process-wide performance recorder. When
+    settings.PERFORMANCE_REPORT_FILE is set it is exported at exit.
+
+    Returns:
+        PerformanceRecorder: The shared recorder
+    """
+    global _shared_recorder
+    with _shared_recorder_lock:
+        if _shared_recorder is None:
+            _shared_recorder = PerformanceRecorder()
+            if PERFORMANCE_REPORT_FILE:
+                atexit.register(_export_shared_recorder)
+                # multiprocessing workers exit without running atexit handlers
+                multiprocessing.util.Finalize(_shared_recorder, _export_shared_recorder, exitpriority=20)
+        return _shared_recorder
+
+
+def _export_shared_recorder():
+    global _shared_recorder_exported
+    if _shared_recorder_exported or _shared_recorder is None:
+        return
+    _shared_recorder_exported = True
+    _shared_recorder.export(process_output_path(PERFORMANCE_REPORT_FILE))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derive page-speed budgets from recorded performance reports")
+    parser.add_argument("command", choices=("budgets",))
+    parser.add_argument("reports", nargs="+", help="Files written via JEMIX_PERFORMANCE_REPORT")
+    parser.add_argument("--headroom", type=float, default=BUDGET_HEADROOM, help="Factor over the worst sample")
+    parser.add_argument("--output", default=PERFORMANCE_BUDGETS_FILE, help="Budget file to write")
+    args = parser.parse_args()
+
+    samples = {}
+    for report in args.reports:
+        with open(report, encoding="utf-8") as f:
+            for name, values in json.load(f)["samples"].items():
+                samples.setdefault(name, []).extend(values)
+    budgets = derive_budgets(samples, args.headroom)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(budgets, f, indent=2)
+        f.write("\n")
+    print(f"Budgets for {len(budgets)} page(s) from {sum(map(len, samples.values()))} sample(s) written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
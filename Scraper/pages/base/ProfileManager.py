@@ -0,0 +1,269 @@
+# ProfileManager.py
+# Pre-warmed Chrome profile template, cloned cheaply for every pooled browser.
+
+# Example usage
+#from Scraper.pages.base.ProfileManager import get_profile_manager
+#user_data_dir = get_profile_manager().clone("/tmp/jemix_driver_pool_x/chrome_profile_0")
+#options.add_argument(f"--user-data-dir={user_data_dir}")
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from Scraper.config.settings import (
+    CATEGORY_PAGES, HOME_URL, PROFILE_TEMPLATE_DIR, PROFILE_TEMPLATE_TTL
+)
+from Scraper.pages.base.DriverResolver import ChromeDriverResolver
+
+logger = logging.getLogger(__name__)
+
+# Describes the template: creation time, Chrome version and warmed URLs
+METADATA_FILE = "jemix_template.json"
+
+# Files Chrome uses to claim a profile; a clone must not inherit them or
+# the new browser believes the profile is already in use
+LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+# Per-user state removed from the template after warming, so clones share
+# caches but never a session
+STATE_PATHS = (
+    "Default/Cookies", "Default/Cookies-journal",
+    "Default/Local Storage", "Default/Session Storage", "Default/Sessions",
+    "Default/IndexedDB", "Default/Service Worker", "Default/History",
+    "Default/History-journal", "Default/Login Data", "Default/Login Data-journal",
+    "Default/Web Data", "Default/Web Data-journal",
+)
+
+
+@contextmanager
+def _file_lock(path, shared=False):
+    """
+    Hold an inter-process lock on a lock file for the duration of the block.
+
+    Args:
+        path (str): Lock file, created if missing
+        shared (bool): Take a shared (reader) lock; Windows has no shared
+            mode, so there readers lock exclusively as well
+    """
+    with open(path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            # Released when the file is closed
+            yield
+            return
+        lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ProfileManager:
+    """
+    Keeps one pre-warmed Chrome user-data directory on disk and hands out
+    copies of it.
+
+    The template is built by loading the home and category pages once, so
+    their static assets are already in the HTTP cache, DNS and
+    certificates are warm and Chrome's first-run initialisation is done.
+    Cookies and storage are then removed again. Clones are made with
+    `cp -a --reflink=auto` (copy-on-write where the filesystem supports
+    it) and fall back to shutil.copytree. The template is rebuilt when it
+    is older than the TTL, when the warmed URLs change, or when Chrome is
+    upgraded.
+    """
+
+    def __init__(self, template_dir=PROFILE_TEMPLATE_DIR, ttl=PROFILE_TEMPLATE_TTL, warm_urls=None):
+        """
+        Initialize the manager.
+
+        Args:
+            template_dir (str): Where the template profile is kept
+            ttl (float): Seconds before the template is rebuilt
+            warm_urls (list): Pages loaded into the template (defaults to
+                the home page and every category page)
+        """
+        self.template_dir = template_dir
+        self.ttl = ttl
+        self.warm_urls = list(warm_urls) if warm_urls is not None else [HOME_URL] + [
+            page["url"] for page in CATEGORY_PAGES
+        ]
+        self._lock = threading.Lock()
+        self._chrome_version = None
+
+    def _read_metadata(self):
+        try:
+            with open(os.path.join(self.template_dir, METADATA_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def chrome_version(self):
+        if self._chrome_version is None:
+            self._chrome_version = ChromeDriverResolver.detect_chrome_version() or "unknown"
+        return self._chrome_version
+
+    def is_fresh(self):
+        """
+        Check whether the template can be cloned as it is.
+
+        Returns:
+            bool: True if the template exists, is within its TTL and was
+                built for the current Chrome version and warm URLs
+        """
+        metadata = self._read_metadata()
+        return bool(
+            metadata
+            and time.time() - metadata.get("created", 0) < self.ttl
+            and metadata.get("chrome_version") == self.chrome_version()
+            and metadata.get("warm_urls") == self.warm_urls
+        )
+
+    def _warm(self, user_data_dir):
+        """Start Chrome on a new profile, load the warm URLs and clear session state."""
+        # Imported here because DriverPool itself uses the profile manager
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from Scraper.pages.base.DriverPool import build_chrome_options
+        from Scraper.pages.base.DriverResolver import resolve_chromedriver
+
+        driver = webdriver.Chrome(
+            service=Service(resolve_chromedriver()),
+            options=build_chrome_options(user_data_dir, profile="standard")
+        )
+        try:
+            for url in self.warm_urls:
+                try:
+                    driver.get(url)
+                except Exception as e:
+                    logger.warning("Could not warm profile with %s: %s", url, e)
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        finally:
+            driver.quit()
+
+        for relative in STATE_PATHS:
+            path = os.path.join(user_data_dir, relative)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.exists(path):
+                os.remove(path)
+        self._remove_lock_files(user_data_dir)
+
+    def refresh(self, force=False):
+        """
+        Build the template if it is missing or stale. Safe to call from
+        several threads and processes at once; only one of them builds.
+
+        Args:
+            force (bool): Rebuild even if the template is fresh
+        """
+        with self._lock:
+            if not force and self.is_fresh():
+                return
+            parent = os.path.dirname(self.template_dir)
+            os.makedirs(parent, exist_ok=True)
+            with _file_lock(self.template_dir + ".lock"):
+                # Another process may have rebuilt it while we waited
+                if not force and self.is_fresh():
+                    return
+                started = time.monotonic()
+                staging = tempfile.mkdtemp(prefix="template_", dir=parent)
+                try:
+                    self._warm(staging)
+                    with open(os.path.join(staging, METADATA_FILE), "w") as f:
+                        json.dump({
+                            "created": time.time(),
+                            "chrome_version": self.chrome_version(),
+                            "warm_urls": self.warm_urls
+                        }, f, indent=2)
+                    # Swap the new template in; clones of the old one are unaffected
+                    retired = None
+                    if os.path.exists(self.template_dir):
+                        retired = tempfile.mkdtemp(prefix="retired_", dir=parent)
+                        os.replace(self.template_dir, os.path.join(retired, "profile"))
+                    os.replace(staging, self.template_dir)
+                    if retired:
+                        shutil.rmtree(retired, ignore_errors=True)
+                except Exception:
+                    shutil.rmtree(staging, ignore_errors=True)
+                    raise
+                logger.info("Built Chrome profile template in %.1fs", time.monotonic() - started)
+
+    @staticmethod
+    def _remove_lock_files(user_data_dir):
+        for name in LOCK_FILES:
+            path = os.path.join(user_data_dir, name)
+            if os.path.lexists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _copy(source, destination):
+        """Copy a profile directory, copy-on-write where possible."""
+        if sys.platform.startswith("linux") and shutil.which("cp"):
+            result = subprocess.run(
+                ["cp", "-a", "--reflink=auto", source, destination],
+                capture_output=True
+            )
+            if result.returncode == 0:
+                return
+            shutil.rmtree(destination, ignore_errors=True)
+        # Chrome's lock files are dangling symlinks, copy them as links
+        shutil.copytree(source, destination, symlinks=True)
+
+    def clone(self, destination):
+        """
+        Create a private copy of the (refreshed if needed) template.
+
+        Args:
+            destination (str): New user-data directory, must not exist yet
+
+        Returns:
+            str: `destination`, ready for --user-data-dir
+        """
+        self.refresh()
+        # Shared lock: a rebuild in another process waits until the copy is done
+        with _file_lock(self.template_dir + ".lock", shared=True):
+            self._copy(self.template_dir, destination)
+        self._remove_lock_files(destination)
+        metadata = os.path.join(destination, METADATA_FILE)
+        if os.path.exists(metadata):
+            os.remove(metadata)
+        return destination
+
+
+_shared_manager = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_profile_manager():
+    """
+    Get the process-wide profile manager.
+
+    Returns:
+        ProfileManager: The shared manager
+    """
+    global _shared_manager
+    with _shared_manager_lock:
+        if _shared_manager is None:
+            _shared_manager = ProfileManager()
+        return _shared_manager
@@ -0,0 +1,165 @@
+# SessionStore.py
+# On-disk cache of authenticated browser state (cookies + localStorage).
+
+# Example usage
+#from Scraper.pages.base.SessionStore import get_session_store
+#store = get_session_store()
+#store.save(driver, "user@example.com")        # after a successful UI login
+#state = store.load("user@example.com")        # None when missing or stale
+#if state:
+#    store.apply(driver, state)
+
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+from Scraper.config.settings import SESSION_STATE_FILE, SESSION_STATE_TTL
+
+# Cheap same-origin resource loaded so cookies and localStorage can be written
+SEED_PATH = "/robots.txt"
+
+
+class SessionStore:
+    """
+    Persists the authenticated state of a browser per user so later tests,
+    and later runs, can restore it into a fresh driver instead of going
+    through the login form again.
+    """
+
+    def __init__(self, path=SESSION_STATE_FILE, ttl=SESSION_STATE_TTL):
+        """
+        Initialize the store.
+
+        Args:
+            path (str): JSON file holding the saved states
+            ttl (float): Seconds a saved state stays usable
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, states):
+        """Write atomically and owner-only, since the file holds auth cookies."""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.chmod(temp_path, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(states, f)
+        os.replace(temp_path, self.path)
+
+    def save(self, driver, key):
+        """
+        Capture cookies and localStorage from the driver's current origin.
+
+        Args:
+            driver (WebDriver): Driver sitting on an authenticated page
+            key (str): Identifier of the session, usually the username
+
+        Returns:
+            dict: The stored state
+        """
+        parts = urlsplit(driver.current_url)
+        cookies = driver.get_cookies()
+        now = time.time()
+
+        # Never outlive the auth cookies themselves
+        expires_at = now + self.ttl
+        cookie_expiries = [cookie["expiry"] for cookie in cookies if "expiry" in cookie]
+        if cookie_expiries:
+            expires_at = min(expires_at, min(cookie_expiries))
+
+        state = {
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "cookies": cookies,
+            "local_storage": driver.execute_script(
+                "var items = {};"
+                "for (var i = 0; i < localStorage.length; i++) {"
+                "  var k = localStorage.key(i); items[k] = localStorage.getItem(k);"
+                "}"
+                "return items;"
+            ),
+            "saved_at": now,
+            "expires_at": expires_at,
+        }
+        with self._lock:
+            states = self._read()
+            states[key] = state
+            self._write(states)
+        return state
+
+    def load(self, key):
+        """
+        Get a saved state if it has not expired.
+
+        Args:
+            key (str): Identifier used when saving
+
+        Returns:
+            dict: The saved state, or None if missing or stale
+        """
+        with self._lock:
+            state = self._read().get(key)
+        if not state or state.get("expires_at", 0) <= time.time():
+            return None
+        return state
+
+    def invalidate(self, key):
+        """
+        Drop a saved state, e.g. after the server-side session was ended.
+
+        Args:
+            key (str): Identifier used when saving
+        """
+        with self._lock:
+            states = self._read()
+            if states.pop(key, None) is not None:
+                self._write(states)
+
+    @staticmethod
+    def apply(driver, state):
+        """
+        Inject a saved state into a driver. The driver is left on a
+        lightweight page of the saved origin; callers navigate afterwards.
+
+        Args:
+            driver (WebDriver): Driver to restore the session into
+            state (dict): State returned by `load`
+        """
+        # Cookies and storage can only be written from the matching origin
+        driver.get(state["origin"] + SEED_PATH)
+        for cookie in state["cookies"]:
+            cookie = dict(cookie)
+            # Chrome rejects sameSite values it does not recognise
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            driver.add_cookie(cookie)
+        if state["local_storage"]:
+            driver.execute_script(
+                "var items = arguments[0];"
+                "for (var k in items) { localStorage.setItem(k, items[k]); }",
+                state["local_storage"]
+            )
+
+
+_shared_store = SessionStore()
+
+
+def get_session_store():
+    """
+    Get the process-wide session store.
+
+    Returns:
+        SessionStore: The shared store
+    """
+    return _shared_store
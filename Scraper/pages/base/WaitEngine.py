@@ -0,0 +1,312 @@
+# WaitEngine.py
+# Interchangeable ways of waiting for elements and URLs.
+
+# Example usage
+#export JEMIX_WAIT_STRATEGY=observer      # every page object
+#
+#class AccountPage(BasePage):
+#    WAIT_STRATEGY = "observer"           # one page object class
+#
+#page.use_wait_strategy("observer")       # one page object instance
+#
+#from Scraper.pages.base.WaitEngine import get_wait_engine
+#element = get_wait_engine("observer").until_element(driver, (By.ID, "login"), timeout=10, visible=True)
+
+import time
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from Scraper.config.settings import WAIT_STRATEGY
+
+# Locator strategies the in-page helpers understand (selenium By values)
+SUPPORTED_STRATEGIES = (
+    "css selector", "xpath", "id", "name", "class name", "tag name", "link text", "partial link text"
+)
+
+# URL conditions understood by until_url
+URL_MODES = ("equals", "contains", "excludes")
+
+# chromedriver script errors caused by the page navigating mid-script (lower case)
+NAVIGATION_ERRORS = (
+    "document unloaded",
+    "execution context was destroyed",
+    "cannot find context with specified id",
+    "inspected target navigated or closed",
+)
+
+# In-page equivalents of driver.find_element and WebElement.is_displayed
+LOCATOR_FUNCTIONS_JS = """
+function find(by, value) {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].innerText.trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) return links[i];
+            }
+            return null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function visible(element) {
+    if (!element) return false;
+    var style = window.getComputedStyle(element);
+    return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0'
+        && element.getClientRects().length > 0;
+}
+"""
+
+# Resolves with the element as soon as a DOM mutation makes it match, or
+# with null when the time is up. A slow fallback timer catches changes
+# that are not mutations (stylesheets loading, CSS transitions ending).
+# arguments: by, value, visibleOnly, timeoutMs, callback
+ELEMENT_WATCH_SCRIPT = LOCATOR_FUNCTIONS_JS + """
+var by = arguments[0], value = arguments[1], visibleOnly = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+function check() {
+    var element;
+    try {
+        element = find(by, value);
+    } catch (e) {
+        return null;
+    }
+    return element && (!visibleOnly || visible(element)) ? element : null;
+}
+var found = check();
+if (found) {
+    done(found);
+} else {
+    var finished = false, observer, timer, fallback;
+    var finish = function (result) {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        clearInterval(fallback);
+        done(result);
+    };
+    var recheck = function () {
+        var element = check();
+        if (element) finish(element);
+    };
+    observer = new MutationObserver(recheck);
+    observer.observe(document, {childList: true, subtree: true, attributes: visibleOnly});
+    fallback = setInterval(recheck, 100);
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
+
+# Resolves with true once location.href satisfies the condition, or false
+# when the time is up. History API changes are caught by the watcher; a
+# full navigation unloads the script and is handled by the caller.
+# arguments: mode, expected, timeoutMs, callback
+URL_WATCH_SCRIPT = """
+var mode = arguments[0], expected = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+function matches() {
+    var url = window.location.href;
+    if (mode === 'equals') return url === expected;
+    if (mode === 'contains') return url.indexOf(expected) !== -1;
+    return url.indexOf(expected) === -1;
+}
+if (matches()) {
+    done(true);
+} else {
+    var finished = false, timer, watcher;
+    var finish = function (result) {
+        if (finished) return;
+        finished = true;
+        clearTimeout(timer);
+        clearInterval(watcher);
+        window.removeEventListener('popstate', recheck);
+        window.removeEventListener('hashchange', recheck);
+        done(result);
+    };
+    var recheck = function () {
+        if (matches()) finish(true);
+    };
+    window.addEventListener('popstate', recheck);
+    window.addEventListener('hashchange', recheck);
+    watcher = setInterval(recheck, 25);
+    timer = setTimeout(function () { finish(false); }, timeoutMs);
+}
+"""
+
+
+def url_matches(url, mode, expected):
+    """
+    Check a URL against an until_url condition.
+
+    Args:
+        url (str): Current URL
+        mode (str): "equals", "contains" or "excludes"
+        expected (str): URL or fragment to compare with
+
+    Returns:
+        bool: True if the condition holds
+    """
+    if mode == "equals":
+        return url == expected
+    if mode == "contains":
+        return expected in url
+    return expected not in url
+
+
+def _check_url_mode(mode):
+    if mode not in URL_MODES:
+        raise ValueError(f"Unknown URL condition '{mode}', expected one of {URL_MODES}")
+
+
+class PollingWaitEngine:
+    """WebDriverWait polling: one remote round trip per poll."""
+
+    name = "polling"
+
+    def __init__(self, poll_frequency=0.5):
+        """
+        Args:
+            poll_frequency (float): Seconds between polls
+        """
+        self.poll_frequency = poll_frequency
+
+    def until_element(self, driver, locator, timeout, visible=False, poll_frequency=None):
+        """
+        Wait for an element to be present (or visible).
+
+        Args:
+            driver (WebDriver): Driver to wait on
+            locator (tuple): (By, value) locator
+            timeout (float): Seconds to wait
+            visible (bool): Also require the element to be displayed
+            poll_frequency (float): Override of the engine's poll interval
+
+        Returns:
+            WebElement: The element
+
+        Raises:
+            TimeoutException: If the element did not appear in time
+        """
+        condition = EC.visibility_of_element_located if visible else EC.presence_of_element_located
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency or self.poll_frequency).until(
+            condition(locator)
+        )
+
+    def until_url(self, driver, mode, expected, timeout, poll_frequency=None):
+        """
+        Wait for the current URL to satisfy a condition.
+
+        Args:
+            driver (WebDriver): Driver to wait on
+            mode (str): "equals", "contains" or "excludes"
+            expected (str): URL or fragment to compare with
+            timeout (float): Seconds to wait
+            poll_frequency (float): Override of the engine's poll interval
+
+        Returns:
+            bool: True once the condition holds
+
+        Raises:
+            TimeoutException: If the condition did not hold in time
+        """
+        _check_url_mode(mode)
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency or self.poll_frequency).until(
+            lambda d: url_matches(d.current_url, mode, expected),
+            f"URL did not satisfy {mode} '{expected}'"
+        )
+
+
+class ObserverWaitEngine:
+    """
+    Blocks inside the page with one async script per wait: a
+    MutationObserver for elements and a URL watcher for redirects. The wait
+    returns as soon as the condition holds instead of at the next poll.
+    """
+
+    name = "observer"
+
+    # Longest single async script, kept below chromedriver's default 30 s
+    # script timeout so waits never need to change the driver's timeouts
+    MAX_SCRIPT_WAIT = 20
+
+    # Pause before re-arming after a failed script (e.g. the page unloaded)
+    RETRY_DELAY = 0.05
+
+    def _watch(self, driver, script, args, timeout, message):
+        """
+        Run a watch script until it returns a truthy value or the deadline
+        passes. Script errors caused by navigation re-arm the watch on the
+        next document; any other script error is raised straight away.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            chunk = max(0.0, min(remaining, self.MAX_SCRIPT_WAIT))
+            try:
+                result = driver.execute_async_script(script, *args, int(chunk * 1000))
+            except JavascriptException as e:
+                if not any(error in (e.msg or "").lower() for error in NAVIGATION_ERRORS):
+                    raise
+                # The document unloaded mid-wait; watch the next one
+                result = None
+                time.sleep(self.RETRY_DELAY)
+            except TimeoutException:
+                # chromedriver's script timeout fired before the watch called back
+                result = None
+            if result:
+                return result
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
+
+    def until_element(self, driver, locator, timeout, visible=False, poll_frequency=None):
+        """See PollingWaitEngine.until_element (poll_frequency is not used)."""
+        by, value = locator
+        if by not in SUPPORTED_STRATEGIES:
+            raise ValueError(f"Locator strategy '{by}' is not supported by the observer wait engine")
+        state = "visible" if visible else "present"
+        return self._watch(
+            driver, ELEMENT_WATCH_SCRIPT, (by, value, visible), timeout,
+            f"Element {locator} not {state} after {timeout}s"
+        )
+
+    def until_url(self, driver, mode, expected, timeout, poll_frequency=None):
+        """See PollingWaitEngine.until_url (poll_frequency is not used)."""
+        _check_url_mode(mode)
+        return self._watch(
+            driver, URL_WATCH_SCRIPT, (mode, expected), timeout,
+            f"URL did not satisfy {mode} '{expected}' after {timeout}s"
+        )
+
+
+WAIT_ENGINES = {
+    PollingWaitEngine.name: PollingWaitEngine,
+    ObserverWaitEngine.name: ObserverWaitEngine,
+}
+
+_engines = {}
+
+
+def get_wait_engine(name=None):
+    """
+    Get the shared wait engine for a strategy.
+
+    Args:
+        name (str): "polling" or "observer" (defaults to settings.WAIT_STRATEGY)
+
+    Returns:
+        PollingWaitEngine or ObserverWaitEngine
+    """
+    name = name or WAIT_STRATEGY
+    if name not in WAIT_ENGINES:
+        raise ValueError(f"Unknown wait strategy '{name}', expected one of {tuple(WAIT_ENGINES)}")
+    if name not in _engines:
+        _engines[name] = WAIT_ENGINES[name]()
+    return _engines[name]
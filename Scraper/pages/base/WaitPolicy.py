@@ -0,0 +1,96 @@
+# WaitPolicy.py
+# One place that decides how long, how often and how a page object waits.
+
+# Example usage
+#class AccountPage(BasePage):
+#    WAIT_POLICY = WaitPolicy(timeout=15)                    # per page class
+#
+#with page.waiting(timeout=2, poll_frequency=0.05):          # per operation
+#    page.wait_for_element(locator)
+#
+#confirm = page.probe(CONFIRM_LOGOUT_LINK)                   # optional element, no waiting
+
+import weakref
+
+from Scraper.config.settings import (
+    WAIT_TIMEOUT, WAIT_POLL_FREQUENCY, IMPLICIT_WAIT, OPTIONAL_ELEMENT_TIMEOUT
+)
+from Scraper.pages.base.WaitEngine import get_wait_engine
+
+# Implicit wait last set on each driver, so it is only sent when it changes
+_implicit_waits = weakref.WeakKeyDictionary()
+
+
+def set_implicit_wait(driver, seconds, force=False):
+    """
+    Set a driver's implicit wait, skipping the remote call when the driver
+    is already known to use that value.
+
+    Args:
+        driver (WebDriver): Driver to configure
+        seconds (float): Implicit wait in seconds
+        force (bool): Send the command even if the value looks unchanged
+    """
+    if force or _implicit_waits.get(driver) != seconds:
+        driver.implicitly_wait(seconds)
+        _implicit_waits[driver] = seconds
+
+
+class WaitPolicy:
+    """
+    Timeouts, poll interval, implicit-wait state and wait strategy used by
+    a page object.
+
+    Explicit waits and implicit waits multiply each other: every poll of an
+    explicit wait runs a find that itself blocks for the implicit wait. A
+    policy therefore pins the implicit wait (0 by default) on every driver
+    it is applied to, and all waiting is explicit and bounded by `timeout`.
+    """
+
+    def __init__(self, timeout=WAIT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY,
+                 implicit_wait=IMPLICIT_WAIT, optional_timeout=OPTIONAL_ELEMENT_TIMEOUT,
+                 strategy=None):
+        """
+        Args:
+            timeout (float): Default seconds for explicit waits
+            poll_frequency (float): Seconds between polls of polling waits
+            implicit_wait (float): Implicit wait pinned on the driver
+            optional_timeout (float): Seconds an optional-element probe may
+                wait before reporting the element as absent (0 = check once)
+            strategy (str): Wait engine, "polling" or "observer"
+                (None follows settings.WAIT_STRATEGY)
+        """
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.implicit_wait = implicit_wait
+        self.optional_timeout = optional_timeout
+        self.strategy = strategy
+
+    @property
+    def engine(self):
+        return get_wait_engine(self.strategy)
+
+    def replace(self, **changes):
+        """
+        Copy of this policy with some settings changed.
+
+        Args:
+            **changes: Any of the constructor arguments
+
+        Returns:
+            WaitPolicy: The new policy
+        """
+        settings = dict(vars(self))
+        unknown = set(changes) - set(settings)
+        if unknown:
+            raise TypeError(f"Unknown wait policy setting(s): {', '.join(sorted(unknown))}")
+        settings.update(changes)
+        return WaitPolicy(**settings)
+
+    def apply(self, driver):
+        """Pin this policy's implicit wait on a driver."""
+        set_implicit_wait(driver, self.implicit_wait)
+
+    def __repr__(self):
+        settings = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"WaitPolicy({settings})"
@@ -0,0 +1,72 @@
+"""
+Benchmarks for the potter_api helpers: schema validation over large
+batches and walking the houses endpoint page by page, against the local
+API stand-in (see Scraper/pages/tests/fixtures/potter_api_site.py).
+"""
+
+from Scraper.pages.benchmarks.harness import benchmark, HOUSE_COUNT
+from Scraper.pages.tests.fixtures.potter_api_site import build_books
+
+BOOK_BATCH_SIZE = 100000
+HOUSE_PAGE_SIZE = 25
+
+
+@benchmark("book_schema_validate_100k")
+def book_schema_validate(context):
+    """BookSchema.validate over 100k books, one in ten of them invalid."""
+    from Scraper.pages.tests.potter_api.api_modules import BookSchema
+
+    books = build_books(BOOK_BATCH_SIZE)
+    for book in books[::10]:
+        book["number"] = 9
+        book["pages"] = str(book["pages"])
+        book["cover"] = book["cover"].replace("https://", "http://")
+    expected_invalid = len(books[::10])
+
+    def run():
+        invalid = sum(1 for book in books if BookSchema.validate(book))
+        if invalid != expected_invalid:
+            raise AssertionError(f"Expected {expected_invalid} invalid books, got {invalid}")
+
+    return run
+
+
+@benchmark("book_schema_validate_batch_100k")
+def book_schema_validate_batch(context):
+    """BookSchema.validate_batch over the same 100k books, messages included."""
+    from Scraper.pages.tests.potter_api.api_modules import BookSchema
+
+    books = build_books(BOOK_BATCH_SIZE)
+    for book in books[::10]:
+        book["number"] = 9
+        book["pages"] = str(book["pages"])
+        book["cover"] = book["cover"].replace("https://", "http://")
+    expected_invalid = len(books[::10])
+
+    def run():
+        result = BookSchema.validate_batch(books)
+        invalid = len(result.messages())
+        if invalid != expected_invalid:
+            raise AssertionError(f"Expected {expected_invalid} invalid books, got {invalid}")
+
+    return run
+
+
+@benchmark("house_pagination", requires=("requests",))
+def house_pagination(context):
+    """Walk every house of the API stand-in with the concurrent HousePaginator."""
+    import requests
+    from Scraper.pages.tests.potter_api.api_executor import RequestExecutor
+    from Scraper.pages.tests.potter_api.api_modules import APIConfig
+    from Scraper.pages.tests.potter_api.api_paginator import HousePaginator
+
+    APIConfig.BASE_URL = context.api_url
+    executor = RequestExecutor(requests.Session())
+
+    def run():
+        paginator = HousePaginator(executor, page_size=HOUSE_PAGE_SIZE)
+        seen = sum(1 for _ in paginator)
+        if seen != HOUSE_COUNT or not paginator.report.consistent:
+            raise AssertionError(f"Expected {HOUSE_COUNT} consistent houses, got {paginator.report}")
+
+    return run
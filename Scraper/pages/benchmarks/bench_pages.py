@@ -0,0 +1,125 @@
+"""
+Browser benchmarks for the jemix page objects, run against the local
+fixture site (see Scraper/pages/tests/fixtures/jemix_site.py).
+
+Page objects are imported inside the benchmark functions: settings read
+the fixture site URL from the environment, which the runner sets before
+the benchmark process starts.
+"""
+
+from Scraper.pages.benchmarks.harness import benchmark
+
+# Provider counts the category benchmarks are measured at
+CATEGORY_SIZES = (100, 10000)
+
+
+@benchmark("driver_startup", requires=("selenium",), browser=True, repeat=3, warmup=0)
+def driver_startup(context):
+    """Launch a Chrome session through DriverPool and shut it down."""
+    from Scraper.pages.base.DriverPool import DriverPool
+
+    def run():
+        pool = DriverPool(size=1)
+        try:
+            pool.acquire()
+        finally:
+            pool.close()
+
+    return run
+
+
+@benchmark("home_verify_all_elements", requires=("selenium",), browser=True)
+def home_verify_all_elements(context):
+    """HomePage.verify_all_elements on a loaded home page."""
+    from Scraper.pages.jemix.HomePage import HomePage
+
+    page = HomePage(context.driver())
+    page.navigate_to_home()
+
+    def run():
+        results = page.verify_all_elements()
+        if not all(results.values()):
+            raise AssertionError(f"Home page elements missing: {results}")
+
+    return page.invalidate_snapshot, run
+
+
+def _category_page(context, providers):
+    from Scraper.pages.jemix.CategoryPage import CategoryPage
+
+    page = CategoryPage(context.driver(), context.url(f"/tag/fashion/?providers={providers}"))
+    page.navigate_to_category()
+    return page
+
+
+def _register_category_benchmarks(providers):
+    @benchmark(f"category_get_provider_links_{providers}", requires=("selenium",), browser=True)
+    def get_provider_links(context):
+        """CategoryPage.get_provider_links on a tag page with N providers."""
+        page = _category_page(context, providers)
+
+        def run():
+            links = page.get_provider_links()
+            if len(links) != providers:
+                raise AssertionError(f"Expected {providers} provider links, got {len(links)}")
+
+        return page.invalidate_snapshot, run
+
+    @benchmark(f"category_verify_provider_thumbnails_{providers}", requires=("selenium",), browser=True)
+    def verify_provider_thumbnails(context):
+        """CategoryPage.verify_provider_thumbnails on a tag page with N providers."""
+        page = _category_page(context, providers)
+
+        def run():
+            if not page.verify_provider_thumbnails():
+                raise AssertionError("Provider thumbnails not valid")
+
+        return page.invalidate_snapshot, run
+
+
+for _providers in CATEGORY_SIZES:
+    _register_category_benchmarks(_providers)
+
+
+@benchmark("login_page_login", requires=("selenium",), browser=True)
+def login_page_login(context):
+    """LoginPage.login from a loaded login form to the account dashboard."""
+    from Scraper.config.settings import TEST_USERS
+    from Scraper.pages.jemix.LoginPage import LoginPage
+
+    driver = context.driver()
+    page = LoginPage(driver)
+    user = TEST_USERS["valid_user"]
+
+    def setup():
+        driver.delete_all_cookies()
+        page.navigate_to_login()
+
+    def run():
+        page.login(user["username"], user["password"])
+
+    return setup, run
+
+
+@benchmark("account_page_logout", requires=("selenium",), browser=True)
+def account_page_logout(context):
+    """AccountPage.logout from the dashboard, including the confirmation page."""
+    from Scraper.config.settings import TEST_USERS
+    from Scraper.pages.jemix.AccountPage import AccountPage
+    from Scraper.pages.jemix.LoginPage import LoginPage
+
+    driver = context.driver()
+    login_page = LoginPage(driver)
+    account_page = AccountPage(driver)
+    user = TEST_USERS["valid_user"]
+
+    def setup():
+        driver.delete_all_cookies()
+        login_page.navigate_to_login()
+        login_page.login(user["username"], user["password"])
+
+    def run():
+        if not account_page.logout():
+            raise AssertionError("Logout did not reach the login page")
+
+    return setup, run
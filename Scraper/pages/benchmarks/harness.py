@@ -0,0 +1,333 @@
+"""
+Benchmark harness for the page-object and API hot paths.
+
+Benchmarks register themselves with the @benchmark decorator. Each one
+receives a BenchmarkContext (local fixture site URLs and a lazily started
+browser) and returns either a `run` callable or a `(setup, run)` pair;
+only `run` is timed. Every benchmark is measured over several rounds,
+each in a fresh spawned process, so its peak RSS is not inflated by the
+ones before it and one slow process does not decide the result.
+
+Measured per benchmark:
+    wall_time      median over the rounds of each round's median run
+    wall_time_min  fastest round median
+    wall_time_max  slowest round median
+    commands       WebDriver commands per run (0 for browserless benchmarks),
+                   counted with CommandTracer
+    peak_rss_kb    peak resident set size of a benchmark process (median)
+
+Results are compared against a JSON baseline file:
+    commands     deterministic, so any increase is a regression
+    wall_time    regresses only when the median grows by more than the
+                 threshold AND every round is slower than the slowest
+                 baseline round, so overlapping (noisy) runs never fail
+    peak_rss_kb  regresses when it grows by more than the threshold
+"""
+
+import importlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Scraper.pages.base.CommandTracer import CommandTracer
+
+# Modules whose @benchmark functions make up the suite
+BENCHMARK_MODULES = (
+    "Scraper.pages.benchmarks.bench_pages",
+    "Scraper.pages.benchmarks.bench_api",
+)
+
+# Houses served by the API stand-in the benchmarks run against
+HOUSE_COUNT = 1000
+
+# Wall-time differences below this many seconds are treated as noise
+MIN_WALL_TIME_DELTA = 0.005
+
+# Spawned processes each benchmark is measured in
+DEFAULT_ROUNDS = 5
+
+# Metrics stored in the baseline file
+METRICS = ("wall_time", "wall_time_min", "wall_time_max", "commands", "peak_rss_kb")
+
+BENCHMARKS = {}
+
+
+def benchmark(name, requires=(), browser=False, repeat=5, warmup=1):
+    """
+    Register a benchmark function.
+
+    Args:
+        name (str): Unique benchmark name, used as the baseline key
+        requires (tuple): Importable modules the benchmark needs; it is
+            skipped (not failed) when one is missing
+        browser (bool): The benchmark drives Chrome; it is skipped when
+            no browser daemon is configured and Chrome is not installed
+        repeat (int): Timed runs, the median is reported
+        warmup (int): Untimed runs before measuring
+    """
+    def register(func):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is registered twice")
+        BENCHMARKS[name] = {
+            "func": func,
+            "requires": tuple(requires),
+            "browser": browser,
+            "repeat": repeat,
+            "warmup": warmup,
+            "doc": (func.__doc__ or "").strip().splitlines()[0] if func.__doc__ else ""
+        }
+        return func
+    return register
+
+
+def load_benchmarks():
+    """Import every benchmark module and return the registry."""
+    for module in BENCHMARK_MODULES:
+        importlib.import_module(module)
+    return BENCHMARKS
+
+
+def browser_unavailable():
+    """
+    Why a browser benchmark cannot run here.
+
+    Returns:
+        str: Reason to skip, or None when a daemon or Chrome is available
+    """
+    from Scraper.config.settings import BROWSER_DAEMON
+    from Scraper.pages.base.DriverResolver import ChromeDriverResolver
+    if BROWSER_DAEMON or ChromeDriverResolver.find_chrome_binaries():
+        return None
+    return "Chrome is not installed and no browser daemon is configured"
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class BenchmarkContext:
+    """What a benchmark function gets to work with."""
+
+    def __init__(self, site_url, api_url):
+        """
+        Args:
+            site_url (str): Base URL of the jemix fixture site
+            api_url (str): Base URL of the Harry Potter API stand-in
+        """
+        self.site_url = site_url
+        self.api_url = api_url
+        self.tracer = CommandTracer()
+        self.tracer.enabled = False
+        self._pool = None
+        self._driver = None
+
+    def url(self, path):
+        """Absolute URL of a path on the jemix fixture site."""
+        return f"{self.site_url}/{path.lstrip('/')}"
+
+    def driver(self):
+        """A browser from a private one-slot pool, traced while a run is timed."""
+        if self._driver is None:
+            from Scraper.pages.base.DriverPool import DriverPool
+            self._pool = DriverPool(size=1)
+            self._driver = self._pool.acquire()
+            self.tracer.attach(self._driver)
+        return self._driver
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = self._driver = None
+
+
+def measure(name, site_url, api_url, repeat=None):
+    """
+    Run one benchmark in the current process.
+
+    Args:
+        name (str): Registered benchmark name
+        site_url (str): jemix fixture site URL
+        api_url (str): Harry Potter API stand-in URL
+        repeat (int): Override the benchmark's repeat count
+
+    Returns:
+        dict: name, status ("ok", "skipped" or "error") and the metrics
+    """
+    spec = load_benchmarks()[name]
+    missing = [module for module in spec["requires"] if importlib.util.find_spec(module) is None]
+    if missing:
+        return {"name": name, "status": "skipped", "reason": f"missing {', '.join(missing)}"}
+    reason = spec["browser"] and browser_unavailable()
+    if reason:
+        return {"name": name, "status": "skipped", "reason": reason}
+
+    repeat = repeat or spec["repeat"]
+    context = BenchmarkContext(site_url, api_url)
+    try:
+        steps = spec["func"](context)
+        setup, run = steps if isinstance(steps, tuple) else (None, steps)
+
+        for _ in range(spec["warmup"]):
+            if setup:
+                setup()
+            run()
+
+        durations = []
+        context.tracer.reset()
+        for _ in range(repeat):
+            if setup:
+                setup()
+            context.tracer.enabled = True
+            started = time.perf_counter()
+            run()
+            durations.append(time.perf_counter() - started)
+            context.tracer.enabled = False
+
+        commands = context.tracer.command_counts()
+        return {
+            "name": name,
+            "status": "ok",
+            "wall_time": round(statistics.median(durations), 6),
+            "repeat": repeat,
+            "commands": round(sum(commands.values()) / repeat, 1),
+            "command_breakdown": {
+                command: round(count / repeat, 1)
+                for command, count in commands.most_common()
+            },
+            "page_methods": context.tracer.summary(),
+            "peak_rss_kb": peak_rss_kb()
+        }
+    except Exception as e:
+        return {"name": name, "status": "error", "error": f"{type(e).__name__}: {e}"}
+    finally:
+        context.close()
+
+
+def measure_isolated(name, site_url, api_url, repeat=None):
+    """Run `measure` in a freshly spawned process so peak RSS is per benchmark."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, name, site_url, api_url, repeat).result()
+
+
+def combine_rounds(results):
+    """
+    Merge the results of measuring one benchmark in several processes.
+
+    Args:
+        results (list): Results from `measure`, one per round
+
+    Returns:
+        dict: The first result that did not succeed, otherwise the last
+            result with wall_time, commands and peak_rss_kb replaced by
+            their median over the rounds and the round range added
+    """
+    for result in results:
+        if result["status"] != "ok":
+            return result
+
+    round_times = [result["wall_time"] for result in results]
+    combined = dict(results[-1])
+    combined.update({
+        "wall_time": round(statistics.median(round_times), 6),
+        "wall_time_min": min(round_times),
+        "wall_time_max": max(round_times),
+        "rounds": len(results),
+        "commands": statistics.median(result["commands"] for result in results),
+        "peak_rss_kb": int(statistics.median(result["peak_rss_kb"] for result in results))
+    })
+    return combined
+
+
+def measure_rounds(name, site_url, api_url, rounds=DEFAULT_ROUNDS, repeat=None):
+    """
+    Measure a benchmark in `rounds` separate processes and combine the results.
+    Stops at the first round that is skipped or errors.
+    """
+    results = []
+    for _ in range(rounds):
+        results.append(measure_isolated(name, site_url, api_url, repeat))
+        if results[-1]["status"] != "ok":
+            break
+    return combine_rounds(results)
+
+
+def load_baselines(path):
+    """Read a baseline file, returning an empty mapping if it does not exist."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(path, baselines, results):
+    """
+    Store the metrics of successful results as the new baselines.
+    Benchmarks that did not run keep their previous baseline.
+
+    Args:
+        path (str): Baseline file
+        baselines (dict): Current baselines
+        results (list): Results from `measure`
+    """
+    updated = dict(baselines)
+    for result in results:
+        if result["status"] != "ok":
+            continue
+        entry = {metric: result[metric] for metric in METRICS}
+        entry["python"] = platform.python_version()
+        entry["machine"] = f"{platform.system()} {platform.machine()}"
+        updated[result["name"]] = entry
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(updated.items())), f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(result, baseline, threshold):
+    """
+    Compare a result with its baseline.
+
+    Args:
+        result (dict): Result from `measure_rounds`
+        baseline (dict): Baseline entry for the same benchmark
+        threshold (float): Allowed relative growth of wall_time and
+            peak_rss_kb, 0.25 = 25%
+
+    Returns:
+        list: One message per regressed metric
+    """
+    regressions = []
+
+    def regressed(metric, allowed):
+        previous = baseline.get(metric)
+        current = result.get(metric)
+        if previous is None or current is None or current <= previous * (1 + allowed):
+            return False
+        change = (current / previous - 1) * 100 if previous else float("inf")
+        regressions.append(f"{metric} {previous} -> {current} (+{change:.0f}%)")
+        return True
+
+    regressed("commands", 0)
+    regressed("peak_rss_kb", threshold)
+
+    # Slower only counts when the whole run is outside the baseline's noise
+    slowest_baseline = baseline.get("wall_time_max", baseline.get("wall_time"))
+    fastest_round = result.get("wall_time_min", result.get("wall_time"))
+    if (
+        slowest_baseline is not None and fastest_round is not None
+        and fastest_round > slowest_baseline
+        and result["wall_time"] - baseline["wall_time"] >= MIN_WALL_TIME_DELTA
+        and regressed("wall_time", threshold)
+    ):
+        regressions[-1] += f", fastest round {fastest_round} > slowest baseline round {slowest_baseline}"
+    return regressions
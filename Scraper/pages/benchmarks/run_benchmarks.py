@@ -0,0 +1,123 @@
+"""
+Run the page-object and API benchmarks against local stand-ins and compare
+them with the stored baselines.
+
+Usage (from the project root):
+    python -m Scraper.pages.benchmarks.run_benchmarks
+    python -m Scraper.pages.benchmarks.run_benchmarks --filter category --repeat 10
+    python -m Scraper.pages.benchmarks.run_benchmarks --rounds 9 --update-baseline
+
+Exits with status 1 when a benchmark errors, has no baseline, or regresses
+against baselines.json (see harness.find_regressions for the rules);
+benchmarks whose dependencies are not installed, and browser benchmarks
+on a machine without Chrome or a browser daemon, are reported as skipped.
+Record baselines with --update-baseline on the machine the gate runs on.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from fnmatch import fnmatch
+
+from Scraper.pages.benchmarks.harness import (
+    DEFAULT_ROUNDS, HOUSE_COUNT, find_regressions, load_baselines,
+    load_benchmarks, measure_rounds, save_baselines
+)
+from Scraper.pages.tests.fixtures.jemix_site import JemixFixtureSite
+from Scraper.pages.tests.fixtures.potter_api_site import PotterApiSite
+
+DEFAULT_BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark page-object and API hot paths")
+    parser.add_argument("--filter", default="*", help="Glob or substring selecting benchmarks by name")
+    parser.add_argument("--repeat", type=int, default=None, help="Timed runs per benchmark process")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Processes each benchmark is measured in")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run's metrics as the baseline")
+    parser.add_argument("--output", help="Also write the raw results to this JSON file")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    return parser.parse_args(argv)
+
+
+def select_benchmarks(pattern):
+    names = sorted(load_benchmarks())
+    if not any(char in pattern for char in "*?["):
+        pattern = f"*{pattern}*"
+    return [name for name in names if fnmatch(name, pattern)]
+
+
+def format_result(result, baseline):
+    if result["status"] == "skipped":
+        return f"{result['name']:<45} skipped ({result['reason']})"
+    if result["status"] == "error":
+        return f"{result['name']:<45} ERROR {result['error']}"
+    line = (
+        f"{result['name']:<45} {result['wall_time'] * 1000:>10.1f} ms"
+        f" [{result['wall_time_min'] * 1000:.1f}-{result['wall_time_max'] * 1000:.1f}]"
+        f" {result['commands']:>8} cmds {result['peak_rss_kb'] / 1024:>8.1f} MiB"
+    )
+    if baseline:
+        line += f"  (baseline {baseline['wall_time'] * 1000:.1f} ms, {baseline['commands']} cmds)"
+    else:
+        line += "  (no baseline)"
+    return line
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    names = select_benchmarks(args.filter)
+    if args.list:
+        registry = load_benchmarks()
+        for name in names:
+            print(f"{name:<45} {registry[name]['doc']}")
+        return 0
+    if not names:
+        print(f"No benchmarks match '{args.filter}'")
+        return 1
+
+    baselines = load_baselines(args.baseline)
+    results = []
+    failed = False
+
+    with JemixFixtureSite() as site, PotterApiSite(houses_count=HOUSE_COUNT) as api_site, \
+            tempfile.TemporaryDirectory(prefix="jemix_benchmarks_") as state_dir:
+        # Benchmark processes are spawned, so they pick the stand-ins up from here
+        os.environ.update(site.environment())
+        os.environ["JEMIX_SESSION_STATE_FILE"] = os.path.join(state_dir, "session_state.json")
+
+        for name in names:
+            result = measure_rounds(name, site.url, api_site.api_url, args.rounds, args.repeat)
+            results.append(result)
+            baseline = baselines.get(name)
+            print(format_result(result, baseline))
+
+            if result["status"] == "error":
+                failed = True
+            elif result["status"] != "ok" or args.update_baseline:
+                continue
+            elif not baseline:
+                print("    NO BASELINE record one with --update-baseline")
+                failed = True
+            else:
+                for regression in find_regressions(result, baseline, args.threshold):
+                    print(f"    REGRESSION {regression}")
+                    failed = True
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        save_baselines(args.baseline, baselines, results)
+        print(f"Baselines written to {args.baseline}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
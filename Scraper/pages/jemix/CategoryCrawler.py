@@ -0,0 +1,154 @@
+# CategoryCrawler.py
+# Crawl several category pages in parallel over a pool of browsers
+
+# Example usage
+#from Scraper.pages.jemix.CategoryCrawler import CategoryCrawler
+#from Scraper.config.settings import CATEGORY_PAGES
+#results = CategoryCrawler(workers=3).crawl(CATEGORY_PAGES)
+#for result in results:
+#    print(result['name'], result['result'], result['error'])
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from Scraper.config.settings import CRAWL_WORKERS, CRAWL_LEASE_TIMEOUT
+from Scraper.pages.base.CommandTracer import current_test_id, set_current_test, test_scope
+from Scraper.pages.base.DriverPool import get_driver_pool
+from Scraper.pages.jemix.CategoryPage import CategoryPage
+
+
+def inspect_category(category_page):
+    """Default per-category check, built on the page's provider snapshot
+
+    Args:
+        category_page (CategoryPage): Page already navigated to
+
+    Returns:
+        dict: Provider content summary for the category
+    """
+    has_content = category_page.has_provider_content()
+    providers = category_page.get_provider_links() if has_content else []
+    return {
+        'has_content': has_content,
+        'provider_count': len(providers),
+        'providers': providers,
+        'thumbnails_valid': category_page.verify_provider_thumbnails() if has_content else False
+    }
+
+
+def crawl_category(category, inspect=inspect_category, pool=None, allow=(), lease_timeout=CRAWL_LEASE_TIMEOUT):
+    """Visit one category with a pooled driver and inspect it
+
+    Errors are caught and reported in the result so one broken category
+    or browser never takes the other workers down with it.
+
+    Args:
+        category (dict): Entry from settings.PAGES with 'name' and 'url'
+        inspect (callable): Receives the navigated CategoryPage, returns its result
+        pool (DriverPool): Pool to borrow from (defaults to the shared pool)
+        allow (tuple): Resource groups to load in the fast browser profile
+        lease_timeout (float): Seconds to wait for a free browser
+
+    Returns:
+        dict: name, url, current_url, result, error and duration of the visit
+    """
+    pool = pool or get_driver_pool()
+    outcome = {
+        'name': category['name'],
+        'url': category['url'],
+        'current_url': None,
+        'result': None,
+        'error': None,
+        'duration': 0.0
+    }
+    started = time.monotonic()
+    try:
+        with pool.lease(timeout=lease_timeout, allow=allow) as driver:
+            category_page = CategoryPage(driver, category['url'])
+            category_page.navigate_to_category()
+            outcome['current_url'] = driver.current_url
+            outcome['result'] = inspect(category_page)
+    except queue.Empty:
+        # Every browser stayed busy, e.g. the caller still holds one from a pool of one
+        outcome['error'] = f"No pooled browser became free within {lease_timeout}s"
+    except Exception as e:
+        outcome['error'] = f"{type(e).__name__}: {e}"
+    outcome['duration'] = round(time.monotonic() - started, 3)
+    return outcome
+
+
+class CategoryCrawler:
+    """
+    Spreads category pages over a number of browser workers and returns
+    one result per category, in the same order the categories were given.
+
+    In "thread" mode the workers share the process-wide driver pool, so the
+    effective parallelism is also bounded by JEMIX_DRIVER_POOL_SIZE, minus
+    any browser the caller is still holding. Callers should release their
+    own driver before crawling. In "process" mode every worker process owns
+    its own pool; `inspect` must then be a picklable top-level function.
+
+    Browser commands sent by the workers are traced under the test that
+    called crawl().
+    """
+
+    MODES = ("thread", "process")
+
+    def __init__(self, workers=CRAWL_WORKERS, mode="thread", pool=None, allow=(), lease_timeout=CRAWL_LEASE_TIMEOUT):
+        """
+        Initialize the crawler.
+
+        Args:
+            workers (int): Number of categories visited concurrently
+            mode (str): "thread" or "process"
+            pool (DriverPool): Pool used in thread mode (defaults to the shared pool)
+            allow (tuple): Resource groups to load in the fast browser profile,
+                e.g. ("images",) when `inspect` needs loaded thumbnails
+            lease_timeout (float): Seconds each category waits for a free
+                browser before it is reported as an error
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown crawl mode '{mode}', expected one of {self.MODES}")
+        if workers < 1:
+            raise ValueError(f"Crawler needs at least one worker, got {workers}")
+        self.workers = workers
+        self.mode = mode
+        self.pool = pool
+        self.allow = tuple(allow)
+        self.lease_timeout = lease_timeout
+
+    def crawl(self, categories, inspect=inspect_category):
+        """
+        Visit every category and inspect it.
+
+        Args:
+            categories (list): settings.PAGES style dicts with 'name' and 'url'
+            inspect (callable): Receives each navigated CategoryPage
+
+        Returns:
+            list: Result dicts (see crawl_category), in input order
+        """
+        categories = list(categories)
+        if not categories:
+            return []
+        workers = min(self.workers, len(categories))
+        test_id = current_test_id()
+
+        if self.mode == "process":
+            with ProcessPoolExecutor(max_workers=workers, initializer=set_current_test, initargs=(test_id,)) as executor:
+                count = len(categories)
+                return list(executor.map(
+                    crawl_category, categories, [inspect] * count, [None] * count,
+                    [self.allow] * count, [self.lease_timeout] * count
+                ))
+
+        pool = self.pool or get_driver_pool()
+
+        def visit(category):
+            with test_scope(test_id):
+                return crawl_category(category, inspect, pool, self.allow, self.lease_timeout)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="category-crawler") as executor:
+            # map() yields in submission order regardless of completion order
+            return list(executor.map(visit, categories))
@@ -16,20 +16,100 @@
 
 from selenium.webdriver.common.by import By
 from Scraper.pages.base.BasePage import BasePage
+from Scraper.pages.base.HttpPage import HttpPage
+from Scraper.config.settings import PAGE_BACKEND
 
-class CategoryPage(BasePage):
+class CategoryQueries:
+    """Provider queries shared by the selenium and http category pages
+
+    Both build them on `get_provider_snapshot()`, which returns one dict
+    per provider article.
+    """
     # Element locators
     PROVIDER_ARTICLE = (By.CSS_SELECTOR, "article.elementor-post")
     PROVIDER_LINK = (By.CSS_SELECTOR, "a.elementor-post__thumbnail__link")
     PROVIDER_THUMBNAIL = (By.CSS_SELECTOR, "div.elementor-post__thumbnail img")
 
+    @staticmethod
+    def provider_title(url):
+        """Derive a display title from a provider URL such as /feetfun-coupon/
+        
+        Args:
+            url (str): Provider page URL
+            
+        Returns:
+            str: Provider title (e.g. "Feetfun")
+        """
+        return url.split('/')[-2].replace('-coupon', '').replace('-', ' ').title()
+
+    def _parse_provider_snapshot(self, snapshot):
+        """Add provider titles to the raw script result."""
+        snapshot = snapshot or []
+        for article in snapshot:
+            article['title'] = self.provider_title(article['url']) if article['url'] else None
+        return snapshot
+
+    def get_provider_links(self):
+        """Get all provider links in the category page
+        
+        Returns:
+            list: List of dicts with provider 'url' and 'title'
+        """
+        # Article without link is valid, it is simply not listed
+        return [
+            {'url': article['url'], 'title': article['title']}
+            for article in self.get_provider_snapshot()
+            if article['has_link']
+        ]
+
+    def verify_provider_thumbnails(self):
+        """Verify that provider articles with links have thumbnails
+        
+        Returns:
+            bool: True if all linked articles have thumbnails
+        """
+        for article in self.get_provider_snapshot():
+            # Articles without links can skip thumbnail check
+            if article['has_link'] and article['has_thumbnail'] and not article['thumbnail_src']:
+                return False
+        return True
+
+    def has_provider_content(self):
+        """Check if the category page has any provider content
+        
+        Returns:
+            bool: True if at least one provider article exists
+        """
+        return len(self.get_provider_snapshot()) > 0
+
+class CategoryPage(CategoryQueries, BasePage):
+
+    # Reads every provider article in one round trip. Selectors are passed in
+    # from the locators above so both stay in sync.
+    PROVIDER_SNAPSHOT_SCRIPT = """
+        var articleSelector = arguments[0], linkSelector = arguments[1], thumbSelector = arguments[2];
+        var articles = document.querySelectorAll(articleSelector);
+        var snapshot = [];
+        for (var i = 0; i < articles.length; i++) {
+            var link = articles[i].querySelector(linkSelector);
+            var thumbnail = articles[i].querySelector(thumbSelector);
+            snapshot.push({
+                url: link ? link.href : null,
+                thumbnail_src: thumbnail ? (thumbnail.src || thumbnail.getAttribute('src') || '') : null,
+                has_link: !!link,
+                has_thumbnail: !!thumbnail
+            });
+        }
+        return snapshot;
+    """
+
     def __init__(self, driver, category_url):
         super().__init__(driver)
         self.category_url = category_url
 
     def navigate_to_category(self):
         """Navigate to the category page"""
-        self.driver.get(self.category_url)
+        self.navigate(self.category_url)
 
     def get_item_list(self, item_class_name):
         # Retrieve a list of items (e.g., coupons, products) by class name
@@ -49,49 +129,115 @@ class CategoryPage(BasePage):
         """
         return self.driver.find_elements(*self.PROVIDER_ARTICLE)
 
-    def get_provider_links(self):
-        """Get all provider links in the category page
+    def get_provider_snapshot(self, refresh=False):
+        """Extract every provider article with a single script call
         
+        The result is kept in the page snapshot until the next navigation or
+        mutation, so the other provider queries reuse it instead of querying
+        the articles again.
+        
+        Args:
+            refresh (bool): Re-read the DOM even if a snapshot exists
+            
         Returns:
-            list: List of provider URLs
+            list: One dict per article with url, title, thumbnail_src,
+                has_link and has_thumbnail keys
         """
-        links = []
-        articles = self.get_provider_articles()
-        for article in articles:
-            try:
-                link = article.find_element(*self.PROVIDER_LINK)
-                links.append({
-                    'url': link.get_attribute('href'),
-                    'title': link.get_attribute('href').split('/')[-2].replace('-coupon', '').replace('-', ' ').title()
-                })
-            except:
-                # Article without link is valid, continue to next
-                continue
-        return links
+        if refresh:
+            self.invalidate_snapshot('providers')
+        return self.snapshot(
+            'providers',
+            self.PROVIDER_SNAPSHOT_SCRIPT,
+            self.PROVIDER_ARTICLE[1],
+            self.PROVIDER_LINK[1],
+            self.PROVIDER_THUMBNAIL[1],
+            parse=self._parse_provider_snapshot
+        )
 
-    def verify_provider_thumbnails(self):
-        """Verify that provider articles with links have thumbnails
+class HttpCategoryPage(CategoryQueries):
+    """Category page that reads the server-rendered HTML without a browser
+
+    Provider queries behave like CategoryPage; actions that need a real
+    browser (clicking) only exist on CategoryPage.
+    """
+
+    def __init__(self, category_url, session=None):
+        self.category_url = category_url
+        self.http = HttpPage(session)
+        self._providers = None
+
+    def navigate_to_category(self):
+        """Fetch and parse the category page"""
+        self.http.fetch(self.category_url)
+        self._providers = None
+
+    def get_current_url(self):
+        """URL of the fetched page after redirects"""
+        return self.http.current_url
+
+    def _document(self):
+        if self.http.document is None:
+            self.navigate_to_category()
+        return self.http.document
+
+    def get_item_list(self, item_class_name):
+        return self._document().select(f".{item_class_name}")
+
+    def get_provider_articles(self):
+        return self._document().select(self.PROVIDER_ARTICLE[1])
+
+    @staticmethod
+    def _url_property(document, element, attribute):
+        """Read a URL attribute the way the DOM property (a.href, img.src) would"""
+        if element is None:
+            return None
+        value = element.attributes.get(attribute)
+        # Missing or empty attributes read as '' rather than the page URL
+        return document.absolute_url(value) if value else ''
+
+    def get_provider_snapshot(self, refresh=False):
+        """Extract every provider article from the parsed HTML
         
+        Args:
+            refresh (bool): Re-fetch the page before extracting
+            
         Returns:
-            bool: True if all linked articles have thumbnails
+            list: Same dicts as CategoryPage.get_provider_snapshot
         """
-        articles = self.get_provider_articles()
-        for article in articles:
-            try:
-                link = article.find_element(*self.PROVIDER_LINK)
-                # If there's a link, there should be a thumbnail
-                thumbnail = article.find_element(*self.PROVIDER_THUMBNAIL)
-                if not thumbnail.get_attribute('src'):
-                    return False
-            except:
-                # Articles without links can skip thumbnail check
-                continue
-        return True
+        if refresh:
+            self.navigate_to_category()
+        if self._providers is None:
+            document = self._document()
+            snapshot = []
+            for article in document.select(self.PROVIDER_ARTICLE[1]):
+                link = article.css_first(self.PROVIDER_LINK[1])
+                thumbnail = article.css_first(self.PROVIDER_THUMBNAIL[1])
+                snapshot.append({
+                    'url': self._url_property(document, link, 'href'),
+                    'thumbnail_src': self._url_property(document, thumbnail, 'src'),
+                    'has_link': link is not None,
+                    'has_thumbnail': thumbnail is not None
+                })
+            self._providers = self._parse_provider_snapshot(snapshot)
+        return self._providers
 
-    def has_provider_content(self):
-        """Check if the category page has any provider content
+
+def create_category_page(category_url, driver=None, backend=None):
+    """Build a category page object for the requested backend
+    
+    Args:
+        category_url (str): URL of the category page
+        driver (WebDriver): Driver for the selenium backend
+        backend (str): "selenium" or "http" (defaults to settings.PAGE_BACKEND)
         
-        Returns:
-            bool: True if at least one provider article exists
-        """
-        return len(self.get_provider_articles()) > 0
\ No newline at end of file
+    Returns:
+        CategoryQueries: A CategoryPage or HttpCategoryPage
+    """
+    backend = backend or PAGE_BACKEND
+    if backend == "http":
+        return HttpCategoryPage(category_url)
+    if backend == "selenium":
+        if driver is None:
+            raise ValueError("The selenium backend needs a WebDriver")
+        return CategoryPage(driver, category_url)
+    raise ValueError(f"Unknown page backend '{backend}'")
@@ -2,10 +2,11 @@
 
 from selenium.webdriver.common.by import By
 from Scraper.pages.base.BasePage import BasePage
+from Scraper.config import settings
 
 class HomePage(BasePage):
     # Page URL
-    HOME_URL = "https://www.jemix.co.il/"
+    HOME_URL = settings.HOME_URL
 
     # Element locators using Elementor-specific classes from the site
     HOME_ELEMENTS = {
@@ -25,7 +26,7 @@ class HomePage(BasePage):
 
     def navigate_to_home(self):
         """Navigate to the homepage"""
-        self.driver.get(self.HOME_URL)
+        self.navigate(self.HOME_URL)
 
     def verify_element_presence(self, element_key):
         """Verify if a specific element is present and visible
@@ -46,13 +47,25 @@ class HomePage(BasePage):
             print(f"Failed to verify element '{element_key}': {str(e)}")
             return False
 
-    def verify_all_elements(self):
+    def verify_all_elements(self, timeout=None):
         """Verify all home page elements are present and visible
         
+        All elements are waited for together, so missing elements cost one
+        timeout in total instead of one timeout each.
+        
+        Args:
+            timeout (int): Maximum time to wait for the elements in seconds
+                (defaults to the page's wait policy)
+            
         Returns:
             dict: Dictionary with element keys and their visibility status
         """
-        return {key: self.verify_element_presence(key) for key in self.HOME_ELEMENTS}
+        timeout = self.resolve_timeout(timeout)
+        status = self.wait_for_all(self.HOME_ELEMENTS, timeout=timeout)
+        for element_key, is_visible in status.items():
+            if not is_visible:
+                print(f"Failed to verify element '{element_key}': not visible within {timeout}s")
+        return status
 
     def click_login(self):
         """Click the login button"""
@@ -1,13 +1,20 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from Scraper.pages.base.BasePage import BasePage
+from Scraper.pages.base.WaitPolicy import WaitPolicy
+from Scraper.config import settings
+from Scraper.config.settings import ACCOUNT_DASHBOARD_URL, LOGIN_TIMEOUT
+import logging
 import time
 
 class LoginPage(BasePage):
     """Page object for the Login page with updated element locators for Ultimate Member form."""
     
-    LOGIN_URL = "https://www.jemix.co.il/login/"
+    LOGIN_URL = settings.LOGIN_URL
+
+    # Check readiness more often than the default while logging in
+    WAIT_POLICY = WaitPolicy(poll_frequency=0.1)
     
     # Updated element locators for Ultimate Member form
     LOGIN_ELEMENTS = {
@@ -29,69 +36,139 @@ class LoginPage(BasePage):
         )
     }
 
+    def __init__(self, driver):
+        """Initialize the LoginPage with a WebDriver instance."""
+        super().__init__(driver)
+        self.logger = logging.getLogger(__name__)
+        self.last_login_timings = {}
+
     def navigate_to_login(self):
         """Navigate to the login page and wait for form to load."""
-        self.driver.get(self.LOGIN_URL)
+        self.navigate(self.LOGIN_URL)
         # Wait for the login form to be present and visible
-        form = self.wait_for_element(self.LOGIN_ELEMENTS["login_form"])
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of(form)
+        self.wait_for_visible(self.LOGIN_ELEMENTS["login_form"])
+
+    def _remaining(self, deadline, phase):
+        """Seconds left before the login deadline, failing fast once it has passed."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f"Login deadline exceeded before phase '{phase}'")
+        return remaining
+
+    def _wait_phase(self, phase, deadline, timings, wait, *args):
+        """
+        Run one of the page's waits within what is left of the deadline
+        and record how long the phase took.
+
+        Args:
+            phase (str): Name the phase's time is recorded under
+            deadline (float): time.monotonic() the whole login must finish by
+            timings (dict): Seconds per phase, updated in place
+            wait (callable): BasePage wait helper taking a `timeout` keyword
+            *args: The wait's other arguments
+        """
+        started = time.monotonic()
+        timeout = self._remaining(deadline, phase)
+        try:
+            return wait(*args, timeout=timeout)
+        except TimeoutException as e:
+            raise TimeoutException(f"Login phase '{phase}' did not complete") from e
+        finally:
+            timings[phase] = round(time.monotonic() - started, 3)
+
+    def _fill_field(self, phase, locator, value, deadline, timings):
+        """Type into a field once it is clickable and wait until it holds the value."""
+        field = self._wait_phase(phase, deadline, timings, self.wait_until, EC.element_to_be_clickable(locator))
+        field.clear()
+        field.send_keys(value)
+        self._wait_phase(
+            f"{phase}_accepted",
+            deadline,
+            timings,
+            self.wait_until,
+            lambda driver: field.get_attribute("value") == value
         )
 
-    def login(self, username, password):
+    def login(self, username, password, timeout=LOGIN_TIMEOUT, expected_url=ACCOUNT_DASHBOARD_URL):
         """
         Perform login with the given credentials.
+
+        Every step waits on an explicit readiness signal instead of a fixed
+        sleep, and all steps share a single deadline.
         
         Args:
             username (str): User's email/username
             password (str): User's password
+            timeout (float): Total seconds allowed for the whole login
+            expected_url (str): URL the redirect must settle on, or None to
+                stop once the browser has left the login page
+
+        Returns:
+            dict: Seconds spent in each phase, also kept in `last_login_timings`
+
+        Raises:
+            TimeoutException: If a phase does not complete before the deadline
         """
+        deadline = time.monotonic() + timeout
+        timings = {}
+        self.last_login_timings = timings
         try:
-            # Wait for and enter username
-            username_field = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.LOGIN_ELEMENTS["username_field"])
-            )
-            username_field.clear()
-            username_field.send_keys(username)
-            
-            # Small wait between fields
-            time.sleep(1)
-            
-            # Wait for and enter password
-            password_field = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.LOGIN_ELEMENTS["password_field"])
-            )
-            password_field.clear()
-            password_field.send_keys(password)
-            
-            # Small wait before clicking
-            time.sleep(1)
-            
-            # Wait for button to be clickable and click
-            login_button = WebDriverWait(self.driver, 10).until(
+            # Wait for each field to accept input
+            self._fill_field("username", self.LOGIN_ELEMENTS["username_field"], username, deadline, timings)
+            self._fill_field("password", self.LOGIN_ELEMENTS["password_field"], password, deadline, timings)
+
+            # Wait for button to be clickable and submit the form
+            login_button = self._wait_phase(
+                "submit_ready",
+                deadline,
+                timings,
+                self.wait_until,
                 EC.element_to_be_clickable(self.LOGIN_ELEMENTS["login_button"])
             )
-            
-            # Try direct click first
             try:
                 login_button.click()
-            except:
+            except WebDriverException:
                 # If direct click fails, try JavaScript click
                 self.driver.execute_script("arguments[0].click();", login_button)
-            
-            # Add a longer wait after form submission
-            time.sleep(5)  # Increase from 3 to 5 seconds
-            
-            # Wait for URL change
-            WebDriverWait(self.driver, 10).until(
+
+            # The browser leaves the login page once the form is accepted
+            self._wait_phase(
+                "leave_login",
+                deadline,
+                timings,
+                self.wait_until,
                 lambda driver: driver.current_url != self.LOGIN_URL
             )
-            
-            # Additional wait for page load
-            time.sleep(4)  # Increase from 2 to 4 seconds
-            
-        except Exception as e:
+
+            # Wait for the page we landed on to finish loading
+            self._wait_phase(
+                "document_ready",
+                deadline,
+                timings,
+                self.wait_until,
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+
+            # Wait for any intermediate redirects (like wp-login.php) to settle
+            if expected_url:
+                self._wait_phase(
+                    "redirect_settled",
+                    deadline,
+                    timings,
+                    self.wait_for_url,
+                    "equals",
+                    expected_url
+                )
+
+            timings["total"] = round(timeout - (deadline - time.monotonic()), 3)
+            self.logger.info("Login phase timings: %s", timings)
+            return timings
+
+        except Exception:
+            self.logger.warning("Login failed, phase timings so far: %s", timings)
             # Log the page source for debugging
-            print("Page source at time of error:")
-            print(self.driver.page_source)
-            raise e
+            try:
+                self.logger.debug("Page source at time of error:\n%s", self.driver.page_source)
+            except WebDriverException:
+                pass
+            raise
@@ -14,14 +14,26 @@
 
 from selenium.webdriver.common.by import By
 from Scraper.pages.base.BasePage import BasePage
+from Scraper.pages.base.HttpPage import HttpPage, element_text
+from Scraper.config.settings import PAGE_BACKEND
 
 class ProviderPage(BasePage):
+    # Reads the text of every element with a given class in one round trip
+    CLASS_TEXT_SCRIPT = """
+        var elements = document.getElementsByClassName(arguments[0]);
+        var texts = [];
+        for (var i = 0; i < elements.length; i++) {
+            texts.push((elements[i].innerText || '').trim());
+        }
+        return texts;
+    """
+
     def __init__(self, driver, provider_url):
         super().__init__(driver)
         self.provider_url = provider_url
 
     def navigate_to_provider(self):
-        self.driver.get(self.provider_url)
+        self.navigate(self.provider_url)
 
     def get_coupon_list(self, coupon_class_name):
         # Retrieve a list of coupon elements by class name
@@ -34,9 +46,13 @@ class ProviderPage(BasePage):
         self.click(coupon_locator)
 
     def get_coupon_details(self, detail_class_name):
-        # Retrieve details of a coupon, such as description or discount
-        detail_locator = (By.CLASS_NAME, detail_class_name)
-        return [element.text for element in self.driver.find_elements(*detail_locator)]
+        # Retrieve details of a coupon, such as description or discount,
+        # from the page snapshot instead of one text request per element
+        return self.snapshot(
+            f"coupon_details:{detail_class_name}",
+            self.CLASS_TEXT_SCRIPT,
+            detail_class_name
+        )
 
     def apply_coupon(self, coupon_code):
         # Example method to apply a coupon code, assuming there's an input field
@@ -44,3 +60,39 @@ class ProviderPage(BasePage):
         self.enter_text(coupon_input_locator, coupon_code)
         apply_button_locator = (By.ID, "apply-coupon-button")  # Replace with actual ID
         self.click(apply_button_locator)
+
+
+class HttpProviderPage:
+    # Provider page that reads the server-rendered HTML without a browser.
+    # Coupon reads behave like ProviderPage; clicking and typing only exist
+    # on ProviderPage.
+    def __init__(self, provider_url, session=None):
+        self.provider_url = provider_url
+        self.http = HttpPage(session)
+
+    def navigate_to_provider(self):
+        self.http.fetch(self.provider_url)
+
+    def _document(self):
+        if self.http.document is None:
+            self.navigate_to_provider()
+        return self.http.document
+
+    def get_coupon_list(self, coupon_class_name):
+        return self._document().select(f".{coupon_class_name}")
+
+    def get_coupon_details(self, detail_class_name):
+        return [element_text(element) for element in self._document().select(f".{detail_class_name}")]
+
+
+def create_provider_page(provider_url, driver=None, backend=None):
+    # Build a provider page object for "selenium" or "http"
+    # (defaults to settings.PAGE_BACKEND)
+    backend = backend or PAGE_BACKEND
+    if backend == "http":
+        return HttpProviderPage(provider_url)
+    if backend == "selenium":
+        if driver is None:
+            raise ValueError("The selenium backend needs a WebDriver")
+        return ProviderPage(driver, provider_url)
+    raise ValueError(f"Unknown page backend '{backend}'")
@@ -0,0 +1,285 @@
+"""
+Offline fixture site that mirrors the jemix Elementor markup.
+
+Serves generated pages with the same structure the page objects rely on,
+so page-object behaviour and performance can be measured without the
+network and at any provider count:
+
+    /                         HomePage (header, nav, main content, footer, category links)
+    /login/                   LoginPage form (user-955ddae / password-955ddae)
+    /wp-login.php             Login POST, logout confirmation (wp-die) and logout
+    /account/                 AccountPage dashboard with the logout button
+    /tag/<slug>/              CategoryPage with N article.elementor-post entries
+                              (?providers=N overrides the site default)
+    /<provider>-coupon/       ProviderPage with coupon entries
+
+Run it standalone and point the suites at it:
+    python -m Scraper.pages.tests.fixtures.jemix_site --port 8800 --providers 100
+    export JEMIX_SITE_URL=http://127.0.0.1:8800
+    python Scraper/pages/tests/jemix/execute_tests.py
+
+Or from Python (set the environment before importing Scraper.config.settings):
+    with JemixFixtureSite(providers_per_page=10000) as site:
+        os.environ.update(site.environment())
+"""
+
+import argparse
+import html
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from Scraper.config.settings import TEST_USERS
+
+SESSION_COOKIE = "wordpress_logged_in_fixture"
+LOGOUT_LABEL = "התנתקות"
+
+# 1x1 transparent PNG used for every thumbnail
+PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="he" dir="rtl">
+<head><meta charset="utf-8"><title>{title} - jemix</title></head>
+<body class="elementor-page">
+<header class="elementor-location-header">
+  <nav><ul id="menu-1-110e30f">
+    <li class="menu-item menu-item-type-post_type menu-item-object-page menu-item-10688"><a href="/">Home</a></li>
+    <li class="menu-item"><a href="/login/">Login</a></li>
+  </ul></nav>
+</header>
+<main class="elementor-section-wrap"><div class="elementor-element-populated">
+{body}
+</div></main>
+<footer class="elementor-location-footer"><p>jemix fixture site</p></footer>
+</body>
+</html>"""
+
+
+class JemixFixtureSite:
+    """Threaded local HTTP server generating jemix-like pages."""
+
+    CATEGORY_SLUGS = (
+        "electronics-and-technology", "food", "fashion", "shopping", "travel",
+        "pet", "beauty", "entertainment", "sport"
+    )
+
+    def __init__(self, host="127.0.0.1", port=0, providers_per_page=10, users=None):
+        """
+        Initialize the site (call start() to serve it).
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free one
+            providers_per_page (int): Provider articles on each tag page
+            users (dict): username -> password accepted by the login form
+                (defaults to settings.TEST_USERS)
+        """
+        self.providers_per_page = providers_per_page
+        self.users = users or {user["username"]: user["password"] for user in TEST_USERS.values()}
+        self.sessions = set()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def environment(self):
+        """Environment variables that point settings at this site."""
+        return {"JEMIX_SITE_URL": self.url, "JEMIX_BASE_URL": self.url}
+
+    def start(self):
+        """Serve in a background thread and return the site URL."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="jemix-fixture-site", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Page generation
+
+    def home_page(self):
+        links = "\n".join(
+            f'  <a class="elementor-button" href="/tag/{slug}/">{slug.replace("-", " ").title()}</a>'
+            for slug in self.CATEGORY_SLUGS
+        )
+        return PAGE_TEMPLATE.format(title="Home", body=f'<section class="categories">\n{links}\n</section>')
+
+    def login_page(self, failed=False):
+        error = '<p class="login-error">Invalid credentials</p>' if failed else ""
+        body = f"""{error}
+<form class="elementor-login elementor-form" method="post" action="/wp-login.php">
+  <input type="text" name="log" id="user-955ddae" class="elementor-field">
+  <input type="password" name="pwd" id="password-955ddae" class="elementor-field">
+  <button type="submit" name="wp-submit" class="elementor-button">Login</button>
+</form>"""
+        return PAGE_TEMPLATE.format(title="Login", body=body)
+
+    def account_page(self):
+        body = f"""<h1>My account</h1>
+<a class="elementor-button" href="/wp-login.php?action=logout">
+  <span class="elementor-button-content-wrapper"><span class="elementor-button-text">{LOGOUT_LABEL}</span></span>
+</a>"""
+        return PAGE_TEMPLATE.format(title="Account", body=body)
+
+    @staticmethod
+    def logout_confirm_page():
+        return """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Log out - jemix</title></head>
+<body id="error-page"><div class="wp-die-message">
+<p>Do you really want to log out?</p>
+<p><a href="/wp-login.php?action=logout&amp;_wpnonce=fixture">log out</a></p>
+</div></body></html>"""
+
+    def category_page(self, slug, count):
+        # Built with a single join so 10k-provider pages stay cheap to serve
+        slug = html.escape(slug)
+        articles = []
+        for index in range(count):
+            name = f"{slug}-provider-{index}"
+            articles.append(
+                f'<article class="elementor-post elementor-grid-item post-{index}">'
+                f'<a class="elementor-post__thumbnail__link" href="/{name}-coupon/">'
+                f'<div class="elementor-post__thumbnail"><img src="/img/{name}.png" alt="{name}"></div></a>'
+                f'<div class="elementor-post__text"><h3 class="elementor-post__title">{name}</h3></div>'
+                f'</article>'
+            )
+        body = (
+            f'<h1>{slug}</h1>\n'
+            f'<div class="elementor-posts-container elementor-posts">\n' + "\n".join(articles) + '\n</div>'
+        )
+        return PAGE_TEMPLATE.format(title=slug, body=body)
+
+    @staticmethod
+    def provider_page(name):
+        coupons = "\n".join(
+            f'<div class="coupon"><span class="coupon-code">{name.upper()}{index}</span>'
+            f'<p class="coupon-description">{index * 5 + 10}% off at {name}</p></div>'
+            for index in range(3)
+        )
+        return PAGE_TEMPLATE.format(title=name, body=f'<h1>{html.escape(name)}</h1>\n{coupons}')
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=()):
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def _redirect(self, location, headers=()):
+                self._send(302, headers=[("Location", location), *headers])
+
+            def _logged_in(self):
+                for part in self.headers.get("Cookie", "").split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == SESSION_COOKIE and value in site.sessions:
+                        return value
+                return None
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                path, query = parts.path, parse_qs(parts.query)
+
+                if path == "/":
+                    return self._send(200, site.home_page())
+                if path == "/robots.txt":
+                    return self._send(200, "User-agent: *\n", "text/plain")
+                if path == "/login/":
+                    return self._send(200, site.login_page(failed="login" in query))
+                if path == "/account/":
+                    if not self._logged_in():
+                        return self._redirect("/login/")
+                    return self._send(200, site.account_page())
+                if path == "/wp-login.php" and query.get("action") == ["logout"]:
+                    if "_wpnonce" not in query:
+                        return self._send(200, site.logout_confirm_page())
+                    site.sessions.discard(self._logged_in())
+                    return self._redirect(
+                        "/login/?loggedout=true",
+                        [("Set-Cookie", f"{SESSION_COOKIE}=; Path=/; Max-Age=0")]
+                    )
+                if path.startswith("/tag/") and path.endswith("/"):
+                    slug = path[len("/tag/"):-1]
+                    count = int(query.get("providers", [site.providers_per_page])[0])
+                    return self._send(200, site.category_page(slug, count))
+                if path.startswith("/img/"):
+                    return self._send(200, PIXEL_PNG, "image/png", [("Cache-Control", "public, max-age=86400")])
+                if path.endswith("-coupon/"):
+                    return self._send(200, site.provider_page(path.strip("/")[:-len("-coupon")]))
+                return self._send(404, PAGE_TEMPLATE.format(title="Not found", body="<h1>404</h1>"))
+
+            def do_POST(self):
+                if urlsplit(self.path).path != "/wp-login.php":
+                    return self._send(405, "")
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                username = form.get("log", [""])[0]
+                password = form.get("pwd", [""])[0]
+                if site.users.get(username) != password:
+                    return self._redirect("/login/?login=failed")
+                token = secrets.token_hex(16)
+                site.sessions.add(token)
+                return self._redirect(
+                    "/account/",
+                    [("Set-Cookie", f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; Max-Age=86400")]
+                )
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the offline jemix fixture site")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--providers", type=int, default=10, help="Provider articles per tag page")
+    args = parser.parse_args()
+
+    site = JemixFixtureSite(args.host, args.port, providers_per_page=args.providers)
+    print(f"Serving jemix fixture site at {site.url}")
+    for name, value in site.environment().items():
+        print(f"export {name}={value}")
+    site.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
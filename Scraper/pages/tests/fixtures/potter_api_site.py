@@ -0,0 +1,242 @@
+"""
+Offline stand-in for the Harry Potter API (potterapi-fedeperin.vercel.app).
+
+Serves /<lang>/books and /<lang>/houses with the same shapes, query
+parameters (index, max, page, search) and caching headers as the real API,
+plus optional synthetic records so large responses and long pagination can
+be exercised locally.
+
+Run it standalone:
+    python -m Scraper.pages.tests.fixtures.potter_api_site --port 8801 --houses 1000
+
+Or from Python, pointing APIConfig at it:
+    with PotterApiSite(books_count=100000) as site:
+        APIConfig.BASE_URL = site.api_url
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+BOOKS = [
+    (1, "Harry Potter and the Sorcerer's Stone", "Harry Potter and the Philosopher's Stone", "Jun 26, 1997", 223),
+    (2, "Harry Potter and the Chamber of Secrets", "Harry Potter and the Chamber of Secrets", "Jul 2, 1998", 251),
+    (3, "Harry Potter and the Prisoner of Azkaban", "Harry Potter and the Prisoner of Azkaban", "Jul 8, 1999", 317),
+    (4, "Harry Potter and the Goblet of Fire", "Harry Potter and the Goblet of Fire", "Jul 8, 2000", 636),
+    (5, "Harry Potter and the Order of the Phoenix", "Harry Potter and the Order of the Phoenix", "Jun 21, 2003", 766),
+    (6, "Harry Potter and the Half-Blood Prince", "Harry Potter and the Half-Blood Prince", "Jul 16, 2005", 607),
+    (7, "Harry Potter and the Deathly Hallows", "Harry Potter and the Deathly Hallows", "Jul 21, 2007", 607),
+    (8, "Harry Potter and the Cursed Child", "Harry Potter and the Cursed Child", "Jul 30, 2016", 336),
+]
+
+HOUSES = [
+    {"house": "Gryffindor", "emoji": "🦁", "founder": "Godric Gryffindor", "colors": ["red", "gold"], "animal": "Lion"},
+    {"house": "Hufflepuff", "emoji": "🦡", "founder": "Helga Hufflepuff", "colors": ["yellow", "black"], "animal": "Badger"},
+    {"house": "Ravenclaw", "emoji": "🦅", "founder": "Rowena Ravenclaw", "colors": ["blue", "bronze"], "animal": "Raven"},
+    {"house": "Slytherin", "emoji": "🐍", "founder": "Salazar Slytherin", "colors": ["green", "silver"], "animal": "Snake"},
+]
+
+
+def build_books(count=len(BOOKS)):
+    """
+    Book records in API shape; the first eight are the real books, the rest
+    are synthetic copies with consistent fields.
+
+    Args:
+        count (int): Number of books to generate
+
+    Returns:
+        list: Book dicts
+    """
+    books = []
+    for index in range(count):
+        number, title, original, released, pages = BOOKS[index % len(BOOKS)]
+        books.append({
+            "number": number,
+            "title": title if index < len(BOOKS) else f"{title} (copy {index})",
+            "originalTitle": original,
+            "releaseDate": released,
+            "description": f"Book {number} of the series.",
+            "pages": pages,
+            "cover": f"https://raw.githubusercontent.com/fedeperin/potterapi/main/public/images/covers/{number}.png",
+            "index": number - 1
+        })
+    return books
+
+
+def build_houses(count=len(HOUSES)):
+    """
+    House records in API shape; the first four are the real houses, the
+    rest are synthetic ones with unique names.
+
+    Args:
+        count (int): Number of houses to generate
+
+    Returns:
+        list: House dicts
+    """
+    houses = []
+    for index in range(count):
+        house = dict(HOUSES[index % len(HOUSES)])
+        if index >= len(HOUSES):
+            house["house"] = f"{house['house']} {index}"
+        house["index"] = index
+        houses.append(house)
+    return houses
+
+
+class PotterApiSite:
+    """Threaded local HTTP server answering like the Harry Potter API."""
+
+    def __init__(self, host="127.0.0.1", port=0, books_count=len(BOOKS), houses_count=len(HOUSES), lang="en"):
+        """
+        Initialize the site (call start() to serve it).
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free one
+            books_count (int): Number of books served by /books
+            houses_count (int): Number of houses served by /houses
+            lang (str): Language prefix of the endpoints
+        """
+        self.lang = lang
+        self.books = build_books(books_count)
+        self.houses = build_houses(houses_count)
+        self.last_modified = formatdate(usegmt=True)
+        self.request_count = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        """Value for APIConfig.BASE_URL."""
+        return f"{self.url}/{self.lang}"
+
+    def start(self):
+        """Serve in a background thread and return the API base URL."""
+        threading.Thread(target=self._server.serve_forever, name="potter-api-site", daemon=True).start()
+        return self.api_url
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @staticmethod
+    def query(records, params):
+        """
+        Apply the API's query parameters to a list of records.
+
+        Args:
+            records (list): Books or houses
+            params (dict): Parsed query string
+
+        Returns:
+            tuple: (HTTP status, JSON-serialisable body)
+        """
+        if "index" in params:
+            try:
+                index = int(params["index"][0])
+            except ValueError:
+                return 400, {"error": "index must be a number"}
+            matches = [record for record in records if record.get("index") == index]
+            if not matches:
+                return 404, {"error": f"No element with index {index}"}
+            return 200, matches
+
+        search = params.get("search", [""])[0].lower()
+        if search:
+            records = [
+                record for record in records
+                if search in json.dumps(record, ensure_ascii=False).lower()
+            ]
+
+        try:
+            size = int(params["max"][0]) if "max" in params else None
+            page = int(params["page"][0]) if "page" in params else 0
+        except ValueError:
+            return 200, records
+        if size is not None and size > 0:
+            records = records[size * page:size * (page + 1)]
+        return 200, records
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                site.request_count += 1
+                parts = urlsplit(self.path)
+                endpoint = parts.path.rstrip("/")
+                collections = {f"/{site.lang}/books": site.books, f"/{site.lang}/houses": site.houses}
+                if endpoint not in collections:
+                    status, payload = 404, {"error": "Not found"}
+                else:
+                    status, payload = site.query(collections[endpoint], parse_qs(parts.query))
+
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", CACHE_CONTROL)
+                    self.end_headers()
+                    return
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", CACHE_CONTROL)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", site.last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the offline Harry Potter API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8801)
+    parser.add_argument("--books", type=int, default=len(BOOKS), help="Number of books served")
+    parser.add_argument("--houses", type=int, default=len(HOUSES), help="Number of houses served")
+    args = parser.parse_args()
+
+    site = PotterApiSite(args.host, args.port, books_count=args.books, houses_count=args.houses)
+    print(f"Serving Harry Potter API stand-in at {site.api_url}")
+    site.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
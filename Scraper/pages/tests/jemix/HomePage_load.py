@@ -10,47 +10,18 @@ Test Cases:
 """
 
 import unittest
-import platform
-import os
-import tempfile
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from ....pages.base.DriverPool import get_driver_pool
 from ....pages.jemix.HomePage import HomePage
 from ....config.settings import BASE_URL
 
 class TestHomePageLoad(unittest.TestCase):
     """Test suite for HomePage loading functionality."""
 
-    @classmethod
-    def setUpClass(cls):
-        cls.temp_dir = tempfile.mkdtemp()
-        cls.user_data_dir = os.path.join(cls.temp_dir, "chrome_test_profile")
-
     def setUp(self):
         try:
-            # Setup Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
-            chrome_options.add_argument("--no-first-run")
-            chrome_options.add_argument("--no-default-browser-check")
-            chrome_options.add_argument("--start-maximized")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-
-            # Use headless mode in WSL or CI environments
-            if platform.system() == "Linux" and "microsoft" in platform.uname().release.lower():
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--headless=new")
-
-            # Initialize Chrome driver with automatic ChromeDriver management
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
+            # Borrow a clean browser from the shared pool
+            self.driver = get_driver_pool().acquire()
             self.home_page = HomePage(self.driver)
 
         except Exception as e:
@@ -83,18 +54,7 @@ class TestHomePageLoad(unittest.TestCase):
 
     def tearDown(self):
         if hasattr(self, 'driver'):
-            try:
-                self.driver.quit()
-            except Exception:
-                pass
-
-    @classmethod
-    def tearDownClass(cls):
-        import shutil
-        try:
-            shutil.rmtree(cls.temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+            get_driver_pool().release(self.driver)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -10,15 +10,9 @@ Test Cases:
 """
 
 import unittest
-import platform
-import os
-import tempfile
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 
+from ....pages.base.DriverPool import get_driver_pool
 from ....pages.jemix.LoginPage import LoginPage
 from ....pages.jemix.AccountPage import AccountPage
 from ....config.settings import TEST_USERS, ACCOUNT_DASHBOARD_URL
@@ -26,40 +20,10 @@ from ....config.settings import TEST_USERS, ACCOUNT_DASHBOARD_URL
 class TestLogin(unittest.TestCase):
     """Test suite for Login functionality."""
 
-    @classmethod
-    def setUpClass(cls):
-        cls.temp_dir = tempfile.mkdtemp()
-        cls.user_data_dir = os.path.join(cls.temp_dir, "chrome_test_profile")
-
     def setUp(self):
         try:
-            # Setup Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
-            chrome_options.add_argument("--no-first-run")
-            chrome_options.add_argument("--no-default-browser-check")
-            chrome_options.add_argument("--start-maximized")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            # Enable logging
-            chrome_options.add_argument("--enable-logging")
-            chrome_options.add_argument("--v=1")
-
-            # Use headless mode in WSL or CI environments
-            if platform.system() == "Linux" and "microsoft" in platform.uname().release.lower():
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--headless=new")
-
-            # Initialize Chrome driver with automatic ChromeDriver management
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
-            
-            # Set implicit wait time
-            self.driver.implicitly_wait(10)
+            # Borrow a clean browser from the shared pool
+            self.driver = get_driver_pool().acquire()
             
             # Initialize page objects
             self.login_page = LoginPage(self.driver)
@@ -92,23 +56,15 @@ class TestLogin(unittest.TestCase):
                 f"Expected URL {ACCOUNT_DASHBOARD_URL}, but got {current_url}"
             )
 
+            # Let other tests reuse this session instead of logging in again
+            self.account_page.remember_session(test_user["username"])
+
         except Exception as e:
             raise
 
     def tearDown(self):
         if hasattr(self, 'driver'):
-            try:
-                self.driver.quit()
-            except Exception:
-                pass
-
-    @classmethod
-    def tearDownClass(cls):
-        import shutil
-        try:
-            shutil.rmtree(cls.temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+            get_driver_pool().release(self.driver)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
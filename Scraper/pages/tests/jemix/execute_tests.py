@@ -1,6 +1,8 @@
+import argparse
 import unittest
 import sys
 from test_utils import ResultFileWriter
+from Scraper.pages.tests.parallel_runner import add_runner_arguments, run_with_arguments
 from Scraper.pages.tests.jemix.HomePage_load import TestHomePageLoad
 from Scraper.pages.tests.jemix.LoginPage_test import TestLogin
 from Scraper.pages.tests.jemix.test_logout import TestLogout
@@ -8,6 +10,10 @@ from Scraper.pages.tests.jemix.test_main_navigation import TestMainNavigation
 from Scraper.pages.tests.jemix.test_category_navigation import TestCategoryNavigation
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the jemix Selenium suites")
+    add_runner_arguments(parser)
+    args = parser.parse_args()
+
     # Create test suite
     suite = unittest.TestSuite()
     
@@ -22,6 +28,12 @@ if __name__ == '__main__':
     
     for test_case in test_cases:
         suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(test_case))
+
+    # Parallel, sharded or merge run: each worker process gets its own browsers
+    result = run_with_arguments(args, suite, ResultFileWriter)
+    if result is not None:
+        sys.exit(not result.wasSuccessful())
+
     #DO NOT EDIT THE FOLLOWING FUNCTION. IT IS USED TO RUN THE TESTS. DO NOT CHANGE!!!
     # Run tests with output
     # Verbosity levels:
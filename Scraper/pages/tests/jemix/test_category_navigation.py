@@ -6,80 +6,46 @@ categories and the proper loading of provider lists for each category.
 """
 
 import unittest
-import platform
-import os
-import tempfile
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 
-from Scraper.pages.jemix.CategoryPage import CategoryPage
+from Scraper.pages.jemix.CategoryCrawler import CategoryCrawler
+from Scraper.pages.jemix.CategoryPage import create_category_page
 from Scraper.config.settings import PAGES
 
 class TestCategoryNavigation(unittest.TestCase):
     """Test suite for category navigation functionality."""
     
-    @classmethod
-    def setUpClass(cls):
-        """
-        Class-level setup - runs once before all tests.
-        Creates a temporary directory for Chrome user data.
-        """
-        cls.temp_dir = tempfile.mkdtemp()
-        cls.user_data_dir = os.path.join(cls.temp_dir, "chrome_test_profile")
-
     def setUp(self):
         """
         Method-level setup - runs before each test method.
-        Initializes WebDriver and page objects.
+        Selects the category pages and the crawler that visits them.
         """
         try:
-            # Setup Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
-            chrome_options.add_argument("--no-first-run")
-            chrome_options.add_argument("--no-default-browser-check")
-            chrome_options.add_argument("--start-maximized")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            # Use headless mode in WSL or CI environments
-            if platform.system() == "Linux" and "microsoft" in platform.uname().release.lower():
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--headless=new")
-
-            # Initialize Chrome driver with automatic ChromeDriver management
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
-            
-            # Initialize category pages
-            self.category_pages = {}
-            for page in PAGES:
-                if page["name"] not in ["Home", "login", "account"]:
-                    self.category_pages[page["name"]] = CategoryPage(self.driver, page["url"])
+            # Categories are crawled concurrently over the shared driver pool
+            self.crawler = CategoryCrawler()
+            self.categories = [
+                page for page in PAGES
+                if page["name"] not in ["Home", "login", "account"]
+            ]
             
         except Exception as e:
             raise
 
-    def verify_provider_list(self, category_name):
+    def verify_provider_list(self, category_page):
         """
         Helper method to verify provider list for a category.
+        Runs inside a crawler worker, against that worker's browser.
         Args:
-            category_name: Name of the category being tested
+            category_page: CategoryPage already navigated to
         Returns:
             bool: True if verification passes, False otherwise
         """
         try:
             # Wait for and verify the provider list container
-            provider_list = WebDriverWait(self.driver, 20).until(
+            provider_list = WebDriverWait(category_page.driver, 20).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "elementor-posts-container"))
             )
                 
@@ -119,19 +85,25 @@ class TestCategoryNavigation(unittest.TestCase):
         2. Provider list display and structure
         3. Category-specific content
         """
-        for category_name, category_page in self.category_pages.items():
+        # Navigate to every category, results come back in PAGES order
+        crawl_results = self.crawler.crawl(self.categories, inspect=self.verify_provider_list)
+        
+        for crawl_result in crawl_results:
+            category_name = crawl_result['name']
             try:
-                # Navigate to category
-                category_page.navigate_to_category()
+                self.assertIsNone(
+                    crawl_result['error'],
+                    f"Crawling category {category_name} failed: {crawl_result['error']}"
+                )
                 
                 # Verify provider list
                 self.assertTrue(
-                    self.verify_provider_list(category_name),
+                    crawl_result['result'],
                     f"Provider list verification failed for category: {category_name}"
                 )
                 
                 # Verify category-specific elements
-                current_url = self.driver.current_url
+                current_url = crawl_result['current_url']
                 self.assertIn(
                     category_name.lower().replace(" ", "-"),
                     current_url.lower(),
@@ -143,28 +115,29 @@ class TestCategoryNavigation(unittest.TestCase):
             except Exception as e:
                 raise
 
-    def tearDown(self):
+    def test_category_providers_without_browser(self):
         """
-        Method-level cleanup - runs after each test method.
-        Closes the WebDriver instance.
+        Verify provider lists through the browserless http backend.
+        The provider markup is server-rendered, so the same page-object
+        checks must pass without JavaScript.
         """
-        if hasattr(self, 'driver'):
-            try:
-                self.driver.quit()
-            except Exception:
-                pass
+        for page in self.categories:
+            with self.subTest(category=page["name"]):
+                category_page = create_category_page(page["url"], backend="http")
+                category_page.navigate_to_category()
 
-    @classmethod
-    def tearDownClass(cls):
-        """
-        Class-level cleanup - runs once after all tests.
-        Removes the temporary Chrome profile directory.
-        """
-        import shutil
-        try:
-            shutil.rmtree(cls.temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+                self.assertTrue(
+                    category_page.has_provider_content(),
+                    f"No provider articles in server HTML for category: {page['name']}"
+                )
+                self.assertTrue(
+                    category_page.get_provider_links(),
+                    f"No provider links in server HTML for category: {page['name']}"
+                )
+                self.assertTrue(
+                    category_page.verify_provider_thumbnails(),
+                    f"Invalid thumbnails in server HTML for category: {page['name']}"
+                )
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Test module for page-speed budgets.
+
+This module loads every page in settings.PAGES through its page object with
+performance capture switched on and checks Navigation Timing, LCP and CLS
+against the per-page budgets in settings.PERFORMANCE_BUDGETS, so a page-speed
+regression fails the run like a broken element does.
+
+Pages are measured the way a first-time visitor sees them: in a private,
+freshly launched browser with the standard profile (nothing blocked, full
+page load), no profile template and an empty HTTP cache before every page.
+A budgeted metric that could not be measured fails the page; a page with
+no recorded budget is skipped (record budgets with PagePerformance's
+"budgets" command).
+
+Not part of the default execute_tests.py suite until budgets are recorded:
+    python -m unittest Scraper.pages.tests.jemix.test_page_performance
+
+Test Cases:
+    - test_pages_within_budget: Every PAGES entry stays within its budget
+"""
+
+import unittest
+
+from Scraper.pages.base.BasePage import BasePage
+from Scraper.pages.base.DriverPool import DriverPool
+from Scraper.pages.base.PagePerformance import get_performance_recorder
+from Scraper.pages.jemix.HomePage import HomePage
+from Scraper.pages.jemix.LoginPage import LoginPage
+from Scraper.pages.jemix.CategoryPage import CategoryPage
+from Scraper.config.settings import PAGES, CATEGORY_PAGES, PERFORMANCE_BUDGETS_FILE
+
+class TestPagePerformance(unittest.TestCase):
+    """Test suite for per-page performance budgets."""
+
+    def setUp(self):
+        # A cold browser of our own: the shared pool may hand out warm,
+        # template-cloned or resource-blocking browsers
+        self.pool = DriverPool(size=1, profile="standard", daemon=None, use_template=False)
+        self.driver = self.pool.acquire()
+        self.recorder = get_performance_recorder()
+
+    def load_page(self, page):
+        """Navigate to a PAGES entry the way the functional suites do
+
+        Args:
+            page (dict): Entry from settings.PAGES
+
+        Returns:
+            dict: Metrics captured for the navigation
+        """
+        # Every page is measured with an empty HTTP cache
+        self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        if page["name"] == "Home":
+            page_object = HomePage(self.driver)
+            page_object.capture_performance = True
+            page_object.navigate_to_home()
+        elif page["name"] == "login":
+            page_object = LoginPage(self.driver)
+            page_object.capture_performance = True
+            page_object.navigate_to_login()
+        elif page in CATEGORY_PAGES:
+            page_object = CategoryPage(self.driver, page["url"])
+            page_object.capture_performance = True
+            page_object.navigate_to_category()
+        else:
+            page_object = BasePage(self.driver)
+            page_object.capture_performance = True
+            page_object.navigate(page["url"])
+        return page_object.performance
+
+    def test_pages_within_budget(self):
+        """Test that every page loads within its performance budget"""
+        for page in PAGES:
+            with self.subTest(page=page["name"]):
+                if not self.recorder.budgets.get(page["name"]):
+                    self.skipTest(f"No budget recorded for {page['name']} in {PERFORMANCE_BUDGETS_FILE}")
+                metrics = self.load_page(page)
+                self.assertIsNotNone(metrics, f"No performance data captured for {page['name']}")
+                violations = self.recorder.check_budget(page["name"], metrics)
+                self.assertEqual(violations, [], "; ".join(violations))
+
+    def tearDown(self):
+        if hasattr(self, 'pool'):
+            self.pool.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,433 @@
+"""
+Process-parallel test runner shared by the jemix and potter_api suites.
+
+Test cases are grouped by class (so setUpClass/tearDownClass still run once
+per group) and the groups are spread over worker processes. Every worker
+process owns its own WebDriver pool / HTTP session, and reports plain
+records back to the parent, which merges them into a single TestResult that
+ResultFileWriter.write_results understands.
+
+The same records are used to shard a suite across several machines: each
+node runs the TestCase classes whose name hashes to its shard index (a
+class is never split, so its setUpClass runs on one node only), writes a
+JSON partial result, and a final merge step turns the partials into the
+usual text report.
+
+Usage (from an execute_tests.py script):
+    parser = argparse.ArgumentParser()
+    add_runner_arguments(parser)
+    args = parser.parse_args()
+    result = run_with_arguments(args, suite, ResultFileWriter)
+
+Sharded run over two nodes, then merge:
+    node 0: python execute_tests.py --shard-index 0 --shard-count 2 --partial-output shard-0.json
+    node 1: python execute_tests.py --shard-index 1 --shard-count 2 --partial-output shard-1.json
+    any:    python execute_tests.py --merge shard-0.json shard-1.json
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+import unittest
+
+# Outcome labels used in records and console output
+SUCCESS = "ok"
+FAILURE = "FAIL"
+ERROR = "ERROR"
+SKIP = "skipped"
+EXPECTED_FAILURE = "expected failure"
+UNEXPECTED_SUCCESS = "unexpected success"
+
+
+def add_runner_arguments(parser):
+    """
+    Add the runner's command-line options to an argparse parser.
+
+    Args:
+        parser: argparse.ArgumentParser of an execute_tests.py script
+    """
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("TEST_WORKERS", "1")),
+        help="Number of worker processes (1 runs the suite serially)"
+    )
+    parser.add_argument(
+        "--group-by",
+        choices=("class", "test"),
+        default="class",
+        help="Unit of work sent to a worker: a whole TestCase class or a single test"
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=int(os.environ.get("TEST_SHARD_INDEX", "0")),
+        help="Index of this node's shard, from 0 to shard-count - 1"
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=int(os.environ.get("TEST_SHARD_COUNT", "1")),
+        help="Total number of shards the suite is split into"
+    )
+    parser.add_argument(
+        "--partial-output",
+        default=None,
+        help="JSON file for this shard's partial result "
+             "(default: shard-<index>-of-<count>.json when sharding)"
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="PARTIAL",
+        help="Merge partial result files into the text report instead of running tests"
+    )
+
+
+def shard_of(class_id, shard_count):
+    """
+    Stable shard number of a TestCase class: the same class lands on the
+    same shard on every machine and every run, whatever the suite order.
+
+    Args:
+        class_id (str): Dotted "module.Class" name
+        shard_count (int): Total number of shards
+
+    Returns:
+        int: Shard index in range(shard_count)
+    """
+    digest = hashlib.sha1(class_id.encode("utf-8")).hexdigest()
+    return int(digest, 16) % shard_count
+
+
+def iter_tests(suite):
+    """Yield the individual TestCase instances of a (nested) suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestCase):
+            yield test
+        else:
+            yield from iter_tests(test)
+
+
+def group_test_ids(suite, group_by="class", shard_index=0, shard_count=1):
+    """
+    Split a suite into lists of test ids, keeping suite order.
+
+    Args:
+        suite: unittest.TestSuite to split
+        group_by (str): "class" keeps each TestCase class together, "test"
+            makes every test its own group
+        shard_index (int): Only keep the classes belonging to this shard
+        shard_count (int): Total number of shards
+
+    Returns:
+        list: Lists of test ids
+    """
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Shard index {shard_index} is outside 0..{shard_count - 1}")
+    groups = {}
+    for test in iter_tests(suite):
+        class_id = f"{type(test).__module__}.{type(test).__qualname__}"
+        if shard_count > 1 and shard_of(class_id, shard_count) != shard_index:
+            continue
+        key = test.id() if group_by == "test" else class_id
+        groups.setdefault(key, []).append(test.id())
+    return list(groups.values())
+
+
+class RecordedTest:
+    """Stand-in for a TestCase that ran in another process."""
+
+    def __init__(self, test_id, description):
+        self._id = test_id
+        self._description = description
+
+    def id(self):
+        return self._id
+
+    def shortDescription(self):
+        return None
+
+    def __str__(self):
+        return self._description
+
+    def __repr__(self):
+        return f"<RecordedTest {self._id}>"
+
+
+class RecordingResult(unittest.TestResult):
+    """TestResult that keeps picklable (id, description, outcome, details) records."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def _record(self, test, outcome, details=""):
+        self.records.append({
+            "id": test.id(),
+            "description": str(test),
+            "outcome": outcome,
+            "details": details
+        })
+
+    def addSuccess(self, test):
+        self._record(test, SUCCESS)
+
+    def addFailure(self, test, err):
+        self._record(test, FAILURE, self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        self._record(test, ERROR, self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        self._record(test, SKIP, reason)
+
+    def addExpectedFailure(self, test, err):
+        self._record(test, EXPECTED_FAILURE, self._exc_info_to_string(err, test))
+
+    def addUnexpectedSuccess(self, test):
+        self._record(test, UNEXPECTED_SUCCESS)
+
+    def addSubTest(self, test, subtest, err):
+        if err is None:
+            return
+        outcome = FAILURE if issubclass(err[0], test.failureException) else ERROR
+        self._record(subtest, outcome, self._exc_info_to_string(err, test))
+
+
+def run_test_group(test_ids):
+    """
+    Worker entry point: run a group of tests by id in this process.
+
+    Args:
+        test_ids (list): Dotted test ids loadable by unittest's loader
+
+    Returns:
+        tuple: (number of tests run, list of outcome records)
+    """
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+    except Exception:
+        # An import error in one module fails its group, not the whole run
+        details = traceback.format_exc()
+        return len(test_ids), [
+            {"id": test_id, "description": test_id, "outcome": ERROR, "details": details}
+            for test_id in test_ids
+        ]
+    result = RecordingResult()
+    suite.run(result)
+    return result.testsRun, result.records
+
+
+class MergedTestResult(unittest.TestResult):
+    """
+    TestResult rebuilt from worker records. Like the serial runner's result
+    it has no `successes` list, so ResultFileWriter writes the same report.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def add_record(self, record):
+        """
+        Add one worker record to the result.
+
+        Args:
+            record (dict): Record produced by RecordingResult
+        """
+        self.records.append(record)
+        test = RecordedTest(record["id"], record["description"])
+        outcome = record["outcome"]
+        if outcome == FAILURE:
+            self.failures.append((test, record["details"]))
+        elif outcome == ERROR:
+            self.errors.append((test, record["details"]))
+        elif outcome == SKIP:
+            self.skipped.append((test, record["details"]))
+        elif outcome == EXPECTED_FAILURE:
+            self.expectedFailures.append((test, record["details"]))
+        elif outcome == UNEXPECTED_SUCCESS:
+            self.unexpectedSuccesses.append(test)
+
+
+class ParallelTestRunner:
+    """Runs a suite over worker processes and merges the outcome."""
+
+    def __init__(self, workers=2, verbosity=2, group_by="class", stream=None):
+        """
+        Initialize the runner.
+
+        Args:
+            workers (int): Number of worker processes
+            verbosity (int): 0 quiet, 1 dots, 2 one line per test
+            group_by (str): "class" or "test", see group_test_ids
+            stream: Where progress is written (defaults to stderr)
+        """
+        self.workers = max(1, workers)
+        self.verbosity = verbosity
+        self.group_by = group_by
+        self.stream = stream or sys.stderr
+
+    def _report(self, record):
+        if self.verbosity >= 2:
+            details = f" '{record['details']}'" if record["outcome"] == SKIP else ""
+            self.stream.write(f"{record['description']} ... {record['outcome']}{details}\n")
+        elif self.verbosity == 1:
+            self.stream.write({SUCCESS: ".", FAILURE: "F", ERROR: "E", SKIP: "s"}.get(record["outcome"], "x"))
+        self.stream.flush()
+
+    def _summarize(self, result, elapsed):
+        for label, problems in (("ERROR", result.errors), ("FAIL", result.failures)):
+            for test, details in problems:
+                self.stream.write("=" * 70 + "\n")
+                self.stream.write(f"{label}: {test}\n")
+                self.stream.write("-" * 70 + "\n")
+                self.stream.write(f"{details}\n")
+        self.stream.write("-" * 70 + "\n")
+        self.stream.write(f"Ran {result.testsRun} tests in {elapsed:.3f}s ({self.workers} workers)\n\n")
+        if result.wasSuccessful():
+            self.stream.write("OK\n")
+        else:
+            self.stream.write(f"FAILED (failures={len(result.failures)}, errors={len(result.errors)})\n")
+
+    def run_groups(self, groups):
+        """
+        Run pre-built groups of test ids and merge their outcome.
+
+        Args:
+            groups (list): Lists of test ids, see group_test_ids
+
+        Returns:
+            MergedTestResult: Combined result, records in group order
+        """
+        result = MergedTestResult()
+        started = time.perf_counter()
+        if groups and self.workers == 1:
+            # No point spawning a single worker: run in this process
+            for group in groups:
+                tests_run, records = run_test_group(group)
+                result.testsRun += tests_run
+                for record in records:
+                    result.add_record(record)
+                    self._report(record)
+        elif groups:
+            # spawn gives every worker a fresh interpreter: no inherited
+            # browser sessions, sockets or locks from the parent
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(processes=min(self.workers, len(groups))) as pool:
+                # imap yields in submission order, keeping the merge deterministic
+                for tests_run, records in pool.imap(run_test_group, groups):
+                    result.testsRun += tests_run
+                    for record in records:
+                        result.add_record(record)
+                        self._report(record)
+                pool.close()
+                pool.join()
+        if self.verbosity == 1:
+            self.stream.write("\n")
+        self._summarize(result, time.perf_counter() - started)
+        return result
+
+    def run(self, suite, shard_index=0, shard_count=1):
+        """
+        Run a suite (or one shard of it) over the worker processes.
+
+        Args:
+            suite: unittest.TestSuite whose tests are importable by id
+            shard_index (int): Shard to run when the suite is sharded
+            shard_count (int): Total number of shards
+
+        Returns:
+            MergedTestResult: Combined result of all workers
+        """
+        return self.run_groups(group_test_ids(suite, self.group_by, shard_index, shard_count))
+
+
+def write_partial_result(result, path, shard_index, shard_count):
+    """
+    Save a shard's outcome as JSON for a later merge.
+
+    Args:
+        result (MergedTestResult): Result of this shard
+        path (str): Output file
+        shard_index (int): Index of the shard that produced the result
+        shard_count (int): Total number of shards
+    """
+    with open(path, "w") as f:
+        json.dump({
+            "shard_index": shard_index,
+            "shard_count": shard_count,
+            "tests_run": result.testsRun,
+            "records": result.records
+        }, f, indent=2)
+
+
+def merge_partial_results(paths):
+    """
+    Combine shard partial results into one TestResult.
+
+    Args:
+        paths (list): Partial result files written by write_partial_result
+
+    Returns:
+        MergedTestResult: Combined result, shards in index order
+
+    Raises:
+        ValueError: If the partials disagree on the shard count, repeat a
+            shard, or leave a shard out
+    """
+    partials = []
+    for path in paths:
+        with open(path) as f:
+            partials.append(json.load(f))
+
+    shard_counts = {partial["shard_count"] for partial in partials}
+    if len(shard_counts) != 1:
+        raise ValueError(f"Partial results come from different shard counts: {sorted(shard_counts)}")
+    shard_count = shard_counts.pop()
+    indexes = sorted(partial["shard_index"] for partial in partials)
+    if indexes != list(range(shard_count)):
+        raise ValueError(f"Expected shards 0..{shard_count - 1}, got {indexes}")
+
+    result = MergedTestResult()
+    for partial in sorted(partials, key=lambda partial: partial["shard_index"]):
+        result.testsRun += partial["tests_run"]
+        for record in partial["records"]:
+            result.add_record(record)
+    return result
+
+
+def run_with_arguments(args, suite, writer_class, verbosity=2):
+    """
+    Handle the runner options of an execute_tests.py script.
+
+    Args:
+        args: Parsed arguments (see add_runner_arguments)
+        suite: unittest.TestSuite of the script
+        writer_class: ResultFileWriter class of the suite
+        verbosity (int): Console verbosity for the parallel runner
+
+    Returns:
+        TestResult: The result of the run or merge, or None when no runner
+            option was given and the script should run serially itself.
+            Shard runs only write their partial result; the text report is
+            written by the merge.
+    """
+    if args.merge:
+        result = merge_partial_results(args.merge)
+    elif args.workers > 1 or args.shard_count > 1:
+        runner = ParallelTestRunner(workers=args.workers, verbosity=verbosity, group_by=args.group_by)
+        result = runner.run(suite, args.shard_index, args.shard_count)
+        if args.shard_count > 1:
+            partial_output = args.partial_output or f"shard-{args.shard_index}-of-{args.shard_count}.json"
+            write_partial_result(result, partial_output, args.shard_index, args.shard_count)
+            return result
+    else:
+        return None
+    writer_class().write_results(result)
+    return result
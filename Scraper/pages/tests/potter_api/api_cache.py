@@ -0,0 +1,221 @@
+"""
+HTTP response cache for the Harry Potter API test suites.
+
+A requests transport adapter that keeps responses of GET requests in an
+LRU cache keyed on the request URL (as built by APIConfig and
+HousesConfig). It follows the server's caching rules:
+
+- Cache-Control: no-store responses are never kept
+- Fresh responses (max-age / Expires not yet reached and no no-cache
+  directive) are served without a request
+- Stale responses with an ETag or Last-Modified validator are revalidated
+  with If-None-Match / If-Modified-Since, and a 304 serves the stored body
+
+Components:
+    - CacheStats: Hit, miss and revalidation counters
+    - CachingAdapter: requests transport adapter implementing the cache
+    - get_api_session: Run-scoped requests.Session shared by all API tests
+"""
+
+import atexit
+import copy
+import email.utils
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from Scraper.pages.tests.potter_api.api_modules import APIConfig
+
+# Headers a 304 response may update on the stored response
+REVALIDATED_HEADERS = ("Cache-Control", "Date", "ETag", "Expires", "Last-Modified", "Age", "Vary")
+
+def parse_cache_control(header: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header into its directives.
+
+    Args:
+        header: Cache-Control header value (may be None)
+
+    Returns:
+        Dictionary of lower-cased directive names to their values (None for flags)
+    """
+    directives = {}
+    for part in (header or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+@dataclass
+class CacheStats:
+    """Counters of how requests were answered."""
+
+    hits: int = 0            # Served from the cache without a request
+    revalidations: int = 0   # Stale entry confirmed by a 304
+    misses: int = 0          # Full response downloaded
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "revalidations": self.revalidations, "misses": self.misses}
+
+@dataclass
+class CacheEntry:
+    """A stored response and when it stops being fresh."""
+
+    response: requests.Response
+    expires: float
+    validators: Dict[str, str] = field(default_factory=dict)
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that caches GET responses following Cache-Control."""
+
+    def __init__(self, max_entries: int = APIConfig.CACHE_MAX_ENTRIES, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            max_entries: Responses kept before the least recently used is dropped
+            **kwargs: Passed on to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _freshness(response: requests.Response) -> float:
+        """Seconds the response stays fresh, from max-age or Expires minus Age."""
+        directives = parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-cache" in directives:
+            return 0.0
+        try:
+            age = float(response.headers.get("Age") or 0)
+        except ValueError:
+            # A malformed Age header says nothing about the response's age
+            age = 0.0
+        if directives.get("max-age") is not None:
+            try:
+                return max(0.0, float(directives["max-age"]) - age)
+            except ValueError:
+                return 0.0
+        expires = response.headers.get("Expires")
+        if expires:
+            try:
+                expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+            except (TypeError, ValueError):
+                return 0.0
+            return max(0.0, expires_at - time.time())
+        # No explicit lifetime: always revalidate
+        return 0.0
+
+    def _store(self, url: str, response: requests.Response):
+        directives = parse_cache_control(response.headers.get("Cache-Control"))
+        if response.status_code != 200 or "no-store" in directives:
+            return
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        entry = CacheEntry(
+            response=response,
+            expires=time.monotonic() + self._freshness(response),
+            validators=validators
+        )
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _serve(stored: requests.Response, request) -> requests.Response:
+        """Copy of a stored response, so callers cannot alter the cache."""
+        response = copy.copy(stored)
+        response.headers = CaseInsensitiveDict(stored.headers)
+        response.request = request
+        response.from_cache = True
+        return response
+
+    def send(self, request, **kwargs):
+        """Answer GET requests from the cache where the server allows it."""
+        conditional = "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+        if request.method != "GET" or kwargs.get("stream") or conditional:
+            # Streamed bodies are not buffered, explicit conditional requests
+            # are testing the server itself
+            return super().send(request, **kwargs)
+
+        with self._lock:
+            entry = self._entries.get(request.url)
+            if entry is not None:
+                self._entries.move_to_end(request.url)
+
+        if entry is not None and time.monotonic() < entry.expires:
+            with self._lock:
+                self.stats.hits += 1
+            return self._serve(entry.response, request)
+
+        if entry is not None and entry.validators:
+            request = request.copy()
+            request.headers.update(entry.validators)
+
+        response = super().send(request, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and entry is not None:
+            # Refresh the headers (new Date, ETag, lifetime) and keep the body.
+            # The stored response is shared with other threads, so update a
+            # copy and let _store swap it in under the lock
+            response.close()
+            refreshed = copy.copy(entry.response)
+            refreshed.headers = CaseInsensitiveDict(entry.response.headers)
+            for header in REVALIDATED_HEADERS:
+                if header in response.headers:
+                    refreshed.headers[header] = response.headers[header]
+            self._store(request.url, refreshed)
+            with self._lock:
+                self.stats.revalidations += 1
+            return self._serve(refreshed, request)
+
+        with self._lock:
+            self.stats.misses += 1
+        # Read the body now so the stored response can be served again
+        response.content
+        self._store(request.url, response)
+        return response
+
+    def clear(self):
+        """Forget every stored response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+def get_api_session() -> requests.Session:
+    """
+    Get the requests.Session shared by every API test class in this run,
+    with the caching adapter mounted for http and https.
+
+    Returns:
+        The shared session (its adapter is available as `session.cache`)
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            # Enough pooled connections for the concurrent request executor
+            adapter = CachingAdapter(pool_maxsize=APIConfig.MAX_CONCURRENT_REQUESTS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.cache = adapter
+            atexit.register(session.close)
+            _shared_session = session
+        return _shared_session
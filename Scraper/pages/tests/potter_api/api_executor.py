@@ -0,0 +1,119 @@
+"""
+Concurrent request execution for the Harry Potter API test suites.
+
+Test matrices (query parameters, search terms, error cases) are fired at
+the API all at once through a bounded thread pool on the shared session,
+and their responses are handed back in the order the matrix was written,
+so subTest output stays deterministic while wall time stays close to a
+single round trip.
+
+Components:
+    - RequestResult: One matrix entry with its response or error
+    - RequestExecutor: Bounded concurrent GET executor
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+import requests
+
+from Scraper.pages.tests.potter_api.api_modules import APIConfig
+
+@dataclass
+class RequestResult:
+    """Outcome of one request of a matrix."""
+
+    case: Any
+    url: str
+    response: Optional[requests.Response] = None
+    error: Optional[Exception] = None
+
+    def get_response(self) -> requests.Response:
+        """
+        The response, re-raising the request's exception if it failed.
+
+        Returns:
+            The requests.Response of this case
+
+        Raises:
+            requests.RequestException: If the request itself failed
+        """
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+class RequestExecutor:
+    """Runs GET requests concurrently, at most `max_concurrency` at a time."""
+
+    def __init__(self, session: requests.Session, max_concurrency: int = APIConfig.MAX_CONCURRENT_REQUESTS):
+        """
+        Initialize the executor.
+
+        Args:
+            session: Session the requests are sent on
+            max_concurrency: Maximum requests in flight
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.session = session
+        self.max_concurrency = max_concurrency
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="potter_api"
+                )
+            return self._pool
+
+    def _get(self, case: Any, url: str, **kwargs) -> RequestResult:
+        try:
+            return RequestResult(case, url, response=self.session.get(url, **kwargs))
+        except requests.RequestException as e:
+            return RequestResult(case, url, error=e)
+
+    def submit(self, url: str, case: Any = None, **kwargs):
+        """
+        Start one GET request in the background.
+
+        Args:
+            url: URL to fetch
+            case: Value reported back with the result
+            **kwargs: Passed on to session.get
+
+        Returns:
+            Future resolving to a RequestResult
+        """
+        return self._executor().submit(self._get, case, url, **kwargs)
+
+    def map(self, cases: Iterable[Any], build_url: Callable[[Any], str], **kwargs) -> Iterator[RequestResult]:
+        """
+        Fetch a URL per case concurrently, yielding results in case order.
+
+        Args:
+            cases: Matrix entries, e.g. query parameter dicts
+            build_url: Turns a case into its URL
+            **kwargs: Passed on to session.get
+
+        Returns:
+            Iterator of RequestResult, one per case, in the order given
+        """
+        futures = [self.submit(build_url(case), case, **kwargs) for case in cases]
+        for future in futures:
+            yield future.result()
+
+    def get_all(self, cases: Iterable[Any], build_url: Callable[[Any], str], **kwargs) -> List[RequestResult]:
+        """Like `map`, but waits for the whole matrix and returns a list."""
+        return list(self.map(cases, build_url, **kwargs))
+
+    def close(self):
+        """Stop the worker threads."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
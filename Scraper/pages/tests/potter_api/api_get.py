@@ -7,6 +7,7 @@ It follows best practices for API testing and implements comprehensive validatio
 Test Cases:
     - test_get_all_books: Verifies successful retrieval of all books
     - test_book_schema_validation: Validates the schema of book objects
+    - test_streaming_schema_validation: Validates each book as the streamed response arrives
     - test_book_data_validation: Validates specific book data against known values
 """
 
@@ -16,6 +17,8 @@ import json
 from typing import Dict, List
 
 from Scraper.pages.tests.potter_api.api_modules import APIConfig, BookSchema, BookData
+from Scraper.pages.tests.potter_api.api_cache import get_api_session
+from Scraper.pages.tests.potter_api.api_stream import validate_stream
 
 class TestHarryPotterBooksAPI(unittest.TestCase):
     """Test suite for Harry Potter Books API endpoints."""
@@ -23,7 +26,9 @@ class TestHarryPotterBooksAPI(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Class-level setup - runs once before all tests."""
-        cls.session = requests.Session()
+        # Run-scoped caching session: repeated fetches of /books revalidate
+        # instead of downloading the list again
+        cls.session = get_api_session()
         cls.api_url = APIConfig.get_books_url()
     
     def setUp(self):
@@ -81,22 +86,57 @@ class TestHarryPotterBooksAPI(unittest.TestCase):
                 self.response = self.session.get(self.api_url)
                 self.books_data = self.response.json()
             
-            # Validate schema for each book
-            for book in self.books_data:
-                validation_errors = BookSchema.validate(book)
-                
-                self.assertEqual(
-                    len(validation_errors),
-                    0,
-                    f"Schema validation failed for book {book.get('number', 'unknown')}: "
-                    f"{', '.join(validation_errors)}"
-                )
+            # Validate every book in one pass; messages are only built for failures
+            result = BookSchema.validate_batch(self.books_data)
+            failures = [
+                f"book {self.books_data[index].get('number', 'unknown')}: {', '.join(messages)}"
+                for index, messages in result.messages().items()
+            ]
+            
+            self.assertEqual(
+                len(failures),
+                0,
+                f"Schema validation failed for {'; '.join(failures)}"
+            )
                 
         except requests.RequestException as e:
             self.fail(f"Request failed: {str(e)}")
         except json.JSONDecodeError as e:
             self.fail(f"Invalid JSON response: {str(e)}")
     
+    def test_streaming_schema_validation(self):
+        """Test schema validation of each book while the response streams in."""
+        try:
+            # stream=True bypasses the cache, the body is parsed element by element
+            self.response = self.session.get(self.api_url, stream=True)
+            
+            self.assertEqual(
+                self.response.status_code,
+                200,
+                f"Expected status code 200, but got {self.response.status_code}"
+            )
+            
+            # Stop at the first invalid book instead of downloading the rest
+            report = validate_stream(self.response, BookSchema.VALIDATOR, stop_on_first_failure=True)
+            
+            self.assertTrue(
+                report.valid,
+                "Schema validation failed for "
+                + "; ".join(f"book at position {position}: {', '.join(messages)}"
+                            for position, messages in report.failures)
+            )
+            
+            self.assertEqual(
+                report.items,
+                8,
+                f"Expected 8 books, but got {report.items}"
+            )
+                
+        except requests.RequestException as e:
+            self.fail(f"Request failed: {str(e)}")
+        except ValueError as e:
+            self.fail(f"Invalid JSON response: {str(e)}")
+    
     def test_book_data_validation(self):
         """Test specific book data against known values."""
         try:
@@ -141,8 +181,8 @@ class TestHarryPotterBooksAPI(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Class-level cleanup - runs once after all tests."""
-        if hasattr(cls, 'session'):
-            cls.session.close()
+        # The shared session is closed at exit, other suites still use it
+        cls.session = None
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
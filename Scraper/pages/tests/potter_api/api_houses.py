@@ -7,6 +7,7 @@ This module focuses on testing different aspects of the Houses API endpoint:
 3. Search Functionality
 4. Pagination Testing
 5. Error Handling
+6. HTTP Caching (ETag / Last-Modified revalidation)
 
 Different from the books API tests, this module emphasizes:
 - Dynamic query parameter handling
@@ -22,6 +23,9 @@ from typing import Dict, List, Optional
 from urllib.parse import quote
 
 from .api_modules import APIConfig, HousesConfig, HouseSchema
+from .api_cache import get_api_session
+from .api_executor import RequestExecutor
+from .api_paginator import HousePaginator
 
 class TestHarryPotterHousesAPI(unittest.TestCase):
     """Test suite for Harry Potter Houses API endpoint."""
@@ -29,8 +33,10 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Class-level setup - runs once before all tests."""
-        cls.session = requests.Session()
+        cls.session = get_api_session()
         cls.base_url = HousesConfig.get_houses_url()
+        # Test matrices are fetched concurrently, checked in matrix order
+        cls.executor = RequestExecutor(cls.session)
     
     def test_query_parameter_combinations(self):
         """
@@ -45,10 +51,15 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
             {"max": 2, "search": "Sly"}
         ]
         
-        for params in test_cases:
+        results = self.executor.map(
+            test_cases,
+            lambda params: HousesConfig.get_houses_url_with_params(**params)
+        )
+        
+        for result in results:
+            params = result.case
             with self.subTest(params=params):
-                url = HousesConfig.get_houses_url_with_params(**params)
-                response = self.session.get(url)
+                response = result.get_response()
                 
                 self.assertEqual(
                     response.status_code,
@@ -89,10 +100,15 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
             ("blue", "Ravenclaw")      # Color match
         ]
         
-        for search_term, expected_house in search_tests:
+        results = self.executor.map(
+            search_tests,
+            lambda test: HousesConfig.get_houses_url_with_params(search=test[0])
+        )
+        
+        for result in results:
+            search_term, expected_house = result.case
             with self.subTest(search_term=search_term):
-                url = HousesConfig.get_houses_url_with_params(search=search_term)
-                response = self.session.get(url)
+                response = result.get_response()
                 
                 self.assertEqual(response.status_code, 200)
                 data = response.json()
@@ -111,34 +127,51 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
         Ensures no data is lost or duplicated across pages.
         """
         page_size = 2
-        all_houses = set()
-        
-        # Collect houses across all pages
-        for page in range(2):  # 4 houses ÷ 2 per page = 2 pages
-            url = HousesConfig.get_houses_url_with_params(max=page_size, page=page)
-            response = self.session.get(url)
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            
-            # Collect house names from this page
-            page_houses = {house["house"] for house in data}
-            
-            # Ensure no duplicates
-            self.assertEqual(
-                len(page_houses.intersection(all_houses)),
-                0,
-                "Found duplicate houses across pages"
-            )
-            
-            all_houses.update(page_houses)
+        
+        # Walk pages until the API reports the end; pages are prefetched
+        # concurrently and duplicates / gaps are tracked by house index.
+        # The ceiling leaves room for the closing empty page or 404
+        max_pages = len(HouseSchema.KNOWN_HOUSES) // page_size + 2
+        paginator = HousePaginator(self.executor, page_size=page_size, max_pages=max_pages)
+        all_houses = {house["house"] for house in paginator}
+        report = paginator.report
+        
+        self.assertIn(
+            report.end_reason,
+            ("empty page", "404"),
+            f"Pagination should end with an empty page or a 404 within {max_pages} pages: {report.examples}"
+        )
+        
+        # Ensure no duplicates or missing houses
+        self.assertEqual(
+            report.duplicates,
+            0,
+            f"Found duplicate houses across pages: {report.examples}"
+        )
+        self.assertEqual(
+            report.gaps,
+            0,
+            f"Found missing houses between pages: {report.examples}"
+        )
+        
+        # Verify page size constraints
+        self.assertEqual(
+            report.oversized_pages,
+            0,
+            f"Pages should not exceed max={page_size}: {report.examples}"
+        )
         
         # Verify we got all houses
         self.assertEqual(
-            len(all_houses),
-            4,
+            report.items,
+            len(HouseSchema.KNOWN_HOUSES),
             "Pagination should return all houses exactly once"
         )
+        self.assertEqual(
+            all_houses,
+            set(HouseSchema.KNOWN_HOUSES),
+            "Pagination should return every known house"
+        )
     
     def test_error_handling(self):
         """
@@ -153,10 +186,15 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
             {"search": ""}           # Empty search
         ]
         
-        for params in error_cases:
+        results = self.executor.map(
+            error_cases,
+            lambda params: HousesConfig.get_houses_url_with_params(**params)
+        )
+        
+        for result in results:
+            params = result.case
             with self.subTest(params=params):
-                url = HousesConfig.get_houses_url_with_params(**params)
-                response = self.session.get(url)
+                response = result.get_response()
                 
                 if "index" in params and params["index"] >= 4:
                     self.assertEqual(
@@ -170,6 +208,27 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
                         "Error response should contain error message"
                     )
     
+    def test_house_schema_validation(self):
+        """
+        Test schema validation for all house objects.
+        Checks required fields, their types and index constraints.
+        """
+        response = self.session.get(self.base_url)
+        self.assertEqual(response.status_code, 200)
+        houses = response.json()
+        
+        result = HouseSchema.validate_batch(houses)
+        failures = [
+            f"house {houses[index].get('house', 'unknown')}: {', '.join(messages)}"
+            for index, messages in result.messages().items()
+        ]
+        
+        self.assertEqual(
+            len(failures),
+            0,
+            f"Schema validation failed for {'; '.join(failures)}"
+        )
+    
     def test_response_headers(self):
         """
         Test response headers and caching behavior.
@@ -196,6 +255,42 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
         self.assertIn('public', cache_control)
         self.assertIn('must-revalidate', cache_control)
     
+    def test_cache_revalidation(self):
+        """
+        Test conditional requests against the API's validators.
+        A repeated request must be answered by the run-scoped cache, either
+        while fresh or through a 304 revalidation, with an unchanged body.
+        """
+        first = self.session.get(self.base_url)
+        self.assertEqual(first.status_code, 200)
+        
+        etag = first.headers.get('etag')
+        last_modified = first.headers.get('last-modified')
+        self.assertTrue(
+            etag or last_modified,
+            "Response should include an ETag or Last-Modified validator"
+        )
+        
+        # The server itself must honour the validator
+        validator = {'If-None-Match': etag} if etag else {'If-Modified-Since': last_modified}
+        conditional = self.session.get(self.base_url, headers=validator)
+        self.assertEqual(
+            conditional.status_code,
+            304,
+            "Conditional request with a current validator should return 304"
+        )
+        
+        # A repeated request is served by the cache without a full download
+        misses = self.session.cache.stats.misses
+        second = self.session.get(self.base_url)
+        self.assertTrue(second.from_cache, "Repeated request should be served from the cache")
+        self.assertEqual(
+            self.session.cache.stats.misses,
+            misses,
+            "Repeated request should not download the body again"
+        )
+        self.assertEqual(second.json(), first.json(), "Cached body should match the original")
+    
     def tearDown(self):
         """Method-level cleanup - runs after each test method."""
         pass
@@ -203,8 +298,10 @@ class TestHarryPotterHousesAPI(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Class-level cleanup - runs once after all tests."""
-        if hasattr(cls, 'session'):
-            cls.session.close()
+        if hasattr(cls, 'executor'):
+            cls.executor.close()
+        # The shared session is closed at exit, other suites still use it
+        cls.session = None
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -9,9 +9,12 @@ Components:
     - APIConfig: Configuration settings for the API
     - BookSchema: Schema definition and validation for book objects
     - BookData: Known book data for validation
+    - HouseSchema: Schema definition and validation for house objects
 """
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+from Scraper.pages.tests.potter_api.api_schema import BatchResult, CompiledSchema, Constraint
 
 class APIConfig:
     """Configuration settings for the Harry Potter API."""
@@ -20,6 +23,15 @@ class APIConfig:
     BOOKS_ENDPOINT = "/books"
     HOUSES_ENDPOINT = "/houses"
     
+    # Responses kept by the run-scoped HTTP cache (see api_cache.py)
+    CACHE_MAX_ENTRIES = 256
+    
+    # Requests a test matrix may have in flight at once (see api_executor.py)
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Pages a paginator requests ahead of its consumer (see api_paginator.py)
+    PAGINATION_WINDOW = 4
+    
     @classmethod
     def get_books_url(cls) -> str:
         """Get the full URL for the books endpoint."""
@@ -59,6 +71,16 @@ class BookSchema:
         "index": int
     }
     
+    # Value constraints checked once the type is right
+    CONSTRAINTS = {
+        "number": Constraint(minimum=1, maximum=8, label="book number"),  # 8 Harry Potter books
+        "index": Constraint(minimum=0, maximum=7),                         # zero-based
+        "cover": Constraint(prefix="https://", label="cover URL")
+    }
+    
+    # Compiled once, shared by every validation
+    VALIDATOR = CompiledSchema("book", REQUIRED_FIELDS, CONSTRAINTS)
+    
     @classmethod
     def validate(cls, book: Dict) -> List[str]:
         """
@@ -70,35 +92,20 @@ class BookSchema:
         Returns:
             List of validation error messages (empty if validation passes)
         """
-        errors = []
-        
-        # Check for required fields and their types
-        for field, expected_type in cls.REQUIRED_FIELDS.items():
-            if field not in book:
-                errors.append(f"Missing required field: {field}")
-            elif not isinstance(book[field], expected_type):
-                errors.append(
-                    f"Invalid type for {field}: expected {expected_type.__name__}, "
-                    f"got {type(book[field]).__name__}"
-                )
-        
-        # Validate number range (1-8 for Harry Potter books)
-        if "number" in book and (book["number"] < 1 or book["number"] > 8):
-            errors.append(
-                f"Invalid book number: {book['number']} (should be between 1 and 8)"
-            )
-        
-        # Validate index range (0-7 for zero-based indexing)
-        if "index" in book and (book["index"] < 0 or book["index"] > 7):
-            errors.append(
-                f"Invalid index: {book['index']} (should be between 0 and 7)"
-            )
-        
-        # Validate cover URL format
-        if "cover" in book and not book["cover"].startswith("https://"):
-            errors.append(f"Invalid cover URL format: {book['cover']}")
+        return cls.VALIDATOR.error_messages(book)
+    
+    @classmethod
+    def validate_batch(cls, books: Sequence[Dict]) -> BatchResult:
+        """
+        Validate a list of books in one pass.
         
-        return errors
+        Args:
+            books: List of book dictionaries
+            
+        Returns:
+            BatchResult with the invalid indexes and (lazily built) errors
+        """
+        return cls.VALIDATOR.validate_batch(books)
 
 class BookData:
     """Known book data for validation testing."""
@@ -170,7 +177,7 @@ class HousesConfig:
         return base_url
 
 class HouseSchema:
-    """Schema definition for house objects."""
+    """Schema definition and validation for house objects."""
     
     REQUIRED_FIELDS = {
         "house": str,
@@ -181,9 +188,43 @@ class HouseSchema:
         "index": int
     }
     
+    # Value constraints checked once the type is right
+    CONSTRAINTS = {
+        "index": Constraint(minimum=0)
+    }
+    
+    # Compiled once, shared by every validation
+    VALIDATOR = CompiledSchema("house", REQUIRED_FIELDS, CONSTRAINTS)
+    
     KNOWN_HOUSES = {
         "Gryffindor": {"index": 0, "animal": "Lion", "emoji": "🦁"},
         "Hufflepuff": {"index": 1, "animal": "Badger", "emoji": "🦡"},
         "Ravenclaw": {"index": 2, "animal": "Raven", "emoji": "🦅"},
         "Slytherin": {"index": 3, "animal": "Snake", "emoji": "🐍"}
-    } 
\ No newline at end of file
+    } 
+    
+    @classmethod
+    def validate(cls, house: Dict) -> List[str]:
+        """
+        Validate a house object against the schema.
+        
+        Args:
+            house: Dictionary containing house data
+            
+        Returns:
+            List of validation error messages (empty if validation passes)
+        """
+        return cls.VALIDATOR.error_messages(house)
+    
+    @classmethod
+    def validate_batch(cls, houses: Sequence[Dict]) -> BatchResult:
+        """
+        Validate a list of houses in one pass.
+        
+        Args:
+            houses: List of house dictionaries
+            
+        Returns:
+            BatchResult with the invalid indexes and (lazily built) errors
+        """
+        return cls.VALIDATOR.validate_batch(houses)
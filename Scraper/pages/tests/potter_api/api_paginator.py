@@ -0,0 +1,171 @@
+"""
+Concurrent paginator for the Harry Potter Houses API.
+
+Walks the `max`/`page` query parameters of the houses endpoint (URLs built
+by HousesConfig.get_houses_url_with_params) and streams the items out one
+at a time. Up to `window` pages are requested ahead of the consumer on the
+shared RequestExecutor. The end of the data is an empty page or a 404.
+A full page that brings nothing new also ends the walk, so an API that
+ignores `page` cannot keep the paginator going forever.
+
+While streaming, the item key (the house `index` by default) must count up
+by one from the first item. A key lower than expected is a duplicate, a
+higher one is a gap. Only the last key is kept, so memory stays at one page
+no matter how large the collection is. Filtered queries (e.g. `search`)
+skip keys by design, so they must be walked with `key=None`, which turns
+the check off.
+
+Components:
+    - PaginationReport: Counters describing the walk
+    - HousePaginator: Generator over every house of a paginated query
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from Scraper.pages.tests.potter_api.api_executor import RequestExecutor
+from Scraper.pages.tests.potter_api.api_modules import APIConfig, HousesConfig
+
+@dataclass
+class PaginationReport:
+    """What a paginator saw while walking the pages."""
+
+    pages: int = 0             # Non-empty pages received
+    items: int = 0             # Items yielded
+    duplicates: int = 0        # Items whose key was already passed
+    gaps: int = 0              # Keys skipped between consecutive items
+    oversized_pages: int = 0   # Pages holding more than the page size
+    end_reason: Optional[str] = None   # "empty page", "404", "no new items" or "max_pages"
+    examples: List[str] = field(default_factory=list)   # First few problems
+
+    MAX_EXAMPLES = 5
+
+    def note(self, problem: str):
+        if len(self.examples) < self.MAX_EXAMPLES:
+            self.examples.append(problem)
+
+    @property
+    def consistent(self) -> bool:
+        """True if every item appeared exactly once and no page was too large."""
+        return not (self.duplicates or self.gaps or self.oversized_pages)
+
+class HousePaginator:
+    """Iterates over every house of a paginated houses query."""
+
+    def __init__(self, executor: RequestExecutor, page_size: int,
+                 window: int = APIConfig.PAGINATION_WINDOW, key: str = "index",
+                 start_page: int = 0, max_pages: Optional[int] = None, **params):
+        """
+        Initialize the paginator.
+
+        Args:
+            executor: Executor the page requests are sent through
+            page_size: Items per page (the `max` parameter)
+            window: Pages requested ahead of the consumer
+            key: Item field that counts up by one across pages (None skips
+                the duplicate and gap check)
+            start_page: First page number (the API counts from 0)
+            max_pages: Stop after this many pages (None = until the end)
+            **params: Extra query parameters, e.g. search; only allowed
+                with key=None, since a filter leaves gaps in the keys
+
+        Raises:
+            ValueError: For a non-positive page size or window, or filter
+                parameters combined with a key check
+        """
+        if page_size < 1 or window < 1:
+            raise ValueError("page_size and window must be at least 1")
+        if params and key is not None:
+            raise ValueError(
+                f"Filter parameters {sorted(params)} leave gaps in '{key}'; pass key=None to walk them"
+            )
+        self.executor = executor
+        self.page_size = page_size
+        self.window = window
+        self.key = key
+        self.start_page = start_page
+        self.max_pages = max_pages
+        self.params = params
+        self.report = PaginationReport()
+
+    def page_url(self, page: int) -> str:
+        """URL of one page of the query."""
+        return HousesConfig.get_houses_url_with_params(max=self.page_size, page=page, **self.params)
+
+    def _check(self, item: Dict[str, Any], page: int, expected: Optional[int]) -> Optional[int]:
+        """Update the report for one item and return the next expected key."""
+        if self.key is None:
+            return expected
+        value = item.get(self.key)
+        if not isinstance(value, int):
+            self.report.note(f"page {page}: item without integer '{self.key}': {item!r}")
+            return expected
+        if expected is not None and value < expected:
+            self.report.duplicates += 1
+            self.report.note(f"page {page}: {self.key} {value} repeated (expected {expected})")
+            return expected
+        if expected is not None and value > expected:
+            self.report.gaps += value - expected
+            missing = expected if value - expected == 1 else f"{expected}..{value - 1}"
+            self.report.note(f"page {page}: {self.key} {missing} missing")
+        return value + 1
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every item in page order.
+
+        Raises:
+            requests.HTTPError: If a page fails with anything but a 404
+        """
+        self.report = report = PaginationReport()
+        last_page = None if self.max_pages is None else self.start_page + self.max_pages
+        next_page = self.start_page
+        pending = deque()
+        expected = None
+        previous_body = None
+        try:
+            while True:
+                # Keep the window full
+                while len(pending) < self.window and (last_page is None or next_page < last_page):
+                    pending.append((next_page, self.executor.submit(self.page_url(next_page), next_page)))
+                    next_page += 1
+                if not pending:
+                    report.end_reason = "max_pages"
+                    return
+
+                page, future = pending.popleft()
+                response = future.result().get_response()
+                if response.status_code == 404:
+                    report.end_reason = "404"
+                    return
+                response.raise_for_status()
+                items = response.json()
+                if not items:
+                    report.end_reason = "empty page"
+                    return
+
+                # A full page of already seen keys, or a repeat of the previous
+                # page without a key check, means `page` is being ignored
+                body = response.content
+                duplicates = report.duplicates
+                for item in items:
+                    expected = self._check(item, page, expected)
+                repeated = body == previous_body or report.duplicates - duplicates == len(items)
+                if len(items) >= self.page_size and repeated:
+                    report.note(f"page {page}: nothing new, the API repeated an earlier page")
+                    report.end_reason = "no new items"
+                    return
+                previous_body = body
+
+                report.pages += 1
+                if len(items) > self.page_size:
+                    report.oversized_pages += 1
+                    report.note(f"page {page}: {len(items)} items for max={self.page_size}")
+                for item in items:
+                    report.items += 1
+                    yield item
+        finally:
+            # Pages past the end (or past an early exit) are not needed
+            for _, future in pending:
+                future.cancel()
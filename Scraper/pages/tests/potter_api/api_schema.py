@@ -0,0 +1,204 @@
+"""
+Compiled schema validation for Harry Potter API objects.
+
+A schema (required fields with their types, plus optional value
+constraints) is compiled once into a Python function that reads each field
+once and checks the whole record in a single expression, without building
+any messages. Whole lists are validated in one pass with that function.
+Error messages are produced only for the records that failed, and only
+when they are asked for.
+
+Components:
+    - Constraint: Range / URL prefix constraint on one field
+    - SchemaError: One structured validation error
+    - BatchResult: Outcome of validating a list, with lazy errors
+    - CompiledSchema: The compiled validator shared by BookSchema and HouseSchema
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+@dataclass(frozen=True)
+class Constraint:
+    """Value constraint checked after a field's type."""
+
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    prefix: Optional[str] = None
+    label: Optional[str] = None   # Name used in messages, defaults to the field name
+
+    def bounds(self) -> str:
+        """Describe the allowed range for error messages."""
+        if self.minimum is not None and self.maximum is not None:
+            return f"should be between {self.minimum} and {self.maximum}"
+        if self.minimum is not None:
+            return f"should be at least {self.minimum}"
+        return f"should be at most {self.maximum}"
+
+class SchemaError(NamedTuple):
+    """A single validation failure."""
+
+    index: Optional[int]   # Position in the validated list (None for single records)
+    field: str
+    code: str              # "missing", "type", "range" or "prefix"
+    message: str
+
+class BatchResult:
+    """Result of validating a list of records; errors are built on first access."""
+
+    def __init__(self, schema: "CompiledSchema", records: Sequence[Any], invalid: List[int]):
+        self.schema = schema
+        self.records = records
+        self.invalid = invalid
+        self._errors = None
+
+    @property
+    def valid(self) -> bool:
+        return not self.invalid
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    @property
+    def errors(self) -> List[SchemaError]:
+        """Structured errors of every invalid record, in list order."""
+        if self._errors is None:
+            self._errors = [
+                error
+                for index in self.invalid
+                for error in self.schema.errors(self.records[index], index)
+            ]
+        return self._errors
+
+    def messages(self) -> Dict[int, List[str]]:
+        """Error messages per invalid record index."""
+        grouped = {}
+        for error in self.errors:
+            grouped.setdefault(error.index, []).append(error.message)
+        return grouped
+
+class CompiledSchema:
+    """Validator compiled from field types and constraints."""
+
+    def __init__(self, name: str, fields: Dict[str, type], constraints: Optional[Dict[str, Constraint]] = None):
+        """
+        Compile a schema.
+
+        Args:
+            name: Schema name, used in messages and the generated function's filename
+            fields: Required fields and their expected types
+            constraints: Optional value constraints per field
+        """
+        self.name = name
+        self.fields = dict(fields)
+        self.constraints = dict(constraints or {})
+        unknown = set(self.constraints) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Constraints for undeclared field(s): {', '.join(sorted(unknown))}")
+        # Everything the slow path needs per constraint, resolved once
+        self._constraint_checks = [
+            (field, self.fields[field], constraint.label or field, constraint.minimum,
+             constraint.maximum, constraint.prefix, constraint.bounds())
+            for field, constraint in self.constraints.items()
+        ]
+        self.is_valid = self._compile()
+
+    def _compile(self):
+        """Generate `is_valid(record) -> bool`: read every field, then one boolean expression."""
+        constants = {}
+        reads = []
+        checks = []
+        for position, (field, expected_type) in enumerate(self.fields.items()):
+            value = f"v{position}"
+            reads.append(f"        {value} = record[{field!r}]\n")
+            constants[f"T{position}"] = expected_type
+            checks.append(f"isinstance({value}, T{position})")
+            constraint = self.constraints.get(field)
+            if constraint is None:
+                continue
+            if constraint.minimum is not None:
+                constants[f"MIN{position}"] = constraint.minimum
+                checks.append(f"{value} >= MIN{position}")
+            if constraint.maximum is not None:
+                constants[f"MAX{position}"] = constraint.maximum
+                checks.append(f"{value} <= MAX{position}")
+            if constraint.prefix is not None:
+                constants[f"PREFIX{position}"] = constraint.prefix
+                checks.append(f"{value}.startswith(PREFIX{position})")
+
+        # Constants are bound as default arguments so lookups stay local
+        arguments = "".join(f", {name}={name}" for name in constants)
+        source = (
+            f"def is_valid(record, isinstance=isinstance{arguments}):\n"
+            "    try:\n"
+            f"{''.join(reads)}"
+            "    except (KeyError, TypeError):\n"
+            "        return False\n"
+            f"    return bool({' and '.join(checks) or 'True'})\n"
+        )
+        namespace = dict(constants)
+        exec(compile(source, f"<schema {self.name}>", "exec"), namespace)
+        return namespace["is_valid"]
+
+    def errors(self, record: Any, index: Optional[int] = None) -> List[SchemaError]:
+        """
+        Explain why a record is invalid (slow path, only for failures).
+
+        Args:
+            record: Object to check
+            index: Position reported with each error
+
+        Returns:
+            Structured errors: type problems in field order, then constraints
+        """
+        if not isinstance(record, dict):
+            return [SchemaError(
+                index, "", "type", f"Invalid {self.name}: expected dict, got {type(record).__name__}"
+            )]
+
+        errors = []
+        for field, expected_type in self.fields.items():
+            if field not in record:
+                errors.append(SchemaError(index, field, "missing", f"Missing required field: {field}"))
+            elif not isinstance(record[field], expected_type):
+                errors.append(SchemaError(
+                    index, field, "type",
+                    f"Invalid type for {field}: expected {expected_type.__name__}, "
+                    f"got {type(record[field]).__name__}"
+                ))
+
+        for field, expected_type, label, minimum, maximum, prefix, bounds in self._constraint_checks:
+            value = record.get(field)
+            # Missing or mistyped values were reported above
+            if not isinstance(value, expected_type):
+                continue
+            if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+                errors.append(SchemaError(index, field, "range", f"Invalid {label}: {value} ({bounds})"))
+            if prefix is not None and not value.startswith(prefix):
+                errors.append(SchemaError(index, field, "prefix", f"Invalid {label} format: {value}"))
+        return errors
+
+    def error_messages(self, record: Any) -> List[str]:
+        """
+        Validate one record.
+
+        Returns:
+            List of validation error messages (empty if validation passes)
+        """
+        if self.is_valid(record):
+            return []
+        return [error.message for error in self.errors(record)]
+
+    def validate_batch(self, records: Sequence[Any]) -> BatchResult:
+        """
+        Validate a whole list in one pass.
+
+        Args:
+            records: Objects to check
+
+        Returns:
+            BatchResult with the invalid indexes; messages are built lazily
+        """
+        is_valid = self.is_valid
+        invalid = [index for index, record in enumerate(records) if not is_valid(record)]
+        return BatchResult(self, records, invalid)
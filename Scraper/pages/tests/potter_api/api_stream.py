@@ -0,0 +1,209 @@
+"""
+Streaming JSON parsing and validation for Harry Potter API responses.
+
+Responses requested with `stream=True` are read chunk by chunk, and the
+elements of a top-level JSON array are decoded one at a time with
+json.JSONDecoder.raw_decode. Only the unparsed tail of the body is kept in
+memory, so memory stays flat however large the array is. Each element can
+be validated as soon as it arrives, so a schema failure is reported before
+the rest of the body has been downloaded.
+
+Components:
+    - iter_json_array: Generator over the elements of a streamed JSON array
+    - StreamReport: Counters and failures of a streamed validation
+    - validate_stream: Validate each element against a CompiledSchema as it arrives
+"""
+
+import codecs
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Tuple
+
+import requests
+
+from Scraper.pages.tests.potter_api.api_schema import CompiledSchema
+
+# Bytes read from the socket per step
+CHUNK_SIZE = 64 * 1024
+
+# Consumed text is dropped from the buffer once it grows past this many characters
+COMPACT_THRESHOLD = 256 * 1024
+
+WHITESPACE = " \t\n\r"
+
+# Characters a number cut off at a chunk boundary may continue with
+NUMBER_CHARS = "0123456789+-.eE"
+
+# Values whose first characters raw_decode rejects as "Expecting value"
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+# Length of the longest escape (a \uXXXX\uXXXX surrogate pair)
+MAX_ESCAPE_LENGTH = 12
+
+def _incomplete(error: json.JSONDecodeError, buffer: str) -> bool:
+    """
+    True if a decode error may be the buffer ending mid-element rather than
+    bad JSON: the error is at the end of the buffer, or only the start of a
+    string, escape, number or literal lies between the error and the end.
+    """
+    if error.pos >= len(buffer) or error.msg.startswith("Unterminated string"):
+        return True
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        return len(buffer) - error.pos < MAX_ESCAPE_LENGTH
+    rest = buffer[error.pos:]
+    return all(char in NUMBER_CHARS for char in rest) or any(literal.startswith(rest) for literal in LITERALS)
+
+def _number_may_continue(element: Any, buffer: str, end: int) -> bool:
+    """True if a decoded number runs up to the end of the buffer, e.g. 12 of 12.5."""
+    return (
+        isinstance(element, (int, float)) and not isinstance(element, bool)
+        and all(char in NUMBER_CHARS for char in buffer[end:])
+    )
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Decode the elements of a JSON array from a stream of byte chunks.
+
+    Args:
+        chunks: UTF-8 body chunks, e.g. response.iter_content(CHUNK_SIZE)
+
+    Yields:
+        Each array element, as soon as it is complete
+
+    Raises:
+        ValueError: If the body is not a JSON array
+        json.JSONDecodeError: If an element is malformed (raised as soon as
+            it is read, without reading the rest of the body), the body is
+            truncated, or anything but whitespace follows the closing ']'
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    finished = False
+
+    def read_more() -> bool:
+        """Append the next chunk to the buffer; False once the body is exhausted."""
+        nonlocal buffer, position, finished
+        if finished:
+            return False
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            finished = True
+            buffer += text_decoder.decode(b"", final=True)
+            return False
+        # Drop what was already parsed so memory does not grow with the body
+        if position > COMPACT_THRESHOLD:
+            buffer = buffer[position:]
+            position = 0
+        buffer += text_decoder.decode(chunk)
+        return True
+
+    def skip_whitespace() -> bool:
+        """Move to the next significant character; False at the end of the body."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return True
+            if not read_more():
+                return False
+
+    def check_end():
+        """Only whitespace may follow the closing bracket."""
+        nonlocal position
+        position += 1
+        if skip_whitespace():
+            raise json.JSONDecodeError("Extra data after the array", buffer, position)
+
+    if not skip_whitespace() or buffer[position] != "[":
+        raise ValueError("Expected a JSON array")
+    position += 1
+
+    if not skip_whitespace():
+        raise json.JSONDecodeError("Unterminated array", buffer, position)
+    if buffer[position] == "]":
+        check_end()
+        return
+
+    while True:
+        # Decode one element. Only an error at the end of the buffer, or a
+        # number that reaches it (12 may continue as 12.5), waits for the
+        # next chunk; any other error is raised straight away
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                if _incomplete(error, buffer) and read_more():
+                    continue
+                raise
+            tail = end
+            while tail < len(buffer) and buffer[tail] in WHITESPACE:
+                tail += 1
+            if tail < len(buffer) and not _number_may_continue(element, buffer, end):
+                break
+            if not read_more():
+                break
+        position = end
+        yield element
+
+        if not skip_whitespace():
+            raise json.JSONDecodeError("Unterminated array", buffer, position)
+        if buffer[position] == "]":
+            check_end()
+            return
+        if buffer[position] != ",":
+            raise json.JSONDecodeError("Expected ',' or ']'", buffer, position)
+        position += 1
+        if not skip_whitespace():
+            raise json.JSONDecodeError("Unterminated array", buffer, position)
+
+@dataclass
+class StreamReport:
+    """Outcome of validating a streamed array."""
+
+    items: int = 0                   # Elements parsed and validated
+    stopped_early: bool = False      # Stopped at the first failure before the end
+    failures: List[Tuple[int, List[str]]] = field(default_factory=list)   # (position, messages)
+
+    @property
+    def valid(self) -> bool:
+        return not self.failures
+
+def validate_stream(response: requests.Response, schema: CompiledSchema,
+                    stop_on_first_failure: bool = False,
+                    chunk_size: int = CHUNK_SIZE) -> StreamReport:
+    """
+    Validate every element of a streamed JSON array response as it arrives.
+
+    Args:
+        response: Response of a request made with stream=True
+        schema: Compiled schema, e.g. BookSchema.VALIDATOR
+        stop_on_first_failure: Close the response at the first invalid element
+        chunk_size: Bytes read per step
+
+    Returns:
+        StreamReport with the element count and the failures
+
+    Raises:
+        ValueError: If the body is not a JSON array
+        json.JSONDecodeError: If the body is malformed
+    """
+    report = StreamReport()
+    is_valid = schema.is_valid
+    try:
+        for position, element in enumerate(iter_json_array(response.iter_content(chunk_size))):
+            report.items += 1
+            if is_valid(element):
+                continue
+            report.failures.append((position, schema.error_messages(element)))
+            if stop_on_first_failure:
+                report.stopped_early = True
+                break
+    finally:
+        # Abandons the rest of the download after an early stop
+        response.close()
+    return report
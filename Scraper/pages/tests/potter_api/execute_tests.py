@@ -5,25 +5,38 @@ This module executes all test cases for the Harry Potter Books API
 and generates a test results file.
 """
 
+import argparse
 import unittest
 import sys
 from test_utils import ResultFileWriter
+from Scraper.pages.tests.parallel_runner import add_runner_arguments, run_with_arguments
 from Scraper.pages.tests.potter_api.api_get import TestHarryPotterBooksAPI
 from Scraper.pages.tests.potter_api.api_houses import TestHarryPotterHousesAPI
+from Scraper.pages.tests.potter_api.test_api_stream import TestJsonArrayStream
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the Harry Potter API suites")
+    add_runner_arguments(parser)
+    args = parser.parse_args()
+
     # Create test suite
     suite = unittest.TestSuite()
     
     # Add all test cases
     test_cases = [
         TestHarryPotterBooksAPI,
-        TestHarryPotterHousesAPI
+        TestHarryPotterHousesAPI,
+        TestJsonArrayStream
     ]
     
     for test_case in test_cases:
         suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(test_case))
     
+    # Parallel, sharded or merge run: each worker process gets its own session
+    result = run_with_arguments(args, suite, ResultFileWriter)
+    if result is not None:
+        sys.exit(not result.wasSuccessful())
+    
     # Run tests with output
     # Verbosity levels:
     # 0 = quiet (dots for success)
@@ -0,0 +1,135 @@
+"""
+Test module for the streaming JSON array parser.
+
+This module checks iter_json_array offline, feeding it hand-made byte
+chunks instead of a live response, so every chunk boundary can be tested.
+
+Test Cases:
+    - test_every_chunk_split: Parses the same body split at every byte
+    - test_single_byte_chunks: Parses a body delivered one byte at a time
+    - test_empty_array: Yields nothing for an empty array
+    - test_truncated_body: Raises for a body cut off before the closing ']'
+    - test_malformed_element: Raises at the bad element without reading to the end
+    - test_missing_separator: Raises when elements are not separated by ','
+    - test_trailing_data: Raises for anything but whitespace after ']'
+    - test_not_an_array: Rejects a body that is not a JSON array
+"""
+
+import json
+import unittest
+from typing import Iterator, List
+
+from Scraper.pages.tests.potter_api.api_stream import iter_json_array
+
+# Elements covering every value type and the boundaries a chunk can split:
+# escapes, surrogate pairs, multi-byte UTF-8, exponents and literals
+ELEMENTS = [
+    {
+        "title": "Harry Potter and the \"Philosopher's\" Stone \\ é中\U0001F600\n",
+        "number": 1,
+        "pages": 223,
+        "ratio": -12.5e-3,
+        "cover": None,
+        "released": True,
+        "banned": False,
+        "tags": [1, [2, {}], []],
+        "empty": ""
+    },
+    0,
+    -1,
+    1.0,
+    1e300,
+    "x",
+    [],
+    {},
+    True,
+    None,
+]
+
+class CountingChunks:
+    """Byte chunks that remember how many were read."""
+
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+        self.read = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+class TestJsonArrayStream(unittest.TestCase):
+    """Test suite for iter_json_array."""
+
+    def setUp(self):
+        """Method-level setup - runs before each test method."""
+        self.bodies = [
+            json.dumps(ELEMENTS).encode("utf-8"),
+            json.dumps(ELEMENTS, indent=2, ensure_ascii=False).encode("utf-8"),
+        ]
+
+    def test_every_chunk_split(self):
+        """Test that a body split in two at any byte parses the same."""
+        for body in self.bodies:
+            for split in range(len(body) + 1):
+                with self.subTest(split=split, body=body[:20]):
+                    self.assertEqual(
+                        list(iter_json_array([body[:split], body[split:]])),
+                        ELEMENTS,
+                        f"Split at byte {split} changed the parsed elements"
+                    )
+
+    def test_single_byte_chunks(self):
+        """Test that a body delivered one byte at a time parses the same."""
+        for body in self.bodies:
+            chunks = [body[i:i + 1] for i in range(len(body))]
+            self.assertEqual(list(iter_json_array(chunks)), ELEMENTS)
+
+    def test_empty_array(self):
+        """Test that an empty array yields nothing."""
+        self.assertEqual(list(iter_json_array([b" [ ", b" ] \n"])), [])
+
+    def test_truncated_body(self):
+        """Test that every cut-off body raises instead of ending quietly."""
+        body = self.bodies[0]
+        for length in range(1, len(body)):
+            with self.subTest(length=length):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array([body[:length]]))
+
+    def test_malformed_element(self):
+        """Test that a malformed element raises before the rest of the body is read."""
+        chunks = CountingChunks(
+            [b'[{"number": 1}, {"number": x}'] + [b', {"number": 1}'] * 100 + [b"]"]
+        )
+        parsed = []
+        with self.assertRaises(json.JSONDecodeError):
+            for element in iter_json_array(chunks):
+                parsed.append(element)
+        self.assertEqual(parsed, [{"number": 1}], "Elements before the bad one should be yielded")
+        self.assertEqual(chunks.read, 1, "The parser should not read past the malformed element")
+
+    def test_missing_separator(self):
+        """Test that elements without a ',' between them are rejected straight away."""
+        chunks = CountingChunks([b'[{"number": 1} {"number": 2}'] + [b', 3'] * 100 + [b"]"])
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(chunks))
+        self.assertEqual(chunks.read, 1, "The parser should not read past the missing separator")
+
+    def test_trailing_data(self):
+        """Test that only whitespace may follow the closing bracket."""
+        self.assertEqual(list(iter_json_array([b"[1, 2]", b" \r\n\t"])), [1, 2])
+        for chunks in ([b"[1, 2] x"], [b"[1, 2]", b" ,"], [b"[]", b"[]"]):
+            with self.subTest(chunks=chunks):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array(chunks))
+
+    def test_not_an_array(self):
+        """Test that a body that is not a JSON array is rejected."""
+        for chunks in ([b'{"number": 1}'], [b""], [b"  "]):
+            with self.subTest(chunks=chunks):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array(chunks))
+
+if __name__ == '__main__':
+    unittest.main()